@@ -0,0 +1,22 @@
+-- Indexes for the client and loan application searches.
+--
+-- The ILIKE '%term%' filters on names and cedulas can only use an index
+-- through pg_trgm GIN indexes; lookups of a cedula's applications read
+-- them newest first straight from the composite index.
+--
+-- Run with psql outside a transaction (CREATE INDEX CONCURRENTLY):
+--   psql "$DATABASE_URL" -f backend/migrations/001_search_indexes.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_nombre_completo_trgm_idx
+    ON "Client" USING gin (nombre_completo gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_cedula_trgm_idx
+    ON "Client" USING gin (cedula gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS loan_application_name_trgm_idx
+    ON "LoanApplication" USING gin (name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS loan_application_cedula_created_idx
+    ON "LoanApplication" (cedula, created_at DESC, id DESC);
@@ -0,0 +1,19 @@
+-- Indexes for the hybrid chunk search (SupabaseChunkRepository.search_similar).
+--
+-- The vector side orders by embedding <=> :query (cosine distance) and the
+-- full-text side filters on to_tsvector('spanish', content); both queries
+-- must keep using these exact expressions for the planner to pick the
+-- indexes. HNSW needs pgvector >= 0.5 and a dimensioned column
+-- (embedding vector(1536)).
+--
+-- Run with psql outside a transaction (CREATE INDEX CONCURRENTLY):
+--   psql "$DATABASE_URL" -f backend/migrations/002_chunk_search_indexes.sql
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS chunk_embedding_hnsw_idx
+    ON "Chunk" USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS chunk_content_tsv_idx
+    ON "Chunk" USING gin (to_tsvector('spanish', content));
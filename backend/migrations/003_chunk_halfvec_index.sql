@@ -0,0 +1,14 @@
+-- Half-precision HNSW index for the chunk candidate search.
+--
+-- Same graph as chunk_embedding_hnsw_idx over CAST(embedding AS halfvec(1536)):
+-- half the index size and memory bandwidth. search_similar only orders by
+-- this expression when CHUNK_SEARCH_HALFVEC=true, so build the index first,
+-- then turn the setting on, then run 004 to drop the old index.
+-- Requires pgvector >= 0.7 (halfvec).
+--
+-- Run with psql outside a transaction (CREATE INDEX CONCURRENTLY):
+--   psql "$DATABASE_URL" -f backend/migrations/003_chunk_halfvec_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS chunk_embedding_halfvec_hnsw_idx
+    ON "Chunk" USING hnsw ((CAST(embedding AS halfvec(1536))) halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,9 @@
+-- Drop the full-precision HNSW index replaced by chunk_embedding_halfvec_hnsw_idx.
+--
+-- Only run once 003 has been applied and every instance runs with
+-- CHUNK_SEARCH_HALFVEC=true; before that, the search still orders by
+-- embedding <=> :query and would lose its index.
+--
+--   psql "$DATABASE_URL" -f backend/migrations/004_drop_chunk_vector_index.sql
+
+DROP INDEX CONCURRENTLY IF EXISTS chunk_embedding_hnsw_idx;
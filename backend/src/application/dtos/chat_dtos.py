@@ -1,34 +1,39 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any, Literal
 
 
 class Message(BaseModel):
     """Represents a single message in conversation history"""
+    model_config = ConfigDict(defer_build=True)
+    
     role: Literal["user", "assistant"]
     content: str
 
 
 class ChatRequest(BaseModel):
     """DTO for chat request from frontend"""
+    model_config = ConfigDict(defer_build=True)
+    
     question: str = Field(..., min_length=1, max_length=2000)
-    history: Optional[List[Message]] = []
+    history: Optional[List[Message]] = Field(default_factory=list)
 
 
 class ChunkReferenceDto(BaseModel):
     """DTO for chunk reference in chat response"""
+    model_config = ConfigDict(defer_build=True)
+    
     chunk_id: int
     document_id: int
     content_preview: str
     similarity: float
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ChatResponse(BaseModel):
     """DTO for chat response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     response: str = Field(..., description="Generated response from the chatbot")
-    sources: List[ChunkReferenceDto] = Field(default=[], description="Source references used")
+    sources: List[ChunkReferenceDto] = Field(default_factory=list, description="Source references used")
     processing_time: float = Field(..., description="Time taken to process in seconds")
     query: str = Field(..., description="Original query")
-    
-    class Config:
-        from_attributes = True
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, validator
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 from enum import Enum
 
@@ -18,19 +19,23 @@ class DocumentTypeDto(str, Enum):
 
 class CreateClientDocumentRequest(BaseModel):
     """DTO for creating client document"""
+    model_config = ConfigDict(defer_build=True)
+    
     file_name: str = Field(..., min_length=1, description="Document file name")
     storage_path: str = Field(..., min_length=1, description="Storage path for the document")
     document_type: DocumentTypeDto = Field(..., description="Type of document")
     client_id: int = Field(..., gt=0, description="Client ID")
     credit_id: Optional[int] = Field(None, gt=0, description="Credit ID (optional)")
     
-    @validator('file_name')
+    @field_validator('file_name')
+    @classmethod
     def validate_file_name(cls, v):
         if not v or not v.strip():
             raise ValueError('El nombre del archivo es requerido')
         return v.strip()
     
-    @validator('storage_path')
+    @field_validator('storage_path')
+    @classmethod
     def validate_storage_path(cls, v):
         if not v or not v.strip():
             raise ValueError('La ruta de almacenamiento es requerida')
@@ -39,18 +44,22 @@ class CreateClientDocumentRequest(BaseModel):
 
 class UpdateClientDocumentRequest(BaseModel):
     """DTO for updating client document (partial updates allowed)"""
+    model_config = ConfigDict(defer_build=True)
+    
     file_name: Optional[str] = Field(None, min_length=1, description="Document file name")
     storage_path: Optional[str] = Field(None, min_length=1, description="Storage path for the document")
     document_type: Optional[DocumentTypeDto] = Field(None, description="Type of document")
     credit_id: Optional[int] = Field(None, gt=0, description="Credit ID (optional)")
     
-    @validator('file_name')
+    @field_validator('file_name')
+    @classmethod
     def validate_file_name(cls, v):
         if v is not None and (not v or not v.strip()):
             raise ValueError('El nombre del archivo no puede estar vacío')
         return v.strip() if v else v
     
-    @validator('storage_path')
+    @field_validator('storage_path')
+    @classmethod
     def validate_storage_path(cls, v):
         if v is not None and (not v or not v.strip()):
             raise ValueError('La ruta de almacenamiento no puede estar vacía')
@@ -59,14 +68,13 @@ class UpdateClientDocumentRequest(BaseModel):
 
 class ClientDocumentResponse(BaseModel):
     """DTO for client document response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     id: int
     file_name: str
     storage_path: str
     document_type: DocumentTypeDto
     client_id: int
     credit_id: Optional[int]
-    created_at: str
-    file_url: str
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    created_at: datetime
+    file_url: str
\ No newline at end of file
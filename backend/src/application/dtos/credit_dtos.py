@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 from enum import Enum
+from src.application.dtos.field_types import Monto
 
 
 class EstadoCreditoDto(str, Enum):
@@ -18,40 +19,30 @@ class EstadoCreditoDto(str, Enum):
 
 class CreateCreditForClientRequest(BaseModel):
     """DTO for creating a credit for a specific client (without client_id in body)"""
-    monto_aprobado: Decimal = Field(..., gt=0)
+    model_config = ConfigDict(defer_build=True)
+    
+    monto_aprobado: Monto
     plazo_meses: int = Field(..., gt=0, le=120)  # Máximo 10 años
     tasa_interes: Decimal = Field(..., gt=0, le=100)  # Porcentaje
     fecha_desembolso: Optional[date] = None
-    
-    @validator('monto_aprobado')
-    def validate_monto(cls, v):
-        if v < Decimal('100000'):  # Mínimo 100,000
-            raise ValueError('El monto mínimo es 100,000')
-        if v > Decimal('100000000'):  # Máximo 100 millones
-            raise ValueError('El monto máximo es 100,000,000')
-        return v
 
 
 class CreateCreditRequest(BaseModel):
     """DTO for creating a new credit"""
+    model_config = ConfigDict(defer_build=True)
+    
     client_id: int = Field(..., gt=0)
-    monto_aprobado: Decimal = Field(..., gt=0)
+    monto_aprobado: Monto
     plazo_meses: int = Field(..., gt=0, le=120)  # Máximo 10 años
     tasa_interes: Decimal = Field(..., gt=0, le=100)  # Porcentaje
     fecha_desembolso: Optional[date] = None
-    
-    @validator('monto_aprobado')
-    def validate_monto(cls, v):
-        if v < Decimal('100000'):  # Mínimo 100,000
-            raise ValueError('El monto mínimo es 100,000')
-        if v > Decimal('100000000'):  # Máximo 100 millones
-            raise ValueError('El monto máximo es 100,000,000')
-        return v
 
 
 class UpdateCreditRequest(BaseModel):
     """DTO for updating credit information"""
-    monto_aprobado: Optional[Decimal] = Field(None, gt=0)
+    model_config = ConfigDict(defer_build=True)
+    
+    monto_aprobado: Optional[Monto] = None
     plazo_meses: Optional[int] = Field(None, gt=0, le=120)
     tasa_interes: Optional[Decimal] = Field(None, gt=0, le=100)
     estado: Optional[EstadoCreditoDto] = None
@@ -60,6 +51,8 @@ class UpdateCreditRequest(BaseModel):
 
 class CreditResponse(BaseModel):
     """DTO for credit response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     id: int
     client_id: int
     monto_aprobado: Decimal
@@ -68,13 +61,12 @@ class CreditResponse(BaseModel):
     estado: EstadoCreditoDto
     fecha_desembolso: Optional[date]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class CreditListResponse(BaseModel):
     """DTO for paginated credit list"""
+    model_config = ConfigDict(defer_build=True)
+    
     credits: list[CreditResponse]
     total: int
     page: int
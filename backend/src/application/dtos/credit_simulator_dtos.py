@@ -1,103 +1,89 @@
-from pydantic import BaseModel, Field, validator
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
+from typing import List, Literal
+
+# Plazos permitidos; pydantic-core valida el Literal sin llamar a Python
+Plazo = Literal[6, 12, 18, 24, 36, 48, 60, 72]
+
+
+def _normalize_plazos(plazos: List[int]) -> List[int]:
+    """Check the 1-120 month range and return the terms deduplicated and sorted"""
+    if not plazos:
+        raise ValueError('Debe especificar al menos un plazo')
+    # One set build; min/max and sorted run in C instead of Python-level loops
+    unique = set(plazos)
+    if min(unique) <= 0 or max(unique) > 120:
+        raise ValueError('Plazos deben estar entre 1 y 120 meses')
+    return sorted(unique)
 
 
 class SimulateCreditRequest(BaseModel):
     """DTO for credit simulation request"""
-    monto: float = Field(..., gt=0, description="Loan amount")
-    plazo_meses: int = Field(..., gt=0, le=120, description="Term in months")
-    
-    @validator('monto')
-    def validate_monto(cls, v):
-        if v < 100000:  # Mínimo 100,000
-            raise ValueError('El monto mínimo es 100,000')
-        if v > 100000000:  # Máximo 100 millones
-            raise ValueError('El monto máximo es 100,000,000')
-        return v
+    model_config = ConfigDict(defer_build=True)
     
-    @validator('plazo_meses')
-    def validate_plazo(cls, v):
-        valid_terms = [6, 12, 18, 24, 36, 48, 60, 72]
-        if v not in valid_terms:
-            raise ValueError(f'Plazo debe ser uno de: {valid_terms}')
-        return v
+    monto: float = Field(..., ge=100000, le=100000000, description="Loan amount (100,000 - 100,000,000)")
+    plazo_meses: Plazo = Field(..., description="Term in months")
 
 
 class SimulateCreditResponse(BaseModel):
     """DTO for credit simulation response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     monto_solicitado: float
     plazo_meses: int
     tasa_interes_mensual: float
     cuota_mensual: float
     total_a_pagar: float
     total_intereses: float
-    
-    class Config:
-        from_attributes = True
 
 
 class CreateSimulatorConfigRequest(BaseModel):
     """DTO for creating/updating simulator configuration"""
+    model_config = ConfigDict(defer_build=True)
+    
     tasa_interes_mensual: float = Field(..., gt=0, le=0.2, description="Monthly interest rate (0.001 - 0.2)")
     monto_minimo: float = Field(..., gt=0, description="Minimum loan amount")
     monto_maximo: float = Field(..., gt=0, description="Maximum loan amount")
     plazos_disponibles: List[int] = Field(..., description="Available terms in months")
     is_active: bool = Field(False, description="Whether this configuration should be active")
     
-    @validator('tasa_interes_mensual')
-    def validate_tasa(cls, v):
-        if v <= 0 or v > 0.2:  # Máximo 20% mensual
-            raise ValueError('Tasa debe estar entre 0.1% y 20% mensual')
-        return v
-    
-    @validator('monto_maximo')
-    def validate_montos(cls, v, values):
-        if 'monto_minimo' in values and v <= values['monto_minimo']:
+    @field_validator('monto_maximo')
+    @classmethod
+    def validate_montos(cls, v, info: ValidationInfo):
+        if 'monto_minimo' in info.data and v <= info.data['monto_minimo']:
             raise ValueError('Monto máximo debe ser mayor al monto mínimo')
         return v
     
-    @validator('plazos_disponibles')
+    @field_validator('plazos_disponibles')
+    @classmethod
     def validate_plazos(cls, v):
-        if not v or len(v) == 0:
-            raise ValueError('Debe especificar al menos un plazo')
-        if any(plazo <= 0 or plazo > 120 for plazo in v):
-            raise ValueError('Plazos deben estar entre 1 y 120 meses')
-        return sorted(list(set(v)))  # Remove duplicates and sort
+        return _normalize_plazos(v)
 
 
 class UpdateSimulatorConfigRequest(BaseModel):
     """DTO for updating simulator configuration (partial updates allowed)"""
+    model_config = ConfigDict(defer_build=True)
+    
     tasa_interes_mensual: float = Field(None, gt=0, le=0.2, description="Monthly interest rate (0.001 - 0.2)")
     monto_minimo: float = Field(None, gt=0, description="Minimum loan amount")
     monto_maximo: float = Field(None, gt=0, description="Maximum loan amount")
     plazos_disponibles: List[int] = Field(None, description="Available terms in months")
     # is_active removed - use POST /config/{id}/activate to change active status
     
-    @validator('tasa_interes_mensual')
-    def validate_tasa(cls, v):
-        if v is not None and (v <= 0 or v > 0.2):  # Máximo 20% mensual
-            raise ValueError('Tasa debe estar entre 0.1% y 20% mensual')
-        return v
-    
-    @validator('plazos_disponibles')
+    @field_validator('plazos_disponibles')
+    @classmethod
     def validate_plazos(cls, v):
         if v is not None:
-            if len(v) == 0:
-                raise ValueError('Debe especificar al menos un plazo')
-            if any(plazo <= 0 or plazo > 120 for plazo in v):
-                raise ValueError('Plazos deben estar entre 1 y 120 meses')
-            return sorted(list(set(v)))  # Remove duplicates and sort
+            return _normalize_plazos(v)
         return v
 
 
 class SimulatorConfigResponse(BaseModel):
     """DTO for simulator configuration response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     id: int
     tasa_interes_mensual: float
     monto_minimo: float
     monto_maximo: float
     plazos_disponibles: List[int]
-    is_active: bool
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    is_active: bool
\ No newline at end of file
@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from typing import Annotated
+from pydantic import Field, StringConstraints
+
+# Shared constrained field types: each constraint set is declared once and
+# reused by every DTO field that needs it. Checks run inside pydantic-core.
+
+# Spaces, dashes and parentheses allowed anywhere between the characters
+_SEP = r'[\s\-()]*'
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+# Colombian mobile: +573001234567, 573001234567 or 3001234567
+PHONE_PATTERN = rf'^(?:(?:{_SEP}\+)?{_SEP}5{_SEP}7)?{_SEP}3(?:{_SEP}[0-9]){{9}}{_SEP}$'
+# Digit counts with any separators in between
+CLIENT_CEDULA_PATTERN = r'^\D*(?:\d\D*){7,10}$'
+LOAN_CEDULA_PATTERN = r'^\D*(?:\d\D*){8,11}$'
+
+Email = Annotated[str, StringConstraints(min_length=5, max_length=255, pattern=EMAIL_PATTERN)]
+ColombianPhone = Annotated[str, StringConstraints(min_length=7, max_length=20, pattern=PHONE_PATTERN)]
+ClientCedula = Annotated[str, StringConstraints(min_length=8, max_length=20, pattern=CLIENT_CEDULA_PATTERN)]
+LoanCedula = Annotated[str, StringConstraints(min_length=8, max_length=20, pattern=LOAN_CEDULA_PATTERN)]
+
+# Credit amounts: between 100,000 and 100 millones
+Monto = Annotated[Decimal, Field(ge=Decimal('100000'), le=Decimal('100000000'))]
+
+
+def latest_birth_date(min_age: int) -> date:
+    """Latest birth date of someone who is at least min_age years old today"""
+    return _latest_birth_date(date.today(), min_age)
+
+
+@lru_cache(maxsize=16)
+def _latest_birth_date(today: date, min_age: int) -> date:
+    # One cutoff per day, so age checks reduce to a single date compare
+    year = today.year - min_age
+    try:
+        return today.replace(year=year)
+    except ValueError:
+        # 29 de febrero y el año de corte no es bisiesto
+        return date(year, 2, 28)
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 
@@ -13,19 +14,20 @@ class ProcessingStatusDto(str, Enum):
 
 class ContextDocumentResponse(BaseModel):
     """DTO for context document response"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+    
     id: int
     filename: str
     storage_url: str
     processing_status: ProcessingStatusDto
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
     chunks_count: int = 0
-    
-    class Config:
-        from_attributes = True
 
 
 class DocumentUploadResponse(BaseModel):
     """DTO for document upload response"""
+    model_config = ConfigDict(defer_build=True)
+    
     status: str
     message: str
     document_id: int
@@ -35,11 +37,15 @@ class DocumentUploadResponse(BaseModel):
 
 class DocumentListResponse(BaseModel):
     """DTO for list of documents response"""
+    model_config = ConfigDict(defer_build=True)
+    
     documents: list[ContextDocumentResponse]
     total: int
 
 
 class DocumentDeleteResponse(BaseModel):
     """DTO for document deletion response"""
+    model_config = ConfigDict(defer_build=True)
+    
     status: str
     message: str
@@ -0,0 +1,12 @@
+class LoanApplicationError(Exception):
+    """
+    Expected loan application error (not found, invalid data).
+    
+    Carries the HTTP status and detail; a single app-level exception
+    handler turns it into the JSON response.
+    """
+    
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
@@ -1,5 +1,8 @@
-from typing import List, Optional
-from dataclasses import dataclass
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
+from operator import mul
+import math
 import time
 
 from src.domain.ports.chunk_repository import ChunkRepositoryPort
@@ -7,6 +10,23 @@ from src.domain.ports.embedding_port import EmbeddingPort
 from src.domain.ports.llm_port import LLMPort
 
 
+# In-process LRU of question embeddings: repeated questions skip the remote
+# call. The TTL bounds how long embeddings from an old model are reused.
+QUERY_EMBEDDING_TTL_SECONDS = 3600.0
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 1024
+_query_embedding_cache: Dict[str, Tuple[List[float], float]] = {}
+
+
+def clear_query_embedding_cache() -> None:
+    """Drop every cached query embedding of this process"""
+    _query_embedding_cache.clear()
+
+
+def _query_cache_key(query: str) -> str:
+    """Case- and whitespace-insensitive key so trivial variants share an embedding"""
+    return " ".join(query.lower().split())
+
+
 @dataclass
 class ChunkReference:
     """Reference to a source chunk used in response generation"""
@@ -26,6 +46,143 @@ class ChatResponse:
     query: str
 
 
+@dataclass
+class RetrievalResult:
+    """Chunks retrieved for a query, before calling the LLM"""
+    query: str
+    chunks: List[dict]
+    start_time: float
+    response: Optional[ChatResponse] = None  # Set when no LLM call is needed
+    query_vector: Optional[List[float]] = None  # Unit embedding, set when the answer may be cached
+
+
+# Semantic answer cache: a question nearly identical (cosine >= threshold) to
+# one already answered reuses that answer without search or LLM. Only for
+# questions without history, since the answer depends on the conversation.
+SEMANTIC_CACHE_MIN_SIMILARITY = 0.95
+SEMANTIC_CACHE_TTL_SECONDS = 600.0
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+_semantic_response_cache: Dict[str, Tuple[List[float], ChatResponse, float]] = {}
+
+
+def clear_semantic_response_cache() -> None:
+    """Drop every cached answer and knowledge base check of this process (e.g. after the documents change)"""
+    _semantic_response_cache.clear()
+    _knowledge_base_state.clear()
+
+
+# With an empty knowledge base (cold start) the embeddings API isn't called.
+# The has_chunks() result is reused for the TTL and dropped together with the
+# answer cache when the documents change.
+KNOWLEDGE_BASE_CHECK_TTL_SECONDS = 60.0
+_knowledge_base_state: Dict[str, Tuple[bool, float]] = {}
+
+
+def _unit_vector(embedding: List[float]) -> Optional[List[float]]:
+    """Scale the embedding to length 1 so cosine similarity is a plain dot product"""
+    norm = math.hypot(*embedding)
+    if not norm:
+        return None
+    return [x / norm for x in embedding]
+
+
+def _exact_cached_response(query: str) -> Optional[ChatResponse]:
+    """Return the cached answer of the same (normalized) question, if any"""
+    key = _query_cache_key(query)
+    entry = _semantic_response_cache.pop(key, None)
+    if entry is None or entry[2] <= time.monotonic():
+        return None
+    # Re-insert so the entry moves to the most recently used end
+    _semantic_response_cache[key] = entry
+    return entry[1]
+
+
+def _most_similar_key(query_vector: List[float], candidates: List[Tuple[str, List[float]]]) -> Optional[str]:
+    """Key of the candidate closest to query_vector, if at least SEMANTIC_CACHE_MIN_SIMILARITY"""
+    best_key, best_similarity = None, SEMANTIC_CACHE_MIN_SIMILARITY
+    for key, cached_vector in candidates:
+        similarity = sum(map(mul, query_vector, cached_vector))
+        if similarity >= best_similarity:
+            best_key, best_similarity = key, similarity
+    return best_key
+
+
+async def _find_cached_response(query_vector: List[float]) -> Optional[ChatResponse]:
+    """Return the cached answer of the most similar previous question, if close enough"""
+    now = time.monotonic()
+    candidates = []
+    for key, (cached_vector, _, expires_at) in list(_semantic_response_cache.items()):
+        if expires_at <= now:
+            del _semantic_response_cache[key]
+        else:
+            candidates.append((key, cached_vector))
+    if not candidates:
+        return None
+    
+    # A full cache is ~400k multiply-adds in Python; keep them off the event
+    # loop. The scan works on a snapshot, the cache is only touched here
+    best_key = await asyncio.to_thread(_most_similar_key, query_vector, candidates)
+    
+    entry = _semantic_response_cache.pop(best_key, None) if best_key is not None else None
+    if entry is None:
+        return None  # No match, or evicted while scanning
+    # Re-insert so the entry moves to the most recently used end
+    _semantic_response_cache[best_key] = entry
+    return entry[1]
+
+
+def _remember_response(query: str, query_vector: List[float], response: ChatResponse) -> None:
+    """Cache an LLM answer for later near-identical questions"""
+    key = _query_cache_key(query)
+    _semantic_response_cache.pop(key, None)
+    if len(_semantic_response_cache) >= SEMANTIC_CACHE_MAX_ENTRIES:
+        # Drop the least recently used entry (dicts keep insertion order)
+        _semantic_response_cache.pop(next(iter(_semantic_response_cache)), None)
+    _semantic_response_cache[key] = (query_vector, response, time.monotonic() + SEMANTIC_CACHE_TTL_SECONDS)
+
+
+CONTENT_PREVIEW_CHARS = 200
+# Cap on the context sent to the LLM (~1,500 tokens). The defaults (5 chunks
+# of ~1,000 characters) fit untouched; it stops a high max_chunks from
+# blowing up the input tokens.
+CONTEXT_MAX_CHARS = 6000
+
+
+def _dedupe_chunks(chunks: List[dict]) -> List[dict]:
+    """
+    Keep the first (most similar) of chunks with the same content.
+    
+    The same text indexed twice is sent to the LLM once. The whole
+    whitespace-normalized content is compared, so chunks that only share a
+    running header or boilerplate opening are all kept.
+    """
+    seen = set()
+    unique = []
+    for chunk in chunks:
+        key = " ".join(chunk.get("content", "").split())
+        if key not in seen:
+            seen.add(key)
+            unique.append(chunk)
+    return unique
+
+
+def _fit_context_budget(chunks: List[dict]) -> List[dict]:
+    """Keep the most relevant chunks whose content fits in CONTEXT_MAX_CHARS (always at least one)"""
+    used = 0
+    for count, chunk in enumerate(chunks):
+        used += len(chunk.get("content", ""))
+        if used > CONTEXT_MAX_CHARS and count > 0:
+            return chunks[:count]
+    return chunks
+
+
+def _content_preview(content: str) -> str:
+    """Shorten chunk content for the source list"""
+    if len(content) > CONTENT_PREVIEW_CHARS:
+        return f"{content[:CONTENT_PREVIEW_CHARS]}..."
+    return content
+
+
 class ChatService:
     """
     Service for processing chat queries using RAG.
@@ -63,57 +220,127 @@ class ChatService:
         Returns:
             ChatResponse with answer and source references
         """
+        retrieval = await self.retrieve_context(query, history)
+        return await self.generate_answer(retrieval, history)
+    
+    async def retrieve_context(self, query: str, history: list = None) -> RetrievalResult:
+        """
+        Embed the query and fetch the most similar chunks.
+        
+        This is the only step that touches the database, so callers can
+        release their session once it returns.
+        
+        Args:
+            query: User's question
+            history: Conversation history; answers are only cached without it
+            
+        Returns:
+            RetrievalResult with the chunks found, or with a final response
+            when the query can be answered without the LLM
+        """
         start_time = time.time()
-        history = history or []
         
         if not query or not query.strip():
-            return ChatResponse(
-                response="Por favor, escribe una pregunta.",
-                sources=[],
-                processing_time=0,
-                query=query
+            return RetrievalResult(
+                query=query,
+                chunks=[],
+                start_time=start_time,
+                response=ChatResponse(
+                    response="Por favor, escribe una pregunta.",
+                    sources=[],
+                    processing_time=0,
+                    query=query
+                )
             )
         
         query = query.strip()
         
+        # The same question answered before needs no embedding at all
+        if not history:
+            cached = _exact_cached_response(query)
+            if cached is not None:
+                return self._cached_result(query, start_time, cached)
+        
+        # Nothing to search yet: skip the embedding and the search
+        try:
+            has_chunks = await self._knowledge_base_has_chunks()
+        except Exception as e:
+            print(f"[RAG] Error checking knowledge base: {str(e)}", flush=True)
+            has_chunks = True  # Fall back to the normal search path
+        if not has_chunks:
+            return self._early_response(
+                query,
+                start_time,
+                "Aún no hay documentos disponibles para responder preguntas. Por favor intenta más tarde."
+            )
+        
         # Generate embedding for query
         try:
-            query_embedding = await self._embedding_port.generate_embedding(query)
+            query_embedding = await self._embed_query(query)
         except Exception as e:
-            return ChatResponse(
-                response="Lo siento, hubo un error procesando tu pregunta. Por favor intenta de nuevo.",
-                sources=[],
-                processing_time=time.time() - start_time,
-                query=query
+            return self._early_response(
+                query,
+                start_time,
+                "Lo siento, hubo un error procesando tu pregunta. Por favor intenta de nuevo."
             )
         
+        # A near-identical question answered before skips search and LLM
+        query_vector = None if history else _unit_vector(query_embedding)
+        if query_vector is not None:
+            cached = await _find_cached_response(query_vector)
+            if cached is not None:
+                return self._cached_result(query, start_time, cached)
+        
         # Search for similar chunks
         try:
             similar_chunks = await self._chunk_repository.search_similar(
                 query_embedding=query_embedding,
                 match_threshold=self._match_threshold,
-                match_count=self._max_chunks
+                match_count=self._max_chunks,
+                query_text=query
             )
         except Exception as e:
             print(f"[RAG] Error searching chunks: {str(e)}", flush=True)
-            return ChatResponse(
-                response="Lo siento, hubo un error buscando información. Por favor intenta de nuevo.",
-                sources=[],
-                processing_time=time.time() - start_time,
-                query=query
+            return self._early_response(
+                query,
+                start_time,
+                "Lo siento, hubo un error buscando información. Por favor intenta de nuevo."
             )
         
         # If no relevant chunks found
         if not similar_chunks:
-            return ChatResponse(
-                response="No encontré información relevante en los documentos disponibles para responder tu pregunta. ¿Podrías reformularla o preguntar sobre otro tema?",
-                sources=[],
-                processing_time=time.time() - start_time,
-                query=query
+            return self._early_response(
+                query,
+                start_time,
+                "No encontré información relevante en los documentos disponibles para responder tu pregunta. ¿Podrías reformularla o preguntar sobre otro tema?"
             )
         
+        return RetrievalResult(
+            query=query,
+            chunks=_fit_context_budget(_dedupe_chunks(similar_chunks)),
+            start_time=start_time,
+            query_vector=query_vector
+        )
+    
+    async def generate_answer(self, retrieval: RetrievalResult, history: list = None) -> ChatResponse:
+        """
+        Generate the final response from retrieved chunks (no database access).
+        
+        Args:
+            retrieval: Result of retrieve_context
+            history: Conversation history (list of {"role": str, "content": str})
+            
+        Returns:
+            ChatResponse with answer and source references
+        """
+        if retrieval.response is not None:
+            return retrieval.response
+        
+        history = history or []
+        query = retrieval.query
+        
         # Build context from chunks
-        context = self._build_context(similar_chunks)
+        context = self._build_context(retrieval.chunks)
         
         # Generate response using LLM with history
         try:
@@ -122,49 +349,147 @@ class ChatService:
             return ChatResponse(
                 response="Lo siento, hubo un error generando la respuesta. Por favor intenta de nuevo.",
                 sources=[],
-                processing_time=time.time() - start_time,
+                processing_time=time.time() - retrieval.start_time,
                 query=query
             )
         
         # Build source references
-        sources = self._build_sources(similar_chunks)
+        sources = self._build_sources(retrieval.chunks)
         
-        processing_time = time.time() - start_time
+        processing_time = time.time() - retrieval.start_time
         
-        return ChatResponse(
+        response = ChatResponse(
             response=response_text,
             sources=sources,
             processing_time=processing_time,
             query=query
         )
+        if retrieval.query_vector is not None and not history:
+            _remember_response(query, retrieval.query_vector, response)
+        
+        return response
     
-    def _build_context(self, chunks: List[dict]) -> str:
-        """Build context string from retrieved chunks"""
-        context_parts = []
+    async def _knowledge_base_has_chunks(self) -> bool:
+        """Return whether any chunk exists, checking the database at most once per TTL"""
+        cached = _knowledge_base_state.get("has_chunks")
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
         
-        for i, chunk in enumerate(chunks, start=1):
-            content = chunk.get("content", "")
-            metadata = chunk.get("metadata", {})
-            source_file = metadata.get("source_file", "Documento")
-            
-            context_parts.append(f"[Fuente {i}: {source_file}]\n{content}")
+        has_chunks = await self._chunk_repository.has_chunks()
+        _knowledge_base_state["has_chunks"] = (has_chunks, time.monotonic() + KNOWLEDGE_BASE_CHECK_TTL_SECONDS)
+        return has_chunks
+    
+    async def _embed_query(self, query: str) -> List[float]:
+        """Return the query embedding, reusing a cached one when available"""
+        key = _query_cache_key(query)
+        cached = _query_embedding_cache.pop(key, None)
+        if cached is not None and cached[1] > time.monotonic():
+            # Re-insert so the entry moves to the most recently used end
+            _query_embedding_cache[key] = cached
+            return cached[0]
+        
+        embedding = await self._embedding_port.generate_embedding(query)
+        
+        if len(_query_embedding_cache) >= QUERY_EMBEDDING_CACHE_MAX_ENTRIES:
+            # Drop the least recently used entry (dicts keep insertion order)
+            _query_embedding_cache.pop(next(iter(_query_embedding_cache)), None)
+        _query_embedding_cache[key] = (embedding, time.monotonic() + QUERY_EMBEDDING_TTL_SECONDS)
+        
+        return embedding
+    
+    async def stream_answer(
+        self,
+        retrieval: RetrievalResult,
+        history: list = None
+    ) -> AsyncIterator[Union[List[ChunkReference], str, ChatResponse]]:
+        """
+        Stream the final response from retrieved chunks (no database access).
+        
+        Yields, in order: the source references (known before the LLM runs),
+        the answer text as it is generated, and finally the complete
+        ChatResponse. If generation fails midway, the final ChatResponse
+        carries the error message instead of the partial text.
+        
+        Args:
+            retrieval: Result of retrieve_context
+            history: Conversation history (list of {"role": str, "content": str})
+        """
+        if retrieval.response is not None:
+            yield retrieval.response.sources
+            yield retrieval.response.response
+            yield retrieval.response
+            return
+        
+        history = history or []
+        query = retrieval.query
+        context = self._build_context(retrieval.chunks)
+        sources = self._build_sources(retrieval.chunks)
+        yield sources
+        
+        parts = []
+        try:
+            async for delta in self._llm_port.stream_response_with_history(query, context, history):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            yield ChatResponse(
+                response="Lo siento, hubo un error generando la respuesta. Por favor intenta de nuevo.",
+                sources=[],
+                processing_time=time.time() - retrieval.start_time,
+                query=query
+            )
+            return
+        
+        response = ChatResponse(
+            response="".join(parts),
+            sources=sources,
+            processing_time=time.time() - retrieval.start_time,
+            query=query
+        )
+        if retrieval.query_vector is not None and not history:
+            _remember_response(query, retrieval.query_vector, response)
         
-        return "\n\n---\n\n".join(context_parts)
+        yield response
+    
+    def _cached_result(self, query: str, start_time: float, cached: ChatResponse) -> RetrievalResult:
+        """Build a retrieval result that reuses a cached answer for this query"""
+        return RetrievalResult(
+            query=query,
+            chunks=[],
+            start_time=start_time,
+            response=replace(cached, query=query, processing_time=time.time() - start_time)
+        )
+    
+    def _early_response(self, query: str, start_time: float, message: str) -> RetrievalResult:
+        """Build a retrieval result that already carries the final response"""
+        return RetrievalResult(
+            query=query,
+            chunks=[],
+            start_time=start_time,
+            response=ChatResponse(
+                response=message,
+                sources=[],
+                processing_time=time.time() - start_time,
+                query=query
+            )
+        )
+    
+    def _build_context(self, chunks: List[dict]) -> str:
+        """Build context string from retrieved chunks"""
+        return "\n\n---\n\n".join(
+            f"[Fuente {i}: {chunk.get('metadata', {}).get('source_file', 'Documento')}]\n{chunk.get('content', '')}"
+            for i, chunk in enumerate(chunks, start=1)
+        )
     
     def _build_sources(self, chunks: List[dict]) -> List[ChunkReference]:
         """Build source references from chunks"""
-        sources = []
-        
-        for chunk in chunks:
-            content = chunk.get("content", "")
-            preview = content[:200] + "..." if len(content) > 200 else content
-            
-            sources.append(ChunkReference(
+        return [
+            ChunkReference(
                 chunk_id=chunk.get("id", 0),
                 document_id=chunk.get("document_id", 0),
-                content_preview=preview,
+                content_preview=_content_preview(chunk.get("content", "")),
                 similarity=chunk.get("similarity", 0),
                 metadata=chunk.get("metadata", {})
-            ))
-        
-        return sources
+            )
+            for chunk in chunks
+        ]
@@ -1,4 +1,6 @@
-from typing import List, Optional
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
 from fastapi import UploadFile
 from src.domain.entities.client_document import ClientDocument, DocumentType
 from src.domain.ports.client_document_repository import ClientDocumentRepositoryPort
@@ -6,8 +8,47 @@ from src.domain.ports.storage_port import StoragePort
 from src.application.dtos.client_document_dtos import (
     CreateClientDocumentRequest,
     UpdateClientDocumentRequest,
-    ClientDocumentResponse
+    ClientDocumentResponse,
+    DocumentTypeDto
 )
+from src.application.services.storage_cleanup import delete_file_in_background
+from src.application.services.upload_streaming import UPLOAD_CHUNK_SIZE, read_upload_chunks
+
+# Signed download URLs are reused until they have less than this margin left
+DOWNLOAD_URL_TTL_MARGIN_SECONDS = 300
+DOWNLOAD_URL_CACHE_MAX_ENTRIES = 1024
+_download_url_cache: Dict[Tuple[int, int], Tuple[str, float]] = {}
+
+# Enum values listed in the invalid document_type error, built once at import
+_DOCUMENT_TYPE_VALUES: List[str] = [dt.value for dt in DocumentType]
+_DTO_DOCUMENT_TYPES: Dict[DocumentType, DocumentTypeDto] = {
+    DocumentType(dto_type.value): dto_type for dto_type in DocumentTypeDto
+}
+
+
+def _document_response(doc: ClientDocument, file_url: str) -> ClientDocumentResponse:
+    """Build the response DTO of a stored document without re-validating it"""
+    return ClientDocumentResponse.model_construct(
+        id=doc.id,
+        file_name=doc.file_name,
+        storage_path=doc.storage_path,
+        document_type=_DTO_DOCUMENT_TYPES[doc.document_type],
+        client_id=doc.client_id,
+        credit_id=doc.credit_id,
+        created_at=doc.created_at,
+        file_url=file_url
+    )
+
+
+def _forget_download_urls(document_id: int) -> None:
+    """Drop cached signed URLs of a deleted document"""
+    for key in [key for key in _download_url_cache if key[0] == document_id]:
+        _download_url_cache.pop(key, None)
+
+
+def clear_download_url_cache() -> None:
+    """Drop every cached signed URL of this process"""
+    _download_url_cache.clear()
 
 
 class ClientDocumentService:
@@ -45,8 +86,7 @@ class ClientDocumentService:
             try:
                 doc_type = DocumentType(document_type)
             except ValueError:
-                valid_types = [dt.value for dt in DocumentType]
-                raise ValueError(f"Invalid document_type. Must be one of: {valid_types}")
+                raise ValueError(f"Invalid document_type. Must be one of: {_DOCUMENT_TYPE_VALUES}")
             
             # Validate file
             if not file.filename:
@@ -60,19 +100,7 @@ class ClientDocumentService:
             # Build storage path
             storage_path = self._storage_service.build_storage_path(client_id, unique_filename)
             
-            # Read file content
-            file_content = await file.read()
-            
-            if not file_content:
-                raise ValueError("File is empty")
-            
-            # Upload to Supabase Storage
-            try:
-                await self._storage_service.upload_file(file_content, storage_path)
-            except Exception as e:
-                raise Exception(f"Error al subir el archivo a Supabase Storage: {str(e)}")
-            
-            # Create document entity
+            # Create and validate the document entity before touching storage
             document = ClientDocument(
                 file_name=file.filename,
                 storage_path=storage_path,
@@ -81,19 +109,37 @@ class ClientDocumentService:
                 credit_id=credit_id
             )
             
-            # Validate document
             if not document.validate():
-                # If database insertion fails, try to clean up uploaded file
-                await self._storage_service.delete_file(storage_path)
                 raise ValueError("Invalid document data")
             
-            # Save to database
-            try:
-                created_document = await self._document_repository.create(document)
-            except Exception as e:
+            # Read only the first chunk to reject empty files
+            first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            
+            if not first_chunk:
+                raise ValueError("File is empty")
+            
+            # Stream to Supabase Storage while the row is inserted (independent IO)
+            upload_result, create_result = await asyncio.gather(
+                self._storage_service.upload_stream(
+                    read_upload_chunks(file, first_chunk),
+                    storage_path,
+                    content_type=file.content_type or "application/octet-stream",
+                    content_length=file.size
+                ),
+                self._document_repository.create(document),
+                return_exceptions=True
+            )
+            
+            # The row is only flushed, so raising rolls it back with the request session
+            if isinstance(upload_result, BaseException):
+                raise Exception(f"Error al subir el archivo a Supabase Storage: {str(upload_result)}")
+            
+            if isinstance(create_result, BaseException):
                 # If database insertion fails, try to clean up uploaded file
                 await self._storage_service.delete_file(storage_path)
-                raise Exception(f"Error saving document to database: {str(e)}")
+                raise Exception(f"Error saving document to database: {str(create_result)}")
+            
+            created_document = create_result
             
             # Generate URL for the uploaded file
             try:
@@ -120,27 +166,10 @@ class ClientDocumentService:
         try:
             documents = await self._document_repository.get_by_client_id(client_id)
             
-            result = []
-            for doc in documents:
-                # Generate URL for each document
-                try:
-                    file_url = self._storage_service.get_public_url(doc.storage_path)
-                except Exception:
-                    # If public URL fails, create signed URL as fallback
-                    file_url = self._storage_service.create_signed_url(doc.storage_path, expires_in=86400)  # 24 hours
-                
-                result.append(ClientDocumentResponse(
-                    id=doc.id,
-                    file_name=doc.file_name,
-                    storage_path=doc.storage_path,
-                    document_type=doc.document_type.value,
-                    client_id=doc.client_id,
-                    credit_id=doc.credit_id,
-                    created_at=doc.created_at.isoformat(),
-                    file_url=file_url
-                ))
-            
-            return result
+            return [
+                _document_response(doc, file_url)
+                for doc, file_url in zip(documents, await self._file_urls(documents))
+            ]
             
         except Exception as e:
             raise Exception(f"Error getting client documents: {str(e)}")
@@ -150,46 +179,69 @@ class ClientDocumentService:
         try:
             documents = await self._document_repository.get_by_credit_id(credit_id)
             
-            result = []
-            for doc in documents:
-                # Generate URL for each document
-                try:
-                    file_url = self._storage_service.get_public_url(doc.storage_path)
-                except Exception:
-                    # If public URL fails, create signed URL as fallback
-                    file_url = self._storage_service.create_signed_url(doc.storage_path, expires_in=86400)  # 24 hours
-                
-                result.append(ClientDocumentResponse(
-                    id=doc.id,
-                    file_name=doc.file_name,
-                    storage_path=doc.storage_path,
-                    document_type=doc.document_type.value,
-                    client_id=doc.client_id,
-                    credit_id=doc.credit_id,
-                    created_at=doc.created_at.isoformat(),
-                    file_url=file_url
-                ))
-            
-            return result
+            return [
+                _document_response(doc, file_url)
+                for doc, file_url in zip(documents, await self._file_urls(documents))
+            ]
             
         except Exception as e:
             raise Exception(f"Error getting credit documents: {str(e)}")
     
-    async def delete_document(self, document_id: int) -> dict:
-        """Delete a document and its file from storage"""
-        try:
-            # Get document first
+    async def _file_urls(self, documents: List[ClientDocument]) -> List[str]:
+        """
+        Build the file URL of each document, in order.
+        
+        Public URLs are formatted locally; documents whose public URL fails
+        get signed URLs from one batched Storage request instead of one each.
+        """
+        urls: List[Optional[str]] = []
+        unsigned: List[int] = []
+        for index, doc in enumerate(documents):
+            try:
+                urls.append(self._storage_service.get_public_url(doc.storage_path))
+            except Exception:
+                urls.append(None)
+                unsigned.append(index)
+        
+        if unsigned:
+            signed_urls = await self._storage_service.create_signed_urls(
+                [documents[index].storage_path for index in unsigned],
+                expires_in=86400  # 24 hours
+            )
+            for index, signed_url in zip(unsigned, signed_urls):
+                urls[index] = signed_url
+        
+        return urls
+    
+    async def _delete_owned_document(
+        self,
+        document_id: int,
+        client_id: Optional[int] = None,
+        credit_id: Optional[int] = None
+    ) -> None:
+        """Delete the row in one conditional DELETE, then its file in the background"""
+        storage_path = await self._document_repository.delete_if_owner(
+            document_id, client_id=client_id, credit_id=credit_id
+        )
+        if storage_path is None:
+            # Nada borrado: solo ahora se consulta para distinguir 404 de dueño incorrecto
             document = await self._document_repository.get_by_id(document_id)
             if not document:
                 raise ValueError(f"Document with ID {document_id} not found")
-            
-            # Delete from database
-            success = await self._document_repository.delete(document_id)
-            if not success:
-                raise Exception("Failed to delete document from database")
-            
-            # Delete from storage (don't fail if this doesn't work)
-            await self._storage_service.delete_file(document.storage_path)
+            if client_id is not None and document.client_id != client_id:
+                raise ValueError(f"Document {document_id} does not belong to client {client_id}")
+            if credit_id is not None and document.credit_id != credit_id:
+                raise ValueError(f"Document {document_id} does not belong to credit {credit_id}")
+            raise Exception("Failed to delete document from database")
+        
+        # Delete from storage after responding (don't fail if this doesn't work)
+        delete_file_in_background(self._storage_service, storage_path)
+        _forget_download_urls(document_id)
+    
+    async def delete_document(self, document_id: int) -> dict:
+        """Delete a document and its file from storage"""
+        try:
+            await self._delete_owned_document(document_id)
             
             return {
                 "status": "success",
@@ -204,22 +256,7 @@ class ClientDocumentService:
     async def delete_client_document(self, client_id: int, document_id: int) -> dict:
         """Delete a document that belongs to a specific client"""
         try:
-            # Get document first
-            document = await self._document_repository.get_by_id(document_id)
-            if not document:
-                raise ValueError(f"Document with ID {document_id} not found")
-            
-            # Validate that document belongs to the specified client
-            if document.client_id != client_id:
-                raise ValueError(f"Document {document_id} does not belong to client {client_id}")
-            
-            # Delete from database
-            success = await self._document_repository.delete(document_id)
-            if not success:
-                raise Exception("Failed to delete document from database")
-            
-            # Delete from storage (don't fail if this doesn't work)
-            await self._storage_service.delete_file(document.storage_path)
+            await self._delete_owned_document(document_id, client_id=client_id)
             
             return {
                 "status": "success",
@@ -234,22 +271,7 @@ class ClientDocumentService:
     async def delete_credit_document(self, credit_id: int, document_id: int) -> dict:
         """Delete a document that belongs to a specific credit"""
         try:
-            # Get document first
-            document = await self._document_repository.get_by_id(document_id)
-            if not document:
-                raise ValueError(f"Document with ID {document_id} not found")
-            
-            # Validate that document belongs to the specified credit
-            if document.credit_id != credit_id:
-                raise ValueError(f"Document {document_id} does not belong to credit {credit_id}")
-            
-            # Delete from database
-            success = await self._document_repository.delete(document_id)
-            if not success:
-                raise Exception("Failed to delete document from database")
-            
-            # Delete from storage (don't fail if this doesn't work)
-            await self._storage_service.delete_file(document.storage_path)
+            await self._delete_owned_document(document_id, credit_id=credit_id)
             
             return {
                 "status": "success",
@@ -262,8 +284,13 @@ class ClientDocumentService:
             raise Exception(f"Error deleting credit document: {str(e)}")
 
     async def get_document_download_url(self, document_id: int, expires_in: int = 3600) -> str:
-        """Get a signed URL for downloading a document"""
+        """Get a signed URL for downloading a document (cached while it stays valid)"""
         try:
+            cache_key = (document_id, expires_in)
+            cached = _download_url_cache.get(cache_key)
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            
             document = await self._document_repository.get_by_id(document_id)
             if not document:
                 raise ValueError(f"Document with ID {document_id} not found")
@@ -273,6 +300,13 @@ class ClientDocumentService:
                 document.storage_path, expires_in
             )
             
+            ttl = expires_in - DOWNLOAD_URL_TTL_MARGIN_SECONDS
+            if ttl > 0:
+                if len(_download_url_cache) >= DOWNLOAD_URL_CACHE_MAX_ENTRIES:
+                    # Drop the oldest entry (dicts keep insertion order)
+                    _download_url_cache.pop(next(iter(_download_url_cache)))
+                _download_url_cache[cache_key] = (signed_url, time.monotonic() + ttl)
+            
             return signed_url
             
         except ValueError as e:
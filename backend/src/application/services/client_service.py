@@ -1,5 +1,6 @@
 import math
-from typing import List, Optional
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from src.domain.entities.client import Client
 from src.domain.ports.client_repository import ClientRepositoryPort
 from src.application.dtos.client_dtos import (
@@ -11,6 +12,35 @@ from src.application.dtos.client_dtos import (
 )
 
 
+# In-process cache of cedula lookups (a client's cedula never changes).
+# Writes evict their entry only after committing, so a concurrent lookup
+# can't re-cache the old row.
+CLIENT_BY_CEDULA_TTL_SECONDS = 30.0
+CLIENT_BY_CEDULA_CACHE_MAX_ENTRIES = 4096
+_client_by_cedula_cache: Dict[str, Tuple[ClientResponse, float]] = {}
+
+
+def clear_client_by_cedula_cache() -> None:
+    """Drop every cached cedula lookup of this process"""
+    _client_by_cedula_cache.clear()
+
+
+_CLIENT_RESPONSE_FIELDS = tuple(ClientResponse.model_fields)
+
+
+def client_response_from_row(client) -> ClientResponse:
+    """
+    Build a ClientResponse from a stored client without re-validating it.
+    
+    Rows were validated when they were written, so list pages (up to 500
+    rows), searches (up to 200) and the export stream skip one
+    pydantic-core validation per row.
+    """
+    return ClientResponse.model_construct(
+        **{name: getattr(client, name) for name in _CLIENT_RESPONSE_FIELDS}
+    )
+
+
 class ClientService:
     """Service for client operations"""
     
@@ -52,17 +82,7 @@ class ClientService:
         try:
             created_client = await self._client_repository.create(client)
             
-            return ClientResponse(
-                id=created_client.id,
-                nombre_completo=created_client.nombre_completo,
-                cedula=created_client.cedula,
-                email=created_client.email,
-                telefono=created_client.telefono,
-                fecha_nacimiento=created_client.fecha_nacimiento,
-                direccion=created_client.direccion,
-                info_adicional=created_client.info_adicional,
-                created_at=created_client.created_at
-            )
+            return ClientResponse.model_validate(created_client)
             
         except Exception as e:
             raise Exception(f"Error al crear el cliente: {str(e)}")
@@ -73,35 +93,26 @@ class ClientService:
         if not client:
             return None
         
-        return ClientResponse(
-            id=client.id,
-            nombre_completo=client.nombre_completo,
-            cedula=client.cedula,
-            email=client.email,
-            telefono=client.telefono,
-            fecha_nacimiento=client.fecha_nacimiento,
-            direccion=client.direccion,
-            info_adicional=client.info_adicional,
-            created_at=client.created_at
-        )
+        return ClientResponse.model_validate(client)
     
     async def get_client_by_cedula(self, cedula: str) -> Optional[ClientResponse]:
-        """Get client by cedula"""
+        """Get client by cedula (cached for CLIENT_BY_CEDULA_TTL_SECONDS)"""
+        cached = _client_by_cedula_cache.get(cedula)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
         client = await self._client_repository.get_by_cedula(cedula)
         if not client:
             return None
         
-        return ClientResponse(
-            id=client.id,
-            nombre_completo=client.nombre_completo,
-            cedula=client.cedula,
-            email=client.email,
-            telefono=client.telefono,
-            fecha_nacimiento=client.fecha_nacimiento,
-            direccion=client.direccion,
-            info_adicional=client.info_adicional,
-            created_at=client.created_at
-        )
+        response = ClientResponse.model_validate(client)
+        
+        if len(_client_by_cedula_cache) >= CLIENT_BY_CEDULA_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry (dicts keep insertion order)
+            _client_by_cedula_cache.pop(next(iter(_client_by_cedula_cache)), None)
+        _client_by_cedula_cache[cedula] = (response, time.monotonic() + CLIENT_BY_CEDULA_TTL_SECONDS)
+        
+        return response
     
     async def update_client(self, client_id: int, request: UpdateClientRequest) -> ClientResponse:
         """Update client information"""
@@ -137,18 +148,10 @@ class ClientService:
         
         try:
             updated_client = await self._client_repository.update(client)
+            await self._client_repository.commit()
+            _client_by_cedula_cache.pop(client.cedula, None)
             
-            return ClientResponse(
-                id=updated_client.id,
-                nombre_completo=updated_client.nombre_completo,
-                cedula=updated_client.cedula,
-                email=updated_client.email,
-                telefono=updated_client.telefono,
-                fecha_nacimiento=updated_client.fecha_nacimiento,
-                direccion=updated_client.direccion,
-                info_adicional=updated_client.info_adicional,
-                created_at=updated_client.created_at
-            )
+            return ClientResponse.model_validate(updated_client)
             
         except Exception as e:
             raise Exception(f"Error al actualizar el cliente: {str(e)}")
@@ -157,41 +160,20 @@ class ClientService:
         """Search clients by name or cedula"""
         try:
             if request.search_term:
-                # Search by name or cedula
-                clients_by_name = await self._client_repository.search_by_name(
+                # Name or cedula in one query: SQL dedups, pages and counts
+                paginated_clients, total = await self._client_repository.search(
                     request.search_term, request.skip, request.limit
                 )
-                clients_by_cedula = await self._client_repository.search_by_cedula(
-                    request.search_term
-                )
-                
-                # Combine results and remove duplicates
-                all_clients = clients_by_name + [c for c in clients_by_cedula if c not in clients_by_name]
-                
-                # Apply pagination to combined results
-                total = len(all_clients)
-                paginated_clients = all_clients[request.skip:request.skip + request.limit]
             else:
                 # Get all clients
                 paginated_clients = await self._client_repository.get_all(request.skip, request.limit)
                 total = await self._client_repository.count_total()
             
             # Convert to response DTOs
-            client_responses = []
-            for client in paginated_clients:
-                client_responses.append(
-                    ClientResponse(
-                        id=client.id,
-                        nombre_completo=client.nombre_completo,
-                        cedula=client.cedula,
-                        email=client.email,
-                        telefono=client.telefono,
-                        fecha_nacimiento=client.fecha_nacimiento,
-                        direccion=client.direccion,
-                        info_adicional=client.info_adicional,
-                        created_at=client.created_at
-                    )
-                )
+            client_responses = [
+                client_response_from_row(client)
+                for client in paginated_clients
+            ]
             
             # Calculate pagination
             page = (request.skip // request.limit) + 1
@@ -219,7 +201,10 @@ class ClientService:
             # TODO: Check if client has active loans/applications before deleting
             # This would require checking with LoanApplicationRepository
             
-            return await self._client_repository.delete(client_id)
+            deleted = await self._client_repository.delete(client_id)
+            await self._client_repository.commit()
+            _client_by_cedula_cache.pop(client.cedula, None)
+            return deleted
             
         except Exception as e:
             raise Exception(f"Error al eliminar el cliente: {str(e)}")
@@ -227,4 +212,9 @@ class ClientService:
     async def get_all_clients(self, skip: int = 0, limit: int = 20) -> ClientListResponse:
         """Get all clients with pagination"""
         request = SearchClientsRequest(skip=skip, limit=limit)
-        return await self.search_clients(request)
\ No newline at end of file
+        return await self.search_clients(request)
+    
+    async def stream_all_clients(self) -> AsyncIterator[ClientResponse]:
+        """Stream every client without loading the full table into memory"""
+        async for client in self._client_repository.stream_all():
+            yield client_response_from_row(client)
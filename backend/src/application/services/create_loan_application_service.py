@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Optional
+from typing import List
+from src.application.exceptions import LoanApplicationError
 from src.domain.entities.loan_application import LoanApplication
 from src.domain.ports.loan_application_repository import LoanApplicationRepositoryPort
 from src.application.dtos.loan_application_dtos import (
@@ -25,50 +26,60 @@ class CreateLoanApplicationService:
             LoanApplicationResponse with created application data
             
         Raises:
-            ValueError: If validation fails
+            LoanApplicationError: If validation fails (400)
             Exception: If creation fails
         """
+        responses = await self.execute_many([request])
+        return responses[0]
+    
+    async def execute_many(self, requests: List[CreateLoanApplicationRequest]) -> List[LoanApplicationResponse]:
+        """
+        Create several loan applications (e.g. a lead import) in one bulk insert
         
-        # Create domain entity
-        loan_application = LoanApplication(
-            id=None,
-            name=request.name.strip(),
-            cedula=request.cedula.strip(),
-            convenio=request.convenio.strip() if request.convenio else None,
-            telefono=request.telefono.strip(),
-            fecha_nacimiento=request.fecha_nacimiento,
-            created_at=datetime.now()
-        )
-        
-        # Validate business rules
-        if not loan_application.validate_application_data():
-            raise ValueError("Los datos de la solicitud no son válidos")
+        Every request is validated before anything is written, so an invalid
+        one rejects the whole batch. Several applications per cedula are
+        allowed, so no per-cedula lookup is needed.
         
-        # Check if there's already an application for this cedula (optional business rule)
-        existing_applications = await self._loan_application_repository.get_by_cedula(
-            loan_application.cedula
-        )
+        Raises:
+            LoanApplicationError: If validation fails (400)
+            Exception: If creation fails
+        """
+        # Create domain entities
+        now = datetime.now()
+        loan_applications = [
+            LoanApplication(
+                id=None,
+                name=request.name.strip(),
+                cedula=request.cedula.strip(),
+                convenio=request.convenio.strip() if request.convenio else None,
+                telefono=request.telefono.strip(),
+                fecha_nacimiento=request.fecha_nacimiento,
+                created_at=now
+            )
+            for request in requests
+        ]
         
-        if existing_applications:
-            # You can implement business rules here if needed
-            # For now, we'll allow multiple applications per cedula
-            pass
+        # Validate business rules
+        if not all(application.validate_application_data() for application in loan_applications):
+            raise LoanApplicationError(400, "Los datos de la solicitud no son válidos")
         
         # Save to repository
         try:
-            created_application = await self._loan_application_repository.create(loan_application)
+            created_applications = await self._loan_application_repository.create_many(loan_applications)
             
-            # Convert to response DTO
-            return LoanApplicationResponse(
-                id=created_application.id,
-                name=created_application.name,
-                cedula=created_application.cedula,
-                convenio=created_application.convenio,
-                telefono=created_application.telefono,
-                fecha_nacimiento=created_application.fecha_nacimiento,
-                created_at=created_application.created_at
-            )
+            # Convert to response DTOs
+            return [
+                LoanApplicationResponse(
+                    id=created_application.id,
+                    name=created_application.name,
+                    cedula=created_application.cedula,
+                    convenio=created_application.convenio,
+                    telefono=created_application.telefono,
+                    fecha_nacimiento=created_application.fecha_nacimiento,
+                    created_at=created_application.created_at
+                )
+                for created_application in created_applications
+            ]
             
         except Exception as e:
             raise Exception(f"Error al crear la solicitud: {str(e)}")
-    
@@ -1,5 +1,7 @@
+import asyncio
 import math
-from typing import Optional
+import time
+from typing import Optional, Tuple
 from datetime import datetime
 from src.application.dtos.credit_simulator_dtos import (
     SimulateCreditRequest,
@@ -12,6 +14,24 @@ from src.domain.ports.credit_simulator_repository import CreditSimulatorReposito
 from src.domain.entities.credit_simulator import CreditSimulator
 
 
+# Caché en proceso de la configuración activa: solo cambia por acciones de admin.
+# El TTL acota cuánto tiempo otros workers pueden ver una configuración vieja.
+ACTIVE_CONFIG_TTL_SECONDS = 60.0
+_active_config_cache: Optional[Tuple[CreditSimulator, float]] = None
+_active_config_lock = asyncio.Lock()
+
+
+def clear_active_config_cache() -> None:
+    """
+    Invalidate the cached active configuration of this process.
+    
+    Call it after the change is committed: a reload that runs before the
+    commit would cache the old configuration again.
+    """
+    global _active_config_cache
+    _active_config_cache = None
+
+
 class CreditSimulatorService:
     """Service for credit simulation operations"""
     
@@ -106,6 +126,8 @@ class CreditSimulatorService:
         
         # Guardar en base de datos
         created_config = await self._simulator_repository.create(new_config)
+        await self._simulator_repository.commit()
+        clear_active_config_cache()
         
         return SimulatorConfigResponse(
             id=created_config.id,
@@ -154,6 +176,8 @@ class CreditSimulatorService:
         
         # Actualizar en base de datos
         modified_config = await self._simulator_repository.update(updated_config)
+        await self._simulator_repository.commit()
+        clear_active_config_cache()
         
         return SimulatorConfigResponse(
             id=modified_config.id,
@@ -188,13 +212,26 @@ class CreditSimulatorService:
         return round(cuota, 2)
     
     async def _get_active_config(self) -> CreditSimulator:
-        """Get the currently active configuration"""
-        config = await self._simulator_repository.get_active_config()
-        
-        if config is None:
-            raise ValueError("No existe una configuración activa. Debe activar una configuración primero.")
-        
-        return config
+        """Get the currently active configuration (cached for ACTIVE_CONFIG_TTL_SECONDS)"""
+        global _active_config_cache
+        
+        cached = _active_config_cache
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        # Solo una consulta a la base de datos cuando la caché expira
+        async with _active_config_lock:
+            cached = _active_config_cache
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            
+            config = await self._simulator_repository.get_active_config()
+            
+            if config is None:
+                raise ValueError("No existe una configuración activa. Debe activar una configuración primero.")
+            
+            _active_config_cache = (config, time.monotonic() + ACTIVE_CONFIG_TTL_SECONDS)
+            return config
     
     async def validate_simulation_parameters(self, monto: float, plazo_meses: int) -> dict:
         """
@@ -243,6 +280,8 @@ class CreditSimulatorService:
         
         # Activar la configuración (esto desactiva automáticamente las otras)
         activated_config = await self._simulator_repository.set_active_config(config_id)
+        await self._simulator_repository.commit()
+        clear_active_config_cache()
         
         return SimulatorConfigResponse(
             id=activated_config.id,
@@ -3,6 +3,13 @@ from typing import List
 from dataclasses import dataclass
 
 
+def file_extension(filename: str) -> str:
+    """Get lowercase file extension from filename"""
+    if '.' in filename:
+        return filename.rsplit('.', 1)[-1].lower()
+    return ""
+
+
 @dataclass
 class ExtractedText:
     """Represents extracted text from a document with metadata"""
@@ -55,6 +62,4 @@ class DocumentProcessor(ABC):
     
     def get_extension(self, filename: str) -> str:
         """Get lowercase file extension from filename"""
-        if '.' in filename:
-            return filename.split('.')[-1].lower()
-        return ""
+        return file_extension(filename)
@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import DocumentProcessor
+from .base import DocumentProcessor, file_extension
 from .pdf_processor import PDFProcessor
 from .word_processor import WordProcessor
 
@@ -20,6 +20,12 @@ class DocumentProcessorFactory:
             PDFProcessor(),
             WordProcessor()
         ]
+        # Extension -> processor, so lookups don't scan every processor
+        self._by_extension = {
+            ext: processor
+            for processor in self._processors
+            for ext in processor.SUPPORTED_EXTENSIONS
+        }
     
     def get_processor(self, filename: str) -> Optional[DocumentProcessor]:
         """
@@ -31,10 +37,7 @@ class DocumentProcessorFactory:
         Returns:
             DocumentProcessor if format is supported, None otherwise
         """
-        for processor in self._processors:
-            if processor.supports_format(filename):
-                return processor
-        return None
+        return self._by_extension.get(file_extension(filename))
     
     def is_supported(self, filename: str) -> bool:
         """
@@ -1,12 +1,57 @@
+import asyncio
+import zipfile
 from typing import List
 from io import BytesIO
-from docx import Document
+from lxml import etree
 
 from .base import DocumentProcessor, ExtractedText
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_R = f"{_W}r"
+_W_T = f"{_W}t"
+_W_TAB = f"{_W}tab"
+_W_BR = f"{_W}br"
+_W_CR = f"{_W}cr"
+_W_TYPE = f"{_W}type"
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    """Text of a <w:p>, with run tabs and line breaks like python-docx"""
+    parts = []
+    for node in paragraph.iter(_W_T, _W_TAB, _W_BR, _W_CR):
+        if node.tag == _W_T:
+            parts.append(node.text or "")
+        elif node.getparent().tag != _W_R:
+            # Tab stops in the paragraph properties aren't text
+            continue
+        elif node.tag == _W_TAB:
+            parts.append("\t")
+        elif node.get(_W_TYPE, "textWrapping") == "textWrapping":
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _table_rows(table: etree._Element) -> List[str]:
+    """One " | "-joined line per table row with text"""
+    rows_text = []
+    for row in table.iterchildren(_W_TR):
+        row_text = []
+        for cell in row.iterchildren(_W_TC):
+            cell_text = "\n".join(_paragraph_text(p) for p in cell.iterchildren(_W_P))
+            if cell_text.strip():
+                row_text.append(cell_text.strip())
+        if row_text:
+            rows_text.append(" | ".join(row_text))
+    return rows_text
+
 
 class WordProcessor(DocumentProcessor):
-    """Processor for Word documents using python-docx"""
+    """Processor for Word documents, reading word/document.xml with lxml"""
     
     SUPPORTED_EXTENSIONS = ['docx', 'doc']
     
@@ -21,26 +66,39 @@ class WordProcessor(DocumentProcessor):
         Returns:
             List of ExtractedText objects
         """
+        # XML parsing is synchronous and CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._extract_text_sync, content, filename)
+    
+    def _extract_text_sync(self, content: bytes, filename: str) -> List[ExtractedText]:
+        """Extract paragraph and table text (blocking)"""
         try:
-            doc_file = BytesIO(content)
-            doc = Document(doc_file)
+            # BytesIO over bytes shares the buffer until written to, and the
+            # zip is only read, so the upload isn't copied
+            with zipfile.ZipFile(BytesIO(content)) as docx_zip:
+                document_xml = docx_zip.read("word/document.xml")
             
-            # Extract all text from paragraphs
             paragraphs_text = []
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    paragraphs_text.append(para.text.strip())
-            
-            # Extract text from tables
             tables_text = []
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        tables_text.append(" | ".join(row_text))
+            tables_count = 0
+            
+            # Only top-level paragraphs and tables, like Document.paragraphs and
+            # Document.tables; nested ones are read through their table
+            for _, element in etree.iterparse(BytesIO(document_xml), events=("end",), tag=(_W_P, _W_TBL)):
+                if element.getparent().tag != _W_BODY:
+                    continue
+                
+                if element.tag == _W_P:
+                    text = _paragraph_text(element).strip()
+                    if text:
+                        paragraphs_text.append(text)
+                else:
+                    tables_count += 1
+                    tables_text.extend(_table_rows(element))
+                
+                # Drop the parsed elements so the tree doesn't grow with the document
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
             
             # Combine all text
             all_text = "\n\n".join(paragraphs_text)
@@ -58,7 +116,7 @@ class WordProcessor(DocumentProcessor):
                     "source_file": filename,
                     "file_type": "word",
                     "paragraphs_count": len(paragraphs_text),
-                    "tables_count": len(doc.tables)
+                    "tables_count": tables_count
                 }
             )]
             
@@ -31,17 +31,16 @@ class ListClientLoanApplicationsService:
         """
         
         try:
-            # Get applications by cedula
-            all_applications = await self._loan_application_repository.get_by_cedula(request.cedula)
-            
-            # Sort by creation date (newest first)
-            all_applications.sort(key=lambda x: x.created_at, reverse=True)
+            # Only the requested page, already newest first (OFFSET/LIMIT in SQL)
+            paginated_applications = await self._loan_application_repository.get_by_cedula(
+                request.cedula, request.skip, request.limit
+            )
             
-            # Apply pagination
-            total = len(all_applications)
-            start_index = request.skip
-            end_index = start_index + request.limit
-            paginated_applications = all_applications[start_index:end_index]
+            # A short page already tells the total; count only when it can't
+            if len(paginated_applications) < request.limit and (paginated_applications or request.skip == 0):
+                total = request.skip + len(paginated_applications)
+            else:
+                total = await self._loan_application_repository.count_by_cedula(request.cedula)
             
             # Convert to response DTOs
             application_responses = []
@@ -85,9 +84,9 @@ class ListClientLoanApplicationsService:
         """
         
         try:
-            applications = await self._loan_application_repository.get_by_cedula(cedula)
+            summary = await self._loan_application_repository.get_summary_by_cedula(cedula)
             
-            if not applications:
+            if not summary["total"]:
                 return {
                     "total_applications": 0,
                     "has_pending": False,
@@ -96,15 +95,9 @@ class ListClientLoanApplicationsService:
                     "total_requested": 0.0
                 }
             
-            # Calculate summary statistics
-            total_applications = len(applications)
-            
-            # Get latest application
-            latest_application = max(applications, key=lambda x: x.created_at)
-            
             return {
-                "total_applications": total_applications,
-                "latest_application_date": latest_application.created_at,
+                "total_applications": summary["total"],
+                "latest_application_date": summary["latest_created_at"],
                 "applications_by_convenio": {}
             }
             
@@ -1,4 +1,7 @@
-from typing import List, Optional
+import time
+from functools import cached_property
+from typing import Dict, Hashable, List, Optional, Tuple
+from src.application.exceptions import LoanApplicationError
 from src.domain.ports.loan_application_repository import LoanApplicationRepositoryPort
 from src.application.services.create_loan_application_service import CreateLoanApplicationService
 
@@ -13,6 +16,33 @@ from src.application.dtos.loan_application_dtos import (
 )
 
 
+# In-process cache of admin listings and statistics. Every write clears it
+# after committing, so a concurrent read can't re-cache pre-write results.
+LOAN_APPLICATION_LIST_TTL_SECONDS = 10.0
+LOAN_APPLICATION_STATS_TTL_SECONDS = 30.0
+LOAN_APPLICATION_CACHE_MAX_ENTRIES = 256
+_loan_application_cache: Dict[Hashable, Tuple[object, float]] = {}
+
+
+def clear_loan_application_cache() -> None:
+    """Drop every cached list and statistics result of this process"""
+    _loan_application_cache.clear()
+
+
+def _get_cached(key: Hashable) -> Optional[object]:
+    cached = _loan_application_cache.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _set_cached(key: Hashable, value: object, ttl: float) -> None:
+    if len(_loan_application_cache) >= LOAN_APPLICATION_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry (dicts keep insertion order)
+        _loan_application_cache.pop(next(iter(_loan_application_cache)), None)
+    _loan_application_cache[key] = (value, time.monotonic() + ttl)
+
+
 class LoanApplicationService:
     """
     Main service for loan application operations
@@ -21,15 +51,30 @@ class LoanApplicationService:
     
     def __init__(self, loan_application_repository: LoanApplicationRepositoryPort):
         self._loan_application_repository = loan_application_repository
-        
-        # Initialize use case services
-        self._create_service = CreateLoanApplicationService(loan_application_repository)
-        self._list_client_service = ListClientLoanApplicationsService(loan_application_repository)
+    
+    # Use case services are built on first use (the service is created per request)
+    @cached_property
+    def _create_service(self) -> CreateLoanApplicationService:
+        return CreateLoanApplicationService(self._loan_application_repository)
+    
+    @cached_property
+    def _list_client_service(self) -> ListClientLoanApplicationsService:
+        return ListClientLoanApplicationsService(self._loan_application_repository)
     
     # Create operations
     async def create_application(self, request: CreateLoanApplicationRequest) -> LoanApplicationResponse:
         """Create a new loan application"""
-        return await self._create_service.execute(request)
+        response = await self._create_service.execute(request)
+        await self._loan_application_repository.commit()
+        clear_loan_application_cache()
+        return response
+    
+    async def create_applications(self, requests: List[CreateLoanApplicationRequest]) -> List[LoanApplicationResponse]:
+        """Create several loan applications in one bulk insert"""
+        responses = await self._create_service.execute_many(requests)
+        await self._loan_application_repository.commit()
+        clear_loan_application_cache()
+        return responses
     
     # Update operations
     async def update_application(self, application_id: int, request: UpdateLoanApplicationRequest) -> LoanApplicationResponse:
@@ -38,7 +83,7 @@ class LoanApplicationService:
             # Get existing application
             application = await self._loan_application_repository.get_by_id(application_id)
             if not application:
-                raise Exception(f"Solicitud con ID {application_id} no encontrada")
+                raise LoanApplicationError(404, f"Solicitud con ID {application_id} no encontrada")
             
             # Update fields if provided
             if request.name is not None:
@@ -52,6 +97,8 @@ class LoanApplicationService:
             
             # Save updated application
             updated_application = await self._loan_application_repository.update(application)
+            await self._loan_application_repository.commit()
+            clear_loan_application_cache()
             
             return LoanApplicationResponse(
                 id=updated_application.id,
@@ -63,6 +110,8 @@ class LoanApplicationService:
                 created_at=updated_application.created_at
             )
             
+        except LoanApplicationError:
+            raise
         except Exception as e:
             raise Exception(f"Error al actualizar solicitud: {str(e)}")
     
@@ -95,17 +144,35 @@ class LoanApplicationService:
     
     # Admin operations
     async def list_all_applications(self, convenio_filter: Optional[str] = None, 
-                                  skip: int = 0, limit: int = 20) -> LoanApplicationListResponse:
-        """List all applications with optional convenio filter"""
+                                  skip: int = 0, limit: int = 20,
+                                  include_total: bool = True) -> LoanApplicationListResponse:
+        """
+        List all applications with optional convenio filter
+        
+        With include_total=False the COUNT(*) query is skipped and total only
+        counts the rows up to the end of this page (skip + returned rows).
+        Results are cached for LOAN_APPLICATION_LIST_TTL_SECONDS.
+        """
+        cache_key = ("list", convenio_filter, skip, limit, include_total)
+        cached = _get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             if convenio_filter:
                 applications = await self._loan_application_repository.get_by_convenio(
                     convenio_filter, skip, limit
                 )
-                total = await self._loan_application_repository.count_by_convenio(convenio_filter)
+                total = (
+                    await self._loan_application_repository.count_by_convenio(convenio_filter)
+                    if include_total else skip + len(applications)
+                )
             else:
                 applications = await self._loan_application_repository.get_all(skip, limit)
-                total = await self._loan_application_repository.count_total()
+                total = (
+                    await self._loan_application_repository.count_total()
+                    if include_total else skip + len(applications)
+                )
             
             # Convert to response DTOs
             application_responses = []
@@ -127,7 +194,7 @@ class LoanApplicationService:
             page = (skip // limit) + 1
             total_pages = math.ceil(total / limit) if total > 0 else 1
             
-            return LoanApplicationListResponse(
+            response = LoanApplicationListResponse(
                 applications=application_responses,
                 total=total,
                 page=page,
@@ -137,13 +204,20 @@ class LoanApplicationService:
             
         except Exception as e:
             raise Exception(f"Error al listar solicitudes: {str(e)}")
+        
+        _set_cached(cache_key, response, LOAN_APPLICATION_LIST_TTL_SECONDS)
+        return response
     
     async def get_application_statistics(self) -> LoanApplicationStatsResponse:
-        """Get application statistics"""
+        """Get application statistics (cached for LOAN_APPLICATION_STATS_TTL_SECONDS)"""
+        cached = _get_cached("stats")
+        if cached is not None:
+            return cached
+        
         try:
             stats = await self._loan_application_repository.get_statistics()
             
-            return LoanApplicationStatsResponse(
+            response = LoanApplicationStatsResponse(
                 total_applications=stats.get('total', 0),
                 applications_by_convenio=stats.get('by_convenio', {}),
                 applications_by_month=stats.get('by_month', {})
@@ -151,6 +225,9 @@ class LoanApplicationService:
             
         except Exception as e:
             raise Exception(f"Error al obtener estadísticas: {str(e)}")
+        
+        _set_cached("stats", response, LOAN_APPLICATION_STATS_TTL_SECONDS)
+        return response
     
     async def search_applications_by_name(self, name: str, skip: int = 0, 
                                         limit: int = 20) -> LoanApplicationListResponse:
@@ -158,10 +235,7 @@ class LoanApplicationService:
         try:
             applications = await self._loan_application_repository.search_by_name(name, skip, limit)
             
-            # For simplicity, we'll count all matching results
-            # In a real implementation, you might want a separate count method
-            all_matching = await self._loan_application_repository.search_by_name(name, 0, 1000)
-            total = len(all_matching)
+            total = await self._loan_application_repository.count_by_name(name)
             
             # Convert to response DTOs
             application_responses = []
@@ -1,4 +1,8 @@
-from typing import List, Optional
+import asyncio
+import re
+import unicodedata
+import uuid
+from typing import List, Optional, Tuple
 from fastapi import UploadFile
 
 from src.domain.entities.context_document import ContextDocument, ProcessingStatus
@@ -7,8 +11,15 @@ from src.domain.ports.context_document_repository import ContextDocumentReposito
 from src.domain.ports.chunk_repository import ChunkRepositoryPort
 from src.domain.ports.embedding_port import EmbeddingPort
 from src.domain.ports.storage_port import StoragePort
+from src.application.services.chat_service import clear_semantic_response_cache
 from src.application.services.document_processors.factory import DocumentProcessorFactory
+from src.application.services.storage_cleanup import delete_file_in_background
 from src.application.services.text_chunking_service import TextChunkingService
+from src.application.services.upload_streaming import UPLOAD_CHUNK_SIZE, read_upload_chunks
+
+# Storage-safe filenames: keep only alphanumeric, dash, underscore, dot
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_\.]')
+_REPEATED_UNDERSCORES_RE = re.compile(r'_+')
 
 
 class RAGDocumentService:
@@ -30,7 +41,7 @@ class RAGDocumentService:
     
     async def upload_and_process(self, file: UploadFile) -> dict:
         """
-        Upload a document and process it for RAG.
+        Upload a document and process it for RAG in one call.
         
         Steps:
         1. Validate file format
@@ -47,6 +58,30 @@ class RAGDocumentService:
         Returns:
             Dict with upload result and document info
         """
+        document, content = await self.upload_document(file)
+        await self.process_document(document.id, content, document.filename)
+        
+        return {
+            "status": "success",
+            "message": "Document uploaded and processed successfully",
+            "document_id": document.id,
+            "filename": document.filename,
+            "processing_status": ProcessingStatus.COMPLETED.value
+        }
+    
+    async def upload_document(self, file: UploadFile) -> Tuple[ContextDocument, bytes]:
+        """
+        Upload a document and create its record (status PENDING).
+        
+        Text extraction, chunking and embeddings are left to process_document,
+        so callers can run them outside the request.
+        
+        Args:
+            file: Uploaded file
+            
+        Returns:
+            Tuple of the created document and the file content
+        """
         # Validate file format
         if not file.filename:
             raise ValueError("File must have a filename")
@@ -55,38 +90,25 @@ class RAGDocumentService:
             supported = self._processor_factory.get_supported_extensions_string()
             raise ValueError(f"Unsupported file format. Supported formats: {supported}")
         
-        # Read file content
+        # Check for an empty file without loading it whole
         print(f"[RAG] Reading file: {file.filename}", flush=True)
-        file_content = await file.read()
-        if not file_content:
+        first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not first_chunk:
             raise ValueError("File is empty")
-        print(f"[RAG] File size: {len(file_content)} bytes", flush=True)
         
         # Generate storage path with sanitized filename
-        import uuid
-        import re
-        import unicodedata
-        
         # Normalize unicode and remove accents
         normalized = unicodedata.normalize('NFKD', file.filename)
         ascii_filename = normalized.encode('ASCII', 'ignore').decode('ASCII')
         
         # Sanitize: keep only alphanumeric, dash, underscore, dot
-        safe_filename = re.sub(r'[^\w\-_\.]', '_', ascii_filename)
-        safe_filename = re.sub(r'_+', '_', safe_filename)  # Remove multiple underscores
+        safe_filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', ascii_filename)
+        safe_filename = _REPEATED_UNDERSCORES_RE.sub('_', safe_filename)  # Remove multiple underscores
         safe_filename = safe_filename.strip('_')  # Remove leading/trailing underscores
         
         unique_filename = f"rag_{uuid.uuid4()}_{safe_filename}"
         storage_path = f"rag_documents/{unique_filename}"
         
-        # Upload to storage
-        print(f"[RAG] Uploading to storage: {storage_path}", flush=True)
-        try:
-            await self._storage_service.upload_file(file_content, storage_path)
-            print("[RAG] Upload complete", flush=True)
-        except Exception as e:
-            raise Exception(f"Error uploading file to storage: {str(e)}")
-        
         # Create document record
         document = ContextDocument(
             filename=file.filename,
@@ -94,31 +116,55 @@ class RAGDocumentService:
             processing_status=ProcessingStatus.PENDING
         )
         
-        try:
-            created_document = await self._document_repository.create(document)
-        except Exception as e:
+        # Stream to storage while the document row is inserted (independent IO)
+        print(f"[RAG] Uploading to storage: {storage_path}", flush=True)
+        upload_result, create_result = await asyncio.gather(
+            self._storage_service.upload_stream(
+                read_upload_chunks(file, first_chunk),
+                storage_path,
+                content_type=file.content_type or "application/octet-stream",
+                content_length=file.size
+            ),
+            self._document_repository.create(document),
+            return_exceptions=True
+        )
+        
+        if isinstance(upload_result, BaseException):
+            # create() commits, so drop the row that has no file behind it
+            if not isinstance(create_result, BaseException):
+                await self._document_repository.delete(create_result.id)
+            raise Exception(f"Error uploading file to storage: {str(upload_result)}")
+        print("[RAG] Upload complete", flush=True)
+        
+        if isinstance(create_result, BaseException):
             # Cleanup storage on failure
             await self._storage_service.delete_file(storage_path)
-            raise Exception(f"Error creating document record: {str(e)}")
+            raise Exception(f"Error creating document record: {str(create_result)}")
+        
+        created_document = create_result
+        
+        # Text extraction needs the whole document (PDF/DOCX are random access)
+        await file.seek(0)
+        file_content = await file.read()
+        print(f"[RAG] File size: {len(file_content)} bytes", flush=True)
+        
+        return created_document, file_content
+    
+    async def process_document(self, document_id: int, content: bytes, filename: str) -> None:
+        """
+        Extract, chunk, embed and store an uploaded document.
         
-        # Process document asynchronously (in background ideally, but sync for now)
+        Marks the document FAILED (without deleting it) if any step fails.
+        """
         try:
-            await self._process_document(created_document.id, file_content, file.filename)
+            await self._process_document(document_id, content, filename)
         except Exception as e:
             # Mark as failed but don't delete - admin can retry
             await self._document_repository.update_status(
-                created_document.id, 
+                document_id, 
                 ProcessingStatus.FAILED
             )
             raise Exception(f"Error processing document: {str(e)}")
-        
-        return {
-            "status": "success",
-            "message": "Document uploaded and processed successfully",
-            "document_id": created_document.id,
-            "filename": file.filename,
-            "processing_status": ProcessingStatus.COMPLETED.value
-        }
     
     async def _process_document(
         self, 
@@ -182,21 +228,25 @@ class RAGDocumentService:
         
         # Update status to completed
         await self._document_repository.update_status(document_id, ProcessingStatus.COMPLETED)
+        # Cached chat answers may miss what this document says
+        clear_semantic_response_cache()
         print("[RAG] Document processing complete!", flush=True)
     
     async def list_documents(self) -> List[dict]:
         """List all RAG documents with their status and chunk count"""
         documents = await self._document_repository.get_all()
+        # One grouped count for all documents instead of a COUNT per document
+        chunk_counts = await self._document_repository.count_chunks_by_document()
         
         result = []
         for doc in documents:
-            chunk_count = await self._document_repository.count_chunks(doc.id)
+            chunk_count = chunk_counts.get(doc.id, 0)
             result.append({
                 "id": doc.id,
                 "filename": doc.filename,
                 "storage_url": doc.storage_url,
                 "processing_status": doc.processing_status.value,
-                "created_at": doc.created_at.isoformat() if doc.created_at else None,
+                "created_at": doc.created_at,
                 "chunks_count": chunk_count
             })
         
@@ -215,27 +265,22 @@ class RAGDocumentService:
             "filename": doc.filename,
             "storage_url": doc.storage_url,
             "processing_status": doc.processing_status.value,
-            "created_at": doc.created_at.isoformat() if doc.created_at else None,
+            "created_at": doc.created_at,
             "chunks_count": chunk_count
         }
     
     async def delete_document(self, document_id: int) -> dict:
         """Delete a document and all its chunks"""
-        doc = await self._document_repository.get_by_id(document_id)
-        if not doc:
+        # Delete document (cascades to chunks) and get its file path in one statement
+        storage_url = await self._document_repository.delete_returning(document_id)
+        if storage_url is None:
             raise ValueError(f"Document with ID {document_id} not found")
         
-        # Delete from storage
-        try:
-            await self._storage_service.delete_file(doc.storage_url)
-        except Exception:
-            pass  # Continue even if storage delete fails
-        
-        # Delete document (cascades to chunks)
-        success = await self._document_repository.delete(document_id)
+        # Delete from storage after responding (don't fail if this doesn't work)
+        delete_file_in_background(self._storage_service, storage_url)
         
-        if not success:
-            raise Exception("Failed to delete document")
+        # Cached chat answers may cite the deleted document
+        clear_semantic_response_cache()
         
         return {
             "status": "success",
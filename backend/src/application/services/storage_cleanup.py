@@ -0,0 +1,29 @@
+import asyncio
+from typing import Set
+
+from src.domain.ports.storage_port import StoragePort
+
+# Storage files are deleted in the background: the row is already gone, so
+# the response doesn't wait on Storage. References are kept so the GC doesn't
+# drop the tasks and so they can be awaited on app shutdown.
+_pending_storage_deletions: Set[asyncio.Task] = set()
+
+
+def _storage_deletion_done(task: asyncio.Task) -> None:
+    """Forget a finished deletion and log it if it failed"""
+    _pending_storage_deletions.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Warning: Could not delete file from storage: {task.exception()}", flush=True)
+
+
+def delete_file_in_background(storage_service: StoragePort, storage_path: str) -> None:
+    """Schedule the storage deletion without waiting for it"""
+    task = asyncio.create_task(storage_service.delete_file(storage_path))
+    _pending_storage_deletions.add(task)
+    task.add_done_callback(_storage_deletion_done)
+
+
+async def wait_for_storage_deletions() -> None:
+    """Wait for scheduled storage deletions (called on app shutdown)"""
+    if _pending_storage_deletions:
+        await asyncio.gather(*_pending_storage_deletions, return_exceptions=True)
@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from fastapi import UploadFile
+
+# Read uploads in 64 KB chunks so a request never holds the whole file in memory
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def read_upload_chunks(file: UploadFile, first_chunk: bytes = b"") -> AsyncIterator[bytes]:
+    """Yield the uploaded file chunk by chunk, starting with an already read chunk"""
+    if first_chunk:
+        yield first_chunk
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
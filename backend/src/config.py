@@ -18,6 +18,19 @@ if not DATABASE_URL and SUPABASE_URL:
     # Extract database URL from Supabase URL if needed
     DATABASE_URL = SUPABASE_URL.replace("https://", "postgresql://postgres:")
 
+# Connection pool (ignored when connecting through the pgbouncer transaction pooler)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Prepared statements cached per connection (forced to 0 behind pgbouncer)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+PGBOUNCER_PORT = 6543  # Supabase transaction pooling port
+
+# Chunk search: order vector candidates by the halfvec HNSW index. Only turn
+# on once backend/migrations/003_chunk_halfvec_index.sql has been applied
+CHUNK_SEARCH_HALFVEC = os.getenv("CHUNK_SEARCH_HALFVEC", "False").lower() == "true"
+
 # JWT Configuration (para Supabase Auth)
 # Nota: Supabase maneja la expiración automáticamente
 JWT_ALGORITHM = "HS256"  # Supabase usa HS256
@@ -1,7 +1,10 @@
+import re
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 @dataclass
 class Admin:
@@ -18,9 +21,7 @@ class Admin:
     
     def is_valid_email(self) -> bool:
         """Validate email format"""
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, self.email) is not None
+        return _EMAIL_RE.match(self.email) is not None
     
     def is_authorized_for_admin_panel(self) -> bool:
         """Check if admin is authorized for admin panel access"""
@@ -3,6 +3,12 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import re
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)]')
+# Colombian mobile patterns: +573001234567, 573001234567, 3001234567
+_PHONE_RE = re.compile(r'^(?:\+?57)?3[0-9]{9}$')
+
 
 @dataclass
 class Client:
@@ -30,8 +36,7 @@ class Client:
         if not self.email or not self.email.strip():
             return False
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, self.email.strip()) is not None
+        return _EMAIL_RE.match(self.email.strip()) is not None
     
     # 2. Validación de número de teléfono colombiano
     def validate_phone(self) -> bool:
@@ -40,17 +45,9 @@ class Client:
             return False
         
         # Remove spaces and special characters
-        phone_clean = re.sub(r'[\s\-\(\)]', '', self.telefono)
-        
-        # Colombian mobile patterns:
-        # +573001234567, 573001234567, 3001234567
-        patterns = [
-            r'^\+57[3][0-9]{9}$',  # +573001234567
-            r'^57[3][0-9]{9}$',    # 573001234567
-            r'^[3][0-9]{9}$'       # 3001234567
-        ]
+        phone_clean = _PHONE_SEPARATORS_RE.sub('', self.telefono)
         
-        return any(re.match(pattern, phone_clean) for pattern in patterns)
+        return _PHONE_RE.match(phone_clean) is not None
     
     # 3. Validación de documento de identidad
     def validate_document(self) -> bool:
@@ -59,7 +56,7 @@ class Client:
             return False
         
         # Remove any non-digit characters
-        cedula_digits = ''.join(filter(str.isdigit, self.cedula))
+        cedula_digits = _NON_DIGIT_RE.sub('', self.cedula)
         
         # Colombian cedula: 7 to 10 digits
         return 7 <= len(cedula_digits) <= 10 and cedula_digits.isdigit()
@@ -70,26 +67,15 @@ class Client:
         if not self.fecha_nacimiento:
             return False
         
-        today = date.today()
-        age = today.year - self.fecha_nacimiento.year
-        
-        # Adjust age if birthday hasn't occurred this year
-        if today.month < self.fecha_nacimiento.month or \
-           (today.month == self.fecha_nacimiento.month and today.day < self.fecha_nacimiento.day):
-            age -= 1
-        
-        return age >= 22
+        return self.get_age() >= 22
     
     def get_age(self) -> int:
         """Calculate and return current age"""
         today = date.today()
-        age = today.year - self.fecha_nacimiento.year
-        
-        if today.month < self.fecha_nacimiento.month or \
-           (today.month == self.fecha_nacimiento.month and today.day < self.fecha_nacimiento.day):
-            age -= 1
+        birth = self.fecha_nacimiento
         
-        return age
+        # Bool subtracts 1 when this year's birthday hasn't happened yet
+        return today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
     
     # 5. Validación de completitud de datos
     def is_complete(self) -> bool:
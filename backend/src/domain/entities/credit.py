@@ -16,6 +16,11 @@ class CreditStatus(Enum):
     PAGADO = "PAGADO"
 
 
+# Estados precomputados para chequeos de pertenencia O(1)
+_PAYABLE_STATES = frozenset({CreditStatus.AL_DIA.value, CreditStatus.EN_MORA.value})
+_ACTIVE_STATES = _PAYABLE_STATES | {CreditStatus.DESEMBOLSADO.value}
+
+
 @dataclass
 class Credit:
     """Credit aggregate - Represents approved credits"""
@@ -79,7 +84,7 @@ class Credit:
     
     def mark_as_paid(self) -> bool:
         """Mark credit as fully paid"""
-        if self.estado in [CreditStatus.AL_DIA.value, CreditStatus.EN_MORA.value]:
+        if self.estado in _PAYABLE_STATES:
             self.estado = CreditStatus.PAGADO.value
             return True
         return False
@@ -100,7 +105,7 @@ class Credit:
     
     def is_active(self) -> bool:
         """Check if credit is currently active"""
-        return self.estado in [CreditStatus.AL_DIA.value, CreditStatus.EN_MORA.value, CreditStatus.DESEMBOLSADO.value]
+        return self.estado in _ACTIVE_STATES
     
     def can_be_disbursed(self) -> bool:
         """Check if credit can be disbursed"""
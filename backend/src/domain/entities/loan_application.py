@@ -1,7 +1,10 @@
+import re
 from datetime import datetime, date
 from typing import Optional
 from dataclasses import dataclass
 
+_NON_DIGIT_RE = re.compile(r'\D')
+
 
 @dataclass
 class LoanApplication:
@@ -21,16 +24,14 @@ class LoanApplication:
     
     def validate_cedula(self) -> bool:
         """Validate cedula format"""
-        cedula_digits = ''.join(filter(str.isdigit, self.cedula))
+        cedula_digits = _NON_DIGIT_RE.sub('', self.cedula)
         return 8 <= len(cedula_digits) <= 11
     
     def is_adult(self) -> bool:
         """Check if applicant is 18 years or older"""
         today = date.today()
-        age = today.year - self.fecha_nacimiento.year
-        if today.month < self.fecha_nacimiento.month or \
-           (today.month == self.fecha_nacimiento.month and today.day < self.fecha_nacimiento.day):
-            age -= 1
+        birth = self.fecha_nacimiento
+        age = today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
         return age >= 18
     
 
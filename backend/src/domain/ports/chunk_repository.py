@@ -63,23 +63,36 @@ class ChunkRepositoryPort(ABC):
         self, 
         query_embedding: List[float], 
         match_threshold: float = 0.7,
-        match_count: int = 5
+        match_count: int = 5,
+        query_text: Optional[str] = None
     ) -> List[dict]:
         """
         Search for chunks similar to the query embedding.
         
-        Uses vector similarity search (cosine distance).
+        Uses vector similarity search (cosine distance). When query_text is
+        given, full-text matches are fused with the vector matches (hybrid search).
         
         Args:
             query_embedding: Embedding vector of the query
             match_threshold: Minimum similarity threshold (0.0 - 1.0)
             match_count: Maximum number of results to return
+            query_text: Raw query text for the full-text side, optional
             
         Returns:
             List of dicts with chunk data and similarity score
         """
         pass
     
+    @abstractmethod
+    async def has_chunks(self) -> bool:
+        """
+        Check whether any chunk is stored at all.
+        
+        Returns:
+            True if the knowledge base has at least one chunk
+        """
+        pass
+    
     @abstractmethod
     async def delete_by_document_id(self, documento_id: int) -> bool:
         """
@@ -36,6 +36,16 @@ class ClientDocumentRepositoryPort(ABC):
         """Delete a client document by ID"""
         pass
     
+    @abstractmethod
+    async def delete_if_owner(
+        self,
+        document_id: int,
+        client_id: Optional[int] = None,
+        credit_id: Optional[int] = None
+    ) -> Optional[str]:
+        """Delete a document only if it belongs to the given client/credit; return its storage path"""
+        pass
+    
     @abstractmethod
     async def get_all(self) -> List[ClientDocument]:
         """Get all client documents"""
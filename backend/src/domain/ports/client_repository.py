@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from src.domain.entities.client import Client
 
 
@@ -31,6 +31,11 @@ class ClientRepositoryPort(ABC):
         """Get all clients with pagination"""
         pass
     
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[Client]:
+        """Stream all clients one by one (newest first)"""
+        pass
+    
     @abstractmethod
     async def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
         """Search clients by name"""
@@ -41,6 +46,11 @@ class ClientRepositoryPort(ABC):
         """Search clients by cedula (partial match)"""
         pass
     
+    @abstractmethod
+    async def search(self, term: str, skip: int = 0, limit: int = 100) -> Tuple[List[Client], int]:
+        """Search clients whose name or cedula matches; returns one page and the total matches"""
+        pass
+    
     @abstractmethod
     async def update(self, client: Client) -> Client:
         """Update client"""
@@ -64,4 +74,9 @@ class ClientRepositoryPort(ABC):
     @abstractmethod
     async def count_total(self) -> int:
         """Get total count of clients"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        pass
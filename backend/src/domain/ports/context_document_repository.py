@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.domain.entities.context_document import ContextDocument, ProcessingStatus
 
 
@@ -75,6 +75,21 @@ class ContextDocumentRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_returning(self, document_id: int) -> Optional[str]:
+        """
+        Delete a context document by ID in a single statement.
+        
+        Note: This should cascade delete associated chunks.
+        
+        Args:
+            document_id: ID of the document to delete
+            
+        Returns:
+            Storage path of the deleted document, None if it did not exist
+        """
+        pass
+    
     @abstractmethod
     async def get_by_status(self, status: ProcessingStatus) -> List[ContextDocument]:
         """
@@ -100,3 +115,13 @@ class ContextDocumentRepositoryPort(ABC):
             Number of chunks associated with the document
         """
         pass
+    
+    @abstractmethod
+    async def count_chunks_by_document(self) -> Dict[int, int]:
+        """
+        Count the chunks of every document in a single query.
+        
+        Returns:
+            Mapping of document ID to chunk count (documents without chunks are absent)
+        """
+        pass
@@ -39,4 +39,9 @@ class CreditSimulatorRepositoryPort(ABC):
     @abstractmethod
     async def delete(self, config_id: int) -> bool:
         """Delete a simulator configuration by ID"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        pass
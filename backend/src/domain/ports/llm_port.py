@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional
 
 
 class LLMPort(ABC):
@@ -48,3 +49,26 @@ class LLMPort(ABC):
             Exception: If response generation fails
         """
         pass
+    
+    @abstractmethod
+    def stream_response_with_history(
+        self,
+        query: str,
+        context: str,
+        history: Optional[List[dict]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response with conversation history as it is generated.
+        
+        Args:
+            query: The user's question
+            context: Relevant context from retrieved documents
+            history: Previous messages (list of {"role": str, "content": str})
+            
+        Yields:
+            Pieces of the response text, in order
+            
+        Raises:
+            Exception: If response generation fails
+        """
+        pass
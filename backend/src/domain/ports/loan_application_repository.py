@@ -11,14 +11,20 @@ class LoanApplicationRepositoryPort(ABC):
         """Create a new loan application"""
         pass
     
+    @abstractmethod
+    async def create_many(self, applications: List[LoanApplication]) -> List[LoanApplication]:
+        """Create several loan applications in bulk, returning them with their IDs"""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, application_id: int) -> Optional[LoanApplication]:
         """Get application by ID"""
         pass
     
     @abstractmethod
-    async def get_by_cedula(self, cedula: str) -> List[LoanApplication]:
-        """Get applications by cedula"""
+    async def get_by_cedula(self, cedula: str, skip: int = 0,
+                            limit: Optional[int] = None) -> List[LoanApplication]:
+        """Get applications by cedula, newest first (all of them when limit is None)"""
         pass
     
     @abstractmethod
@@ -56,12 +62,32 @@ class LoanApplicationRepositoryPort(ABC):
         """Count applications by convenio"""
         pass
     
+    @abstractmethod
+    async def count_by_cedula(self, cedula: str) -> int:
+        """Count applications by cedula"""
+        pass
+    
+    @abstractmethod
+    async def count_by_name(self, name: str) -> int:
+        """Count applications whose applicant name matches"""
+        pass
+    
     @abstractmethod
     async def count_total(self) -> int:
         """Get total count of applications"""
         pass
     
+    @abstractmethod
+    async def get_summary_by_cedula(self, cedula: str) -> dict:
+        """Get application count and latest created_at for a cedula"""
+        pass
+    
     @abstractmethod
     async def get_statistics(self) -> dict:
         """Get application statistics (counts by convenio, etc.)"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional
 
 
 class StoragePort(ABC):
@@ -15,8 +16,14 @@ class StoragePort(ABC):
         pass
     
     @abstractmethod
-    async def upload_file(self, file_content: bytes, storage_path: str) -> bool:
-        """Upload file to storage"""
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        storage_path: str,
+        content_type: str = "application/octet-stream",
+        content_length: Optional[int] = None
+    ) -> bool:
+        """Upload file to storage from an async stream of chunks"""
         pass
     
     @abstractmethod
@@ -33,3 +40,8 @@ class StoragePort(ABC):
     def create_signed_url(self, storage_path: str, expires_in: int = 3600) -> str:
         """Create a signed URL for private file access"""
         pass
+    
+    @abstractmethod
+    async def create_signed_urls(self, storage_paths: List[str], expires_in: int = 3600) -> List[str]:
+        """Create signed URLs for several files in one request (same order as the paths)"""
+        pass
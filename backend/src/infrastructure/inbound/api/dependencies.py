@@ -0,0 +1,40 @@
+import os
+
+from fastapi import File, HTTPException, Request, UploadFile
+
+from src.domain.ports.storage_port import StoragePort
+from src.infrastructure.outbound.openai_adapter import OpenAIAdapter
+
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+ALLOWED_EXTENSIONS: frozenset[str] = frozenset({'.pdf', '.jpg', '.jpeg', '.png', '.doc', '.docx'})
+
+
+def get_openai_adapter(request: Request) -> OpenAIAdapter:
+    """Dependency to get the shared OpenAIAdapter built at startup"""
+    return request.app.state.openai_adapter
+
+
+def get_storage_service(request: Request) -> StoragePort:
+    """Dependency to get the shared storage service built at startup"""
+    return request.app.state.storage_service
+
+
+async def validated_upload(
+    file: UploadFile = File(..., description="Document file to upload")
+) -> UploadFile:
+    """Dependency that rejects oversized files and disallowed extensions"""
+    if file.size and file.size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail="File size exceeds maximum limit of 10MB"
+        )
+    
+    if file.filename:
+        file_ext = os.path.splitext(file.filename)[1].lower()
+        if file_ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File type not allowed. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            )
+    
+    return file
@@ -0,0 +1,31 @@
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI middleware that rejects oversized request bodies with 413
+    
+    Checks the Content-Length header against the limit configured for the
+    request path, before Starlette reads or spools any of the body.
+    """
+    
+    def __init__(self, app: ASGIApp, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            limit = self.limits.get(scope["path"])
+            if limit is not None:
+                content_length = Headers(scope=scope).get("content-length", "")
+                if content_length.isdigit() and int(content_length) > limit:
+                    response = JSONResponse(
+                        {"detail": "Request body exceeds maximum allowed size"},
+                        status_code=413
+                    )
+                    await response(scope, receive, send)
+                    return
+        
+        await self.app(scope, receive, send)
@@ -0,0 +1,49 @@
+import hashlib
+from functools import lru_cache
+from typing import Sequence, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_type: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per DTO type) the adapter used to dump lists of that DTO"""
+    return TypeAdapter(list[model_type])
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize an already-validated DTO straight to JSON.
+
+    Returning a Response skips FastAPI's response_model re-validation,
+    so the DTO is validated once (when built) instead of twice.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def dump_model_list(models: Sequence[BaseModel], model_type: Type[BaseModel]) -> bytes:
+    """Serialize a list of already-validated DTOs to JSON bytes"""
+    return _list_adapter(model_type).dump_json(list(models))
+
+
+def model_list_response(models: Sequence[BaseModel], model_type: Type[BaseModel]) -> Response:
+    """Serialize a list of already-validated DTOs straight to JSON"""
+    return Response(content=dump_model_list(models, model_type), media_type="application/json")
+
+
+def etag_response(request: Request, content: bytes, cache_control: str) -> Response:
+    """
+    Return JSON content with Cache-Control and a weak ETag.
+
+    Answers 304 Not Modified (no body) when the client's If-None-Match
+    already holds the same ETag.
+    """
+    etag = f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
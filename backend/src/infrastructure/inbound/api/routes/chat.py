@@ -1,8 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import AsyncIterator
+
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.services.chat_service import ChatService
+from src.application.services import chat_service
+from src.application.services.chat_service import ChatService, RetrievalResult
 from src.application.dtos.chat_dtos import ChatRequest, ChatResponse, ChunkReferenceDto
+from src.infrastructure.inbound.api.dependencies import get_openai_adapter
+from src.infrastructure.inbound.api.responses import dump_model_list, model_response
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.infrastructure.outbound.database.chunk_repository import SupabaseChunkRepository
 from src.infrastructure.outbound.openai_adapter import OpenAIAdapter
@@ -15,10 +22,12 @@ router = APIRouter(
 )
 
 
-def get_chat_service(db: AsyncSession = Depends(get_db_session)) -> ChatService:
+def get_chat_service(
+    db: AsyncSession = Depends(get_db_session),
+    openai_adapter: OpenAIAdapter = Depends(get_openai_adapter)
+) -> ChatService:
     """Dependency to get ChatService"""
     chunk_repository = SupabaseChunkRepository(db)
-    openai_adapter = OpenAIAdapter()
     return ChatService(
         chunk_repository=chunk_repository,
         embedding_port=openai_adapter,
@@ -29,7 +38,9 @@ def get_chat_service(db: AsyncSession = Depends(get_db_session)) -> ChatService:
 @router.post("/", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
-    service: ChatService = Depends(get_chat_service)
+    service: ChatService = Depends(get_chat_service),
+    # Same session as the service's repository (FastAPI caches dependencies per request)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Send a question to the KrediPlus chatbot.
@@ -45,39 +56,87 @@ async def chat(
     """
     try:
         # Convert history to list of dicts
-        history = [{"role": msg.role, "content": msg.content} for msg in (request.history or [])]
+        history = [msg.model_dump() for msg in (request.history or [])]
+        
+        retrieval = await service.retrieve_context(request.question, history)
         
-        result = await service.process_query(request.question, history)
+        # Return the connection to the pool before the slow LLM call
+        await db.close()
         
-        return ChatResponse(
-            response=result.response,
-            sources=[
-                ChunkReferenceDto(
-                    chunk_id=src.chunk_id,
-                    document_id=src.document_id,
-                    content_preview=src.content_preview,
-                    similarity=src.similarity,
-                    metadata=src.metadata
-                )
-                for src in result.sources
-            ],
-            processing_time=result.processing_time,
-            query=result.query
+        result = await service.generate_answer(retrieval, history)
+        
+        # The service returns dataclasses; read them by attribute in a single validation pass
+        return model_response(ChatResponse.model_validate(result, from_attributes=True))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Error processing chat request: {str(e)}"
         )
+
+
+def _sse_event(event: str, data: bytes) -> bytes:
+    """Format one server-sent event"""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+async def _chat_events(service: ChatService, retrieval: RetrievalResult, history: list) -> AsyncIterator[bytes]:
+    """Translate the service stream into sources / token / done events"""
+    async for item in service.stream_answer(retrieval, history):
+        if isinstance(item, str):
+            yield _sse_event("token", orjson.dumps(item))
+        elif isinstance(item, chat_service.ChatResponse):
+            final = ChatResponse.model_validate(item, from_attributes=True)
+            yield _sse_event("done", final.model_dump_json().encode())
+        else:
+            sources = [ChunkReferenceDto.model_validate(source, from_attributes=True) for source in item]
+            yield _sse_event("sources", dump_model_list(sources, ChunkReferenceDto))
+
+
+@router.post("/stream")
+async def chat_stream(
+    request: ChatRequest,
+    service: ChatService = Depends(get_chat_service),
+    db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Send a question to the KrediPlus chatbot and stream the answer.
+    
+    This endpoint is PUBLIC and does not require authentication.
+    
+    Returns server-sent events:
+    1. **sources**: JSON list of source references
+    2. **token**: JSON string with the next piece of the answer (repeated)
+    3. **done**: the complete ChatResponse; its response text is authoritative
+    """
+    try:
+        history = [msg.model_dump() for msg in (request.history or [])]
+        
+        retrieval = await service.retrieve_context(request.question, history)
+        
+        # Return the connection to the pool before streaming from the LLM
+        await db.close()
     except Exception as e:
         raise HTTPException(
             status_code=500, 
             detail=f"Error processing chat request: {str(e)}"
         )
+    
+    return StreamingResponse(
+        _chat_events(service, retrieval, history),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/health")
-async def chat_health():
+async def chat_health(response: Response):
     """
     Health check for the chat service.
     
     Returns basic status information.
     """
+    # Let probes and proxies reuse the answer for a short while
+    response.headers["Cache-Control"] = "public, max-age=30"
     return {
         "status": "healthy",
         "service": "KrediPlus Chat",
@@ -1,8 +1,9 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.services.client_service import ClientService
+from src.application.services.client_service import ClientService, client_response_from_row
 from src.application.dtos.client_dtos import (
     CreateClientRequest,
     UpdateClientRequest,
@@ -12,6 +13,9 @@ from src.application.dtos.client_dtos import (
 )
 from src.application.dtos.credit_dtos import CreateCreditForClientRequest, CreditResponse, UpdateCreditRequest
 from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user
+from src.infrastructure.inbound.api.responses import model_response, model_list_response, etag_response
+from src.domain.ports.storage_port import StoragePort
+from src.infrastructure.inbound.api.dependencies import get_storage_service
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.infrastructure.outbound.database.client_repository import SupabaseClientRepository
 
@@ -52,6 +56,23 @@ async def create_client(
         raise HTTPException(status_code=500, detail=f"Error creating client: {str(e)}")
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_clients(
+    service: ClientService = Depends(get_client_service)
+):
+    """
+    Stream every client as NDJSON (one JSON object per line)
+    
+    Rows are read from the database cursor and written as they arrive,
+    so memory usage stays constant regardless of the number of clients.
+    """
+    async def generate():
+        async for client in service.stream_all_clients():
+            yield client.model_dump_json() + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: int,
@@ -69,37 +90,21 @@ async def get_client(
         raise HTTPException(status_code=500, detail=f"Error getting client: {str(e)}")
 
 
-@router.get("/", response_model=list[ClientResponse])
+@router.get("/", response_model=ClientListResponse)
 async def list_clients(
-    db: AsyncSession = Depends(get_db_session)
+    skip: int = Query(0, ge=0, description="Number of clients to skip"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of clients to return"),
+    service: ClientService = Depends(get_client_service)
 ):
-    """List all clients"""
+    """
+    List clients with pagination
+    
+    - **skip**: Number of clients to skip (default: 0)
+    - **limit**: Page size (default: 50, max: 500)
+    """
     try:
-        # Usar directamente el repositorio sin límites
-        from src.infrastructure.outbound.database.client_repository import SupabaseClientRepository
-        repository = SupabaseClientRepository(db)
-        
-        # Obtener todos los clientes sin límite
-        clients = await repository.get_all(skip=0, limit=10000)  # Límite muy alto
-        
-        # Convertir a DTOs
-        client_responses = []
-        for client in clients:
-            client_responses.append(
-                ClientResponse(
-                    id=client.id,
-                    nombre_completo=client.nombre_completo,
-                    cedula=client.cedula,
-                    email=client.email,
-                    telefono=client.telefono,
-                    fecha_nacimiento=client.fecha_nacimiento,
-                    direccion=client.direccion,
-                    info_adicional=client.info_adicional,
-                    created_at=client.created_at
-                )
-            )
-        
-        return client_responses
+        result = await service.get_all_clients(skip=skip, limit=limit)
+        return model_response(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing clients: {str(e)}")
 
@@ -107,6 +112,7 @@ async def list_clients(
 @router.get("/by_cedula/{cedula}", response_model=ClientResponse)
 async def get_client_by_cedula(
     cedula: str,
+    request: Request,
     service: ClientService = Depends(get_client_service)
 ):
     """Get client by cedula (ID number)"""
@@ -114,7 +120,7 @@ async def get_client_by_cedula(
         client = await service.get_client_by_cedula(cedula)
         if not client:
             raise HTTPException(status_code=404, detail="Client not found")
-        return client
+        return etag_response(request, client.model_dump_json().encode(), "private, max-age=10")
     except HTTPException:
         raise
     except Exception as e:
@@ -169,50 +175,33 @@ async def delete_client(
 @router.get("/search/by_name", response_model=list[ClientResponse])
 async def search_clients_by_name(
     name: str = Query(..., description="Name to search for"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of records to return"),
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     Search clients by name
     
     - **name**: Name to search for (partial matches allowed)
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 200)
     """
     try:
-        # Buscar por nombre SIN LÍMITE - consulta directa
+        # Buscar por nombre con paginación - el índice trigram cubre el ILIKE
         from sqlalchemy import select
         from src.infrastructure.outbound.database.models import ClientModel
-        from src.infrastructure.outbound.database.client_repository import SupabaseClientRepository
         
-        repository = SupabaseClientRepository(db)
         search_pattern = f"%{name}%"
         
         stmt = select(ClientModel).where(
             ClientModel.nombre_completo.ilike(search_pattern)
-        ).order_by(ClientModel.created_at.desc())  # SIN .limit() - TODAS las coincidencias
-        
-        result = await db.execute(stmt)
-        models = result.scalars().all()
+        ).order_by(ClientModel.created_at.desc()).offset(skip).limit(limit)
         
-        # Convertir modelos a entidades
-        clients = [repository._model_to_entity(model) for model in models]
+        # Convertir modelos directamente a DTOs en una sola pasada (sin lista intermedia)
+        models = await db.scalars(stmt)
+        client_responses = [client_response_from_row(model) for model in models]
         
-        # Convertir a DTOs
-        client_responses = []
-        for client in clients:
-            client_responses.append(
-                ClientResponse(
-                    id=client.id,
-                    nombre_completo=client.nombre_completo,
-                    cedula=client.cedula,
-                    email=client.email,
-                    telefono=client.telefono,
-                    fecha_nacimiento=client.fecha_nacimiento,
-                    direccion=client.direccion,
-                    info_adicional=client.info_adicional,
-                    created_at=client.created_at
-                )
-            )
-        
-        return client_responses
+        return model_list_response(client_responses, ClientResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching clients: {str(e)}")
 
@@ -221,7 +210,8 @@ async def search_clients_by_name(
 async def delete_client_document(
     client_id: int,
     document_id: int,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    storage_service: StoragePort = Depends(get_storage_service)
 ):
     """
     Delete a document that belongs to a specific client
@@ -236,11 +226,9 @@ async def delete_client_document(
     try:
         from src.application.services.client_document_service import ClientDocumentService
         from src.infrastructure.outbound.database.client_document_repository import SupabaseClientDocumentRepository
-        from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
         
         # Create document service
         document_repository = SupabaseClientDocumentRepository(db)
-        storage_service = SupabaseStorageService()
         document_service = ClientDocumentService(document_repository, storage_service)
         
         # Delete document with client validation
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user, require_admin
 from src.application.services.credit_simulator_service import CreditSimulatorService
@@ -9,6 +9,7 @@ from src.application.dtos.credit_simulator_dtos import (
     CreateSimulatorConfigRequest,
     UpdateSimulatorConfigRequest
 )
+from src.infrastructure.inbound.api.responses import dump_model_list, etag_response
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.domain.entities.user import User
 from src.infrastructure.outbound.database.credit_simulator_repository import SupabaseCreditSimulatorRepository
@@ -72,6 +73,7 @@ async def simulate_credit_get(
 
 @router.get("/config", response_model=list[SimulatorConfigResponse])
 async def get_all_simulator_configs(
+    request: Request,
     service: CreditSimulatorService = Depends(get_simulator_service),
     _user: User = Depends(get_current_user)
 ):
@@ -83,7 +85,9 @@ async def get_all_simulator_configs(
     - Each configuration includes: id, interest rate, amounts, and available terms
     """
     try:
-        return await service.get_all_simulator_configs()
+        configs = await service.get_all_simulator_configs()
+        content = dump_model_list(configs, SimulatorConfigResponse)
+        return etag_response(request, content, "private, max-age=30")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting simulator configs: {str(e)}")
 
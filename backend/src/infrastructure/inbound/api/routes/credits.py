@@ -9,6 +9,8 @@ from src.application.dtos.credit_dtos import (
     UpdateCreditRequest,
     CreditResponse
 )
+from src.domain.ports.storage_port import StoragePort
+from src.infrastructure.inbound.api.dependencies import get_storage_service
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.infrastructure.outbound.database.credit_repository import SupabaseCreditRepository
 
@@ -169,7 +171,8 @@ async def delete_credit(
 async def delete_credit_document(
     credit_id: int,
     document_id: int,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    storage_service: StoragePort = Depends(get_storage_service)
 ):
     """
     Delete a document that belongs to a specific credit
@@ -184,11 +187,9 @@ async def delete_credit_document(
     try:
         from src.application.services.client_document_service import ClientDocumentService
         from src.infrastructure.outbound.database.client_document_repository import SupabaseClientDocumentRepository
-        from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
         
         # Create document service
         document_repository = SupabaseClientDocumentRepository(db)
-        storage_service = SupabaseStorageService()
         document_service = ClientDocumentService(document_repository, storage_service)
         
         # Delete document with credit validation
@@ -1,13 +1,21 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, Form
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List, Union
+from typing import Annotated, Optional, List, Union
+from pydantic import BeforeValidator
 
 from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user
 from src.application.services.client_document_service import ClientDocumentService
 from src.application.dtos.client_document_dtos import ClientDocumentResponse
+from src.domain.entities.client_document import DocumentType
+from src.domain.ports.storage_port import StoragePort
+from src.infrastructure.inbound.api.dependencies import get_storage_service, validated_upload
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.infrastructure.outbound.database.client_document_repository import SupabaseClientDocumentRepository
-from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
+
+DOCUMENT_TYPES: frozenset[str] = frozenset(dt.value for dt in DocumentType)
+
+# Optional int form field where an empty string means "not provided"
+OptionalFormInt = Annotated[Optional[int], BeforeValidator(lambda v: None if v == "" else v)]
 
 router = APIRouter(
     prefix="/documents",
@@ -16,66 +24,46 @@ router = APIRouter(
 )
 
 
-def get_document_service(db: AsyncSession = Depends(get_db_session)) -> ClientDocumentService:
+def get_document_service(
+    db: AsyncSession = Depends(get_db_session),
+    storage_service: StoragePort = Depends(get_storage_service)
+) -> ClientDocumentService:
     """Dependency to get ClientDocumentService"""
     repository = SupabaseClientDocumentRepository(db)
-    storage_service = SupabaseStorageService()
     return ClientDocumentService(repository, storage_service)
 
 
-def parse_optional_int(value: str) -> Optional[int]:
-    """Parse string to int, return None if empty or invalid"""
-    if not value or value.strip() == "":
-        return None
-    try:
-        return int(value)
-    except ValueError:
-        return None
-
-
 @router.post("/upload")
 async def upload_document(
-    file: UploadFile = File(..., description="Document file to upload"),
+    file: UploadFile = Depends(validated_upload),
     document_type: str = Form(..., description="Type of document (CEDULA_FRENTE, CEDULA_REVERSO, etc.)"),
     client_id: int = Form(..., description="Client ID"),
-    credit_id: str = Form("", description="Credit ID (optional, can be empty string)"),
+    credit_id: Annotated[OptionalFormInt, Form(description="Credit ID (optional, can be empty string)")] = None,
     service: ClientDocumentService = Depends(get_document_service)
 ):
     """
     Upload a document file to Supabase Storage and save record to database
     """
     try:
-        # Validate file size (optional - add if needed)
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-        if file.size and file.size > MAX_FILE_SIZE:
+        # Validate document type before touching the file
+        if document_type not in DOCUMENT_TYPES:
             raise HTTPException(
-                status_code=400, 
-                detail="File size exceeds maximum limit of 10MB"
+                status_code=400,
+                detail=f"Invalid document_type. Must be one of: {sorted(DOCUMENT_TYPES)}"
             )
         
-        # Validate file type (optional - add if needed)
-        ALLOWED_EXTENSIONS = {'.pdf', '.jpg', '.jpeg', '.png', '.doc', '.docx'}
-        if file.filename:
-            file_ext = '.' + file.filename.split('.')[-1].lower() if '.' in file.filename else ''
-            if file_ext not in ALLOWED_EXTENSIONS:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
-                )
-        
-        # Parse credit_id (handle empty string)
-        parsed_credit_id = parse_optional_int(credit_id)
-        
         # Upload document
         result = await service.upload_document(
             file=file,
             document_type=document_type,
             client_id=client_id,
-            credit_id=parsed_credit_id
+            credit_id=credit_id
         )
         
         return result
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,9 +1,9 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user
-from src.application.services.loan_application_service import LoanApplicationService
+from src.application.services.loan_application_service import LoanApplicationService, clear_loan_application_cache
 from src.application.dtos.loan_application_dtos import (
     CreateLoanApplicationRequest,
     UpdateLoanApplicationRequest,
@@ -12,12 +12,16 @@ from src.application.dtos.loan_application_dtos import (
     LoanApplicationListResponse,
     LoanApplicationStatsResponse
 )
+from src.infrastructure.inbound.api.responses import dump_model_list, etag_response
 from src.infrastructure.outbound.database.connection import get_db_session
 from src.domain.entities.user import User
 from src.infrastructure.outbound.database.loan_application_repository import SupabaseLoanApplicationRepository
 
 router = APIRouter(prefix="/loan_applications", tags=["Loan Applications"])
 
+# Admin views poll these; a short private cache plus ETag keeps repeat reads cheap
+READ_CACHE_CONTROL = "private, max-age=5"
+
 
 def get_loan_application_service(db: AsyncSession = Depends(get_db_session)) -> LoanApplicationService:
     """Dependency to get LoanApplicationService"""
@@ -39,50 +43,51 @@ async def create_loan_application(
     - **telefono**: Phone number
     - **fecha_nacimiento**: Birth date (must be 18+ years old)
     """
-    try:
-        return await service.create_application(request)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating application: {str(e)}")
+    # LoanApplicationError (invalid data) is answered by the app-level handler
+    return await service.create_application(request)
 
 
 @router.get("/{application_id}", response_model=LoanApplicationResponse)
 async def get_loan_application(
     application_id: int,
+    request: Request,
     service: LoanApplicationService = Depends(get_loan_application_service),
     _: User = Depends(get_current_user)
 ):
     """Get a specific loan application by ID"""
-    try:
-        application = await service.get_application_by_id(application_id)
-        if not application:
-            raise HTTPException(status_code=404, detail="Application not found")
-        return application
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting application: {str(e)}")
+    application = await service.get_application_by_id(application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return etag_response(request, application.model_dump_json().encode(), READ_CACHE_CONTROL)
 
 
 @router.get("/", response_model=list[LoanApplicationResponse])
 async def list_loan_applications(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum number of records to return"),
     service: LoanApplicationService = Depends(get_loan_application_service),
     _: User = Depends(get_current_user)
 ):
     """
     List all loan applications
+    
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 1000)
     """
-    try:
-        result = await service.list_all_applications(convenio_filter=None, skip=0, limit=1000)
-        return result.applications  # Solo devolver la lista, sin metadatos
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error listing applications: {str(e)}")
+    # Sin total: se omite el COUNT(*) porque la respuesta es solo la lista
+    result = await service.list_all_applications(
+        convenio_filter=None, skip=skip, limit=limit, include_total=False
+    )
+    # Solo devolver la lista, sin metadatos
+    content = dump_model_list(result.applications, LoanApplicationResponse)
+    return etag_response(request, content, READ_CACHE_CONTROL)
 
 
 @router.get("/by_cedula/{cedula}", response_model=list[LoanApplicationResponse])
 async def get_applications_by_cedula(
     cedula: str,
+    request: Request,
     service: LoanApplicationService = Depends(get_loan_application_service),
     _: User = Depends(get_current_user)
 ):
@@ -92,17 +97,18 @@ async def get_applications_by_cedula(
     - **cedula**: Client's ID number
     """
     try:
-        request = ListClientLoanApplicationsRequest(
+        list_request = ListClientLoanApplicationsRequest(
             cedula=cedula,
             skip=0,
             limit=100
         )
-        result = await service.list_client_applications(request)
-        return result.applications  # Solo devolver la lista, sin metadatos
+        result = await service.list_client_applications(list_request)
     except ValueError as e:
+        # Cédula inválida (ValidationError también es ValueError)
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting applications by cedula: {str(e)}")
+    # Solo devolver la lista, sin metadatos
+    content = dump_model_list(result.applications, LoanApplicationResponse)
+    return etag_response(request, content, READ_CACHE_CONTROL)
 
 
 
@@ -123,12 +129,8 @@ async def update_application(
     - **telefono**: Phone number
     - **fecha_nacimiento**: Birth date (must be 18+ years old)
     """
-    try:
-        return await service.update_application(application_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating application: {str(e)}")
+    # LoanApplicationError (not found) is answered by the app-level handler
+    return await service.update_application(application_id, request)
 
 
 
@@ -148,16 +150,13 @@ async def delete_application(
     **Warning**: This permanently deletes the application from the database.
     Consider using status updates instead for audit trail.
     """
-    try:
-        # Get the repository directly for delete operation
-        repository = SupabaseLoanApplicationRepository(db)
-        
-        success = await repository.delete(application_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="Application not found")
-        
-        return {"message": "Application deleted successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting application: {str(e)}")
\ No newline at end of file
+    # Get the repository directly for delete operation
+    repository = SupabaseLoanApplicationRepository(db)
+    
+    success = await repository.delete(application_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Application not found")
+    
+    await repository.commit()
+    clear_loan_application_cache()
+    return {"message": "Application deleted successfully"}
\ No newline at end of file
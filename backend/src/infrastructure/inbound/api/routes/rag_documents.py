@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
@@ -10,11 +10,13 @@ from src.application.dtos.rag_document_dtos import (
     DocumentDeleteResponse,
     ProcessingStatusDto
 )
-from src.infrastructure.outbound.database.connection import get_db_session
+from src.infrastructure.inbound.api.dependencies import get_openai_adapter, get_storage_service
+from src.infrastructure.inbound.api.responses import model_list_response
+from src.infrastructure.outbound.database.connection import AsyncSessionLocal, get_db_session
 from src.infrastructure.outbound.database.context_document_repository import SupabaseContextDocumentRepository
 from src.infrastructure.outbound.database.chunk_repository import SupabaseChunkRepository
 from src.infrastructure.outbound.openai_adapter import OpenAIAdapter
-from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
+from src.domain.ports.storage_port import StoragePort
 
 router = APIRouter(
     prefix="/rag/documents",
@@ -23,40 +25,78 @@ router = APIRouter(
 )
 
 
-def get_rag_document_service(db: AsyncSession = Depends(get_db_session)) -> RAGDocumentService:
+def get_rag_document_service(
+    db: AsyncSession = Depends(get_db_session),
+    embedding_port: OpenAIAdapter = Depends(get_openai_adapter),
+    storage_service: StoragePort = Depends(get_storage_service)
+) -> RAGDocumentService:
     """Dependency to get RAGDocumentService"""
     document_repository = SupabaseContextDocumentRepository(db)
     chunk_repository = SupabaseChunkRepository(db)
-    embedding_port = OpenAIAdapter()
-    storage_service = SupabaseStorageService()
     return RAGDocumentService(document_repository, chunk_repository, embedding_port, storage_service)
 
 
-@router.post("/", response_model=DocumentUploadResponse)
+async def process_document_in_background(
+    document_id: int,
+    content: bytes,
+    filename: str,
+    embedding_port: OpenAIAdapter,
+    storage_service: StoragePort
+) -> None:
+    """Run RAG processing after the response, on its own session (the request's is closed by then)"""
+    async with AsyncSessionLocal() as db:
+        service = RAGDocumentService(
+            SupabaseContextDocumentRepository(db),
+            SupabaseChunkRepository(db),
+            embedding_port,
+            storage_service
+        )
+        try:
+            await service.process_document(document_id, content, filename)
+            await db.commit()
+        except Exception as e:
+            # The document is already marked FAILED; no client is waiting on this task
+            await db.rollback()
+            print(f"[RAG] Background processing failed for document {document_id}: {str(e)}", flush=True)
+
+
+@router.post("/", response_model=DocumentUploadResponse, status_code=202)
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="Document file to upload (PDF, DOCX, DOC)"),
-    service: RAGDocumentService = Depends(get_rag_document_service)
+    service: RAGDocumentService = Depends(get_rag_document_service),
+    embedding_port: OpenAIAdapter = Depends(get_openai_adapter),
+    storage_service: StoragePort = Depends(get_storage_service)
 ):
     """
-    Upload and process a document for RAG.
+    Upload a document for RAG and process it in the background.
     
     Supported formats: PDF, DOCX, DOC
     
-    The document will be:
-    1. Uploaded to storage
-    2. Text extracted
-    3. Split into chunks
-    4. Embeddings generated
-    5. Stored for vector search
+    Responds 202 once the document is stored with status "pending". Then:
+    1. Text extracted
+    2. Split into chunks
+    3. Embeddings generated
+    4. Stored for vector search
+    
+    Poll GET /rag/documents/{document_id} for processing_status.
     """
     try:
-        result = await service.upload_and_process(file)
+        document, content = await service.upload_document(file)
+        background_tasks.add_task(
+            process_document_in_background,
+            document.id,
+            content,
+            document.filename,
+            embedding_port,
+            storage_service
+        )
         return DocumentUploadResponse(
-            status=result["status"],
-            message=result["message"],
-            document_id=result["document_id"],
-            filename=result["filename"],
-            processing_status=ProcessingStatusDto(result["processing_status"])
+            status="accepted",
+            message="Document uploaded, processing started",
+            document_id=document.id,
+            filename=document.filename,
+            processing_status=ProcessingStatusDto.PENDING
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -73,8 +113,9 @@ async def list_documents(
     """
     try:
         documents = await service.list_documents()
-        return [
-            ContextDocumentResponse(
+        # Rows come straight from our own service, so skip per-row validation
+        responses = [
+            ContextDocumentResponse.model_construct(
                 id=doc["id"],
                 filename=doc["filename"],
                 storage_url=doc["storage_url"],
@@ -84,6 +125,7 @@ async def list_documents(
             )
             for doc in documents
         ]
+        return model_list_response(responses, ContextDocumentResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
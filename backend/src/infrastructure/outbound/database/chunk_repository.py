@@ -3,10 +3,23 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, text
 
+from src.config import CHUNK_SEARCH_HALFVEC
 from src.domain.entities.chunk import Chunk
 from src.domain.ports.chunk_repository import ChunkRepositoryPort
 from .models import ChunkModel
 
+# Rows per multi-row INSERT (5 bind params each, well under asyncpg's 32767 limit)
+CHUNK_INSERT_BATCH_SIZE = 500
+# HNSW candidate list size per search (recall vs latency); raised to the candidate count if lower
+HNSW_EF_SEARCH = 40
+# Candidates taken from each side (vector / full-text) before fusing
+SEARCH_CANDIDATES = 20
+# Reciprocal rank fusion constant
+RRF_K = 60
+# Candidate ordering for each HNSW index; must match the index expression exactly
+VECTOR_DISTANCE_SQL = "embedding <=> CAST(:query_embedding AS vector(1536))"
+HALFVEC_DISTANCE_SQL = "CAST(embedding AS halfvec(1536)) <=> CAST(:query_embedding AS halfvec(1536))"
+
 
 class SupabaseChunkRepository(ChunkRepositoryPort):
     """Supabase implementation of ChunkRepositoryPort using SQLAlchemy and pgvector"""
@@ -25,35 +38,50 @@ class SupabaseChunkRepository(ChunkRepositoryPort):
             created_at=model.created_at
         )
     
+    def _insert_params(self, chunk: Chunk, suffix: str = "") -> dict:
+        """Bind parameters for inserting a chunk (embedding as a pgvector literal)"""
+        import json
+        return {
+            f"content{suffix}": chunk.content,
+            f"metadata{suffix}": json.dumps(chunk.metadata) if chunk.metadata else None,
+            f"document_id{suffix}": chunk.documento_id,
+            f"embedding{suffix}": f"[{','.join(map(str, chunk.embedding))}]" if chunk.embedding else None,
+            f"created_at{suffix}": chunk.created_at or datetime.now()
+        }
+    
+    @staticmethod
+    def _insert_values(suffix: str = "") -> str:
+        """VALUES tuple matching _insert_params (CAST instead of :: for asyncpg compatibility)"""
+        return (
+            f"(:content{suffix}, CAST(:metadata{suffix} AS json), :document_id{suffix}, "
+            f"CAST(:embedding{suffix} AS vector), :created_at{suffix})"
+        )
+    
+    @staticmethod
+    def _batch_insert_values(suffix: str, row_order: int) -> str:
+        """
+        VALUES row for the batch INSERT ... SELECT.
+        
+        Every param is cast because inside a FROM (VALUES ...) there is no
+        target column to infer its type from; row_order fixes the insert order.
+        """
+        return (
+            f"(CAST(:content{suffix} AS text), CAST(:metadata{suffix} AS json), "
+            f"CAST(:document_id{suffix} AS integer), CAST(:embedding{suffix} AS vector), "
+            f"CAST(:created_at{suffix} AS timestamptz), {row_order})"
+        )
+    
     async def create(self, chunk: Chunk) -> Chunk:
         """Create a new chunk with embedding using raw SQL for pgvector support"""
-        import json
         try:
             # Use raw SQL to insert with vector type
-            embedding_str = f"[{','.join(map(str, chunk.embedding))}]" if chunk.embedding else None
-            metadata_json = json.dumps(chunk.metadata) if chunk.metadata else None
-            created_at = chunk.created_at or datetime.now()
-            
-            # Use CAST instead of :: for asyncpg compatibility
-            query = text("""
+            query = text(f"""
                 INSERT INTO "Chunk" (content, metadata, document_id, embedding, created_at)
-                VALUES (
-                    :content, 
-                    CAST(:metadata AS json), 
-                    :document_id, 
-                    CAST(:embedding AS vector), 
-                    :created_at
-                )
+                VALUES {self._insert_values()}
                 RETURNING id, created_at
             """)
             
-            result = await self.db.execute(query, {
-                "content": chunk.content,
-                "metadata": metadata_json,
-                "document_id": chunk.documento_id,
-                "embedding": embedding_str,
-                "created_at": created_at
-            })
+            result = await self.db.execute(query, self._insert_params(chunk))
             
             row = result.fetchone()
             chunk.id = row.id
@@ -67,13 +95,33 @@ class SupabaseChunkRepository(ChunkRepositoryPort):
             raise Exception(f"Error creating chunk: {str(e)}")
     
     async def create_batch(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Create multiple chunks in batch"""
-        created_chunks = []
+        """Create multiple chunks with one multi-row INSERT per CHUNK_INSERT_BATCH_SIZE rows and one commit"""
         try:
-            for chunk in chunks:
-                created_chunk = await self.create(chunk)
-                created_chunks.append(created_chunk)
-            return created_chunks
+            for start in range(0, len(chunks), CHUNK_INSERT_BATCH_SIZE):
+                batch = chunks[start:start + CHUNK_INSERT_BATCH_SIZE]
+                
+                params = {}
+                for i, chunk in enumerate(batch):
+                    params.update(self._insert_params(chunk, f"_{i}"))
+                values = ", ".join(self._batch_insert_values(f"_{i}", i) for i in range(len(batch)))
+                
+                query = text(f"""
+                    INSERT INTO "Chunk" (content, metadata, document_id, embedding, created_at)
+                    SELECT content, metadata, document_id, embedding, created_at
+                    FROM (VALUES {values}) AS new_chunks (content, metadata, document_id, embedding, created_at, row_order)
+                    ORDER BY row_order
+                    RETURNING id, created_at
+                """)
+                result = await self.db.execute(query, params)
+                
+                # RETURNING order isn't guaranteed, but the serial ids are drawn
+                # in ORDER BY order, so sorting by id lines rows up with the batch
+                for chunk, row in zip(batch, sorted(result.fetchall(), key=lambda row: row.id)):
+                    chunk.id = row.id
+                    chunk.created_at = row.created_at
+            
+            await self.db.commit()
+            return chunks
         except Exception as e:
             await self.db.rollback()
             raise Exception(f"Error creating chunks batch: {str(e)}")
@@ -111,26 +159,80 @@ class SupabaseChunkRepository(ChunkRepositoryPort):
         self, 
         query_embedding: List[float], 
         match_threshold: float = 0.7,
-        match_count: int = 5
+        match_count: int = 5,
+        query_text: Optional[str] = None
     ) -> List[dict]:
         """
-        Search for similar chunks using the match_documents function in Supabase.
-        Uses cosine similarity via pgvector.
+        Search for similar chunks using cosine similarity via pgvector.
+        
+        The vector side orders by the cosine distance of one of the HNSW
+        indexes (the halfvec one when CHUNK_SEARCH_HALFVEC is on) and only
+        ranks candidates; the returned similarity is computed on the
+        full-precision vectors. The full-text side matches
+        to_tsvector('spanish', content), the same expression as the GIN index.
+        Both candidate lists are merged with reciprocal rank fusion.
         """
         try:
             embedding_str = f"[{','.join(map(str, query_embedding))}]"
+            candidates = max(SEARCH_CANDIDATES, match_count)
+            
+            # SET LOCAL lasts until the end of the current transaction; it cannot take bind params
+            await self.db.execute(
+                text(f"SET LOCAL hnsw.ef_search = {int(max(HNSW_EF_SEARCH, candidates))}")
+            )
             
-            # Use the match_documents function defined in Supabase
-            query = text("""
-                SELECT * FROM match_documents(
-                    CAST(:query_embedding AS vector(1536)),
-                    :match_threshold,
-                    :match_count
+            # Use CAST instead of :: for asyncpg compatibility
+            distance_sql = HALFVEC_DISTANCE_SQL if CHUNK_SEARCH_HALFVEC else VECTOR_DISTANCE_SQL
+            query = text(f"""
+                WITH vector_hits AS (
+                    SELECT id, row_number() OVER (ORDER BY distance) AS rank
+                    FROM (
+                        SELECT id, {distance_sql} AS distance
+                        FROM "Chunk"
+                        ORDER BY distance
+                        LIMIT :candidates
+                    ) nearest
+                ),
+                text_hits AS (
+                    SELECT id, row_number() OVER (ORDER BY text_rank DESC) AS rank
+                    FROM (
+                        SELECT id, ts_rank_cd(to_tsvector('spanish', content), tsquery) AS text_rank
+                        FROM "Chunk", plainto_tsquery('spanish', :query_text) AS tsquery
+                        WHERE to_tsvector('spanish', content) @@ tsquery
+                        ORDER BY text_rank DESC
+                        LIMIT :candidates
+                    ) matched
+                ),
+                fused AS (
+                    SELECT id, SUM(1.0 / (:rrf_k + rank)) AS score
+                    FROM (
+                        SELECT id, rank FROM vector_hits
+                        UNION ALL
+                        SELECT id, rank FROM text_hits
+                    ) hits
+                    GROUP BY id
                 )
+                SELECT * FROM (
+                    SELECT
+                        c.id,
+                        c.content,
+                        c.metadata,
+                        c.document_id,
+                        1 - (c.embedding <=> CAST(:query_embedding AS vector(1536))) AS similarity,
+                        fused.score
+                    FROM fused
+                    JOIN "Chunk" c ON c.id = fused.id
+                ) scored
+                WHERE similarity >= :match_threshold
+                ORDER BY score DESC
+                LIMIT :match_count
             """)
             
             result = await self.db.execute(query, {
                 "query_embedding": embedding_str,
+                "query_text": query_text,
+                "candidates": candidates,
+                "rrf_k": RRF_K,
                 "match_threshold": match_threshold,
                 "match_count": match_count
             })
@@ -151,6 +253,15 @@ class SupabaseChunkRepository(ChunkRepositoryPort):
         except Exception as e:
             raise Exception(f"Error searching similar chunks: {str(e)}")
     
+    async def has_chunks(self) -> bool:
+        """Check whether any chunk is stored (SELECT id ... LIMIT 1)"""
+        try:
+            result = await self.db.execute(select(ChunkModel.id).limit(1))
+            return result.scalar_one_or_none() is not None
+            
+        except Exception as e:
+            raise Exception(f"Error checking for chunks: {str(e)}")
+    
     async def delete_by_document_id(self, documento_id: int) -> bool:
         """Delete all chunks for a specific document"""
         try:
@@ -1,12 +1,20 @@
 from typing import Optional, List
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
 
 from src.domain.entities.client_document import ClientDocument, DocumentType
 from src.domain.ports.client_document_repository import ClientDocumentRepositoryPort
 from .models import ClientDocumentModel, DocumentTypeEnum
 
+# Enum conversions built once instead of an Enum(value) call per row.
+# Keyed by both the DB enum and its string value (some drivers return str)
+_DOMAIN_DOCUMENT_TYPES = {
+    **{db_type: DocumentType(db_type.value) for db_type in DocumentTypeEnum},
+    **{db_type.value: DocumentType(db_type.value) for db_type in DocumentTypeEnum},
+}
+_DB_DOCUMENT_TYPES = {DocumentType(db_type.value): db_type for db_type in DocumentTypeEnum}
+
 
 class SupabaseClientDocumentRepository(ClientDocumentRepositoryPort):
     """Supabase implementation of ClientDocumentRepositoryPort using SQLAlchemy"""
@@ -16,18 +24,11 @@ class SupabaseClientDocumentRepository(ClientDocumentRepositoryPort):
     
     def _model_to_entity(self, model: ClientDocumentModel) -> ClientDocument:
         """Convert database model to domain entity"""
-        # Convert database enum to domain enum
-        if isinstance(model.document_type, DocumentTypeEnum):
-            document_type = DocumentType(model.document_type.value)
-        else:
-            # Fallback for string values
-            document_type = DocumentType(model.document_type)
-        
         return ClientDocument(
             id=model.id,
             file_name=model.file_name,
             storage_path=model.storage_path,
-            document_type=document_type,
+            document_type=_DOMAIN_DOCUMENT_TYPES[model.document_type],
             client_id=model.client_id,
             credit_id=model.credit_id,
             created_at=model.created_at
@@ -35,14 +36,11 @@ class SupabaseClientDocumentRepository(ClientDocumentRepositoryPort):
     
     def _entity_to_model(self, entity: ClientDocument) -> ClientDocumentModel:
         """Convert domain entity to database model"""
-        # Convert domain enum to database enum
-        db_enum = DocumentTypeEnum(entity.document_type.value)
-        
         return ClientDocumentModel(
             id=entity.id,
             file_name=entity.file_name,
             storage_path=entity.storage_path,
-            document_type=db_enum,
+            document_type=_DB_DOCUMENT_TYPES[entity.document_type],
             client_id=entity.client_id,
             credit_id=entity.credit_id,
             created_at=entity.created_at or datetime.now()
@@ -120,7 +118,7 @@ class SupabaseClientDocumentRepository(ClientDocumentRepositoryPort):
             # Update fields
             model.file_name = document.file_name
             model.storage_path = document.storage_path
-            model.document_type = DocumentTypeEnum(document.document_type.value)
+            model.document_type = _DB_DOCUMENT_TYPES[document.document_type]
             model.credit_id = document.credit_id
             
             await self.db.flush()
@@ -149,6 +147,28 @@ class SupabaseClientDocumentRepository(ClientDocumentRepositoryPort):
         except Exception as e:
             raise Exception(f"Error deleting client document: {str(e)}")
     
+    async def delete_if_owner(
+        self,
+        document_id: int,
+        client_id: Optional[int] = None,
+        credit_id: Optional[int] = None
+    ) -> Optional[str]:
+        """Delete a document only if it belongs to the given client/credit; return its storage path"""
+        try:
+            # Un solo DELETE ... RETURNING: sin SELECT previo ni carrera entre leer y borrar
+            stmt = delete(ClientDocumentModel).where(ClientDocumentModel.id == document_id)
+            if client_id is not None:
+                stmt = stmt.where(ClientDocumentModel.client_id == client_id)
+            if credit_id is not None:
+                stmt = stmt.where(ClientDocumentModel.credit_id == credit_id)
+            stmt = stmt.returning(ClientDocumentModel.storage_path)
+            
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none()
+            
+        except Exception as e:
+            raise Exception(f"Error deleting client document: {str(e)}")
+    
     async def get_all(self) -> List[ClientDocument]:
         """Get all client documents"""
         try:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
@@ -104,7 +104,7 @@ class SupabaseClientRepository(ClientRepositoryPort):
         """Get all clients with pagination"""
         try:
             stmt = select(ClientModel).order_by(
-                ClientModel.created_at.desc()
+                ClientModel.created_at.desc(), ClientModel.id.desc()
             ).offset(skip).limit(limit)
             
             result = await self.db.execute(stmt)
@@ -115,6 +115,14 @@ class SupabaseClientRepository(ClientRepositoryPort):
         except Exception as e:
             raise Exception(f"Error getting all clients: {str(e)}")
     
+    async def stream_all(self) -> AsyncIterator[Client]:
+        """Stream all clients using a server-side cursor"""
+        stmt = select(ClientModel).order_by(ClientModel.created_at.desc(), ClientModel.id.desc())
+        result = await self.db.stream_scalars(stmt)
+        
+        async for model in result:
+            yield self._model_to_entity(model)
+    
     async def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
         """Search clients by name"""
         try:
@@ -147,6 +155,39 @@ class SupabaseClientRepository(ClientRepositoryPort):
         except Exception as e:
             raise Exception(f"Error searching clients by cedula: {str(e)}")
     
+    async def search(self, term: str, skip: int = 0, limit: int = 100) -> Tuple[List[Client], int]:
+        """Search clients by name or cedula in one query (total via COUNT(*) OVER ())"""
+        try:
+            search_pattern = f"%{term}%"
+            matches = or_(
+                ClientModel.nombre_completo.ilike(search_pattern),
+                ClientModel.cedula.ilike(search_pattern)
+            )
+            stmt = select(
+                ClientModel, func.count().over().label("total")
+            ).where(matches).order_by(
+                ClientModel.created_at.desc(), ClientModel.id.desc()
+            ).offset(skip).limit(limit)
+            
+            result = await self.db.execute(stmt)
+            rows = result.all()
+            
+            if rows:
+                total = rows[0].total
+            elif skip == 0:
+                total = 0
+            else:
+                # Page past the end: no row carries the window count
+                count_result = await self.db.execute(
+                    select(func.count(ClientModel.id)).where(matches)
+                )
+                total = count_result.scalar() or 0
+            
+            return [self._model_to_entity(row[0]) for row in rows], total
+            
+        except Exception as e:
+            raise Exception(f"Error searching clients: {str(e)}")
+    
     async def update(self, client: Client) -> Client:
         """Update client"""
         try:
@@ -222,4 +263,13 @@ class SupabaseClientRepository(ClientRepositoryPort):
             return result.scalar() or 0
             
         except Exception as e:
-            raise Exception(f"Error counting total clients: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error counting total clients: {str(e)}")
+    
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        try:
+            await self.db.commit()
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise Exception(f"Error committing client changes: {str(e)}")
@@ -1,16 +1,76 @@
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from src.config import DATABASE_URL
+from sqlalchemy.pool import NullPool
+from src.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_STATEMENT_CACHE_SIZE,
+    PGBOUNCER_PORT,
+    CHUNK_SEARCH_HALFVEC
+)
 
 # SQLAlchemy base for models
 Base = declarative_base()
 
+
+def _pool_options(database_url: str) -> dict:
+    """Pool settings for the engine (pgbouncer already pools, so skip ours)"""
+    if make_url(database_url).port == PGBOUNCER_PORT:
+        return {"poolclass": NullPool}
+    
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE
+    }
+
+
+
+def _connect_args(database_url: str) -> dict:
+    """
+    asyncpg prepared statement caches for the engine.
+    
+    In transaction mode pgbouncer hands each transaction a different
+    server connection, so cached prepared statements must be disabled there.
+    """
+    if make_url(database_url).port == PGBOUNCER_PORT:
+        return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    
+    return {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+
+
+# Full-precision Chunk index that migration 004 drops once the halfvec one is in use
+_HALFVEC_REPLACED_INDEX = "chunk_embedding_hnsw_idx"
+
+
+def _init_db_indexes(metadata, halfvec_search: bool) -> list:
+    """
+    Declared indexes for init_db to create.
+    
+    With the halfvec search on, the full-precision Chunk index is skipped so
+    init_db doesn't rebuild what migration 004 dropped.
+    """
+    return [
+        index
+        for table in metadata.sorted_tables
+        for index in table.indexes
+        if not (halfvec_search and index.name == _HALFVEC_REPLACED_INDEX)
+    ]
+
+
 # Database engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Disable SQL logging for cleaner output
     pool_pre_ping=True,
-    pool_recycle=300
+    connect_args=_connect_args(DATABASE_URL),
+    **_pool_options(DATABASE_URL)
 )
 
 # Session factory
@@ -33,9 +93,21 @@ async def get_db_session() -> AsyncSession:
             await session.close()
 
 async def init_db():
-    """Initialize database tables"""
+    """
+    Initialize database tables.
+    
+    Not run on deploy: existing databases get their indexes from the SQL
+    files in backend/migrations.
+    """
     # Import models to register them with SQLAlchemy
     from . import models
     
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        # Needed by the trigram index on Client.nombre_completo
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        # Needed by the HNSW index on Chunk.embedding
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips indexes of tables that already exist
+        for index in _init_db_indexes(Base.metadata, CHUNK_SEARCH_HALFVEC):
+            await conn.run_sync(index.create, checkfirst=True)
@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, delete
 
 from src.domain.entities.context_document import ContextDocument, ProcessingStatus
 from src.domain.ports.context_document_repository import ContextDocumentRepositoryPort
@@ -130,6 +130,22 @@ class SupabaseContextDocumentRepository(ContextDocumentRepositoryPort):
             await self.db.rollback()
             raise Exception(f"Error deleting context document: {str(e)}")
     
+    async def delete_returning(self, document_id: int) -> Optional[str]:
+        """Delete a context document with one DELETE ... RETURNING (the FK cascades to chunks)"""
+        try:
+            stmt = delete(ContextDocumentModel).where(
+                ContextDocumentModel.id == document_id
+            ).returning(ContextDocumentModel.storage_url)
+            result = await self.db.execute(stmt)
+            storage_url = result.scalar_one_or_none()
+            await self.db.commit()
+            
+            return storage_url
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise Exception(f"Error deleting context document: {str(e)}")
+    
     async def get_by_status(self, status: ProcessingStatus) -> List[ContextDocument]:
         """Get all documents with a specific processing status"""
         try:
@@ -155,3 +171,14 @@ class SupabaseContextDocumentRepository(ContextDocumentRepositoryPort):
             
         except Exception as e:
             raise Exception(f"Error counting chunks: {str(e)}")
+    
+    async def count_chunks_by_document(self) -> Dict[int, int]:
+        """Count the chunks of every document with one GROUP BY query"""
+        try:
+            from .models import ChunkModel
+            stmt = select(ChunkModel.document_id, func.count(ChunkModel.id)).group_by(ChunkModel.document_id)
+            result = await self.db.execute(stmt)
+            return {document_id: count for document_id, count in result.all()}
+            
+        except Exception as e:
+            raise Exception(f"Error counting chunks: {str(e)}")
@@ -166,4 +166,13 @@ class SupabaseCreditSimulatorRepository(CreditSimulatorRepositoryPort):
             return True
             
         except Exception as e:
-            raise Exception(f"Error deleting simulator config: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error deleting simulator config: {str(e)}")
+    
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        try:
+            await self.db.commit()
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise Exception(f"Error committing simulator config changes: {str(e)}")
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, insert
 
 from src.domain.entities.loan_application import LoanApplication
 from src.domain.ports.loan_application_repository import LoanApplicationRepositoryPort
@@ -56,6 +56,44 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
         except Exception as e:
             raise Exception(f"Error creating loan application: {str(e)}")
     
+    async def create_many(self, applications: List[LoanApplication]) -> List[LoanApplication]:
+        """
+        Create loan applications with batched multi-row INSERT ... RETURNING.
+        
+        SQLAlchemy's insertmanyvalues splits the rows into pages and, with
+        sort_by_parameter_order, returns them in parameter order (plain
+        RETURNING order isn't guaranteed by PostgreSQL).
+        """
+        if not applications:
+            return applications
+        
+        try:
+            stmt = insert(ApplicationModel).returning(
+                ApplicationModel.id,
+                ApplicationModel.created_at,
+                sort_by_parameter_order=True
+            )
+            result = await self.db.execute(stmt, [
+                {
+                    "name": application.name,
+                    "cedula": application.cedula,
+                    "convenio": application.convenio,
+                    "telefono": application.telefono,
+                    "fecha_nacimiento": application.fecha_nacimiento,
+                    "created_at": application.created_at or datetime.now()
+                }
+                for application in applications
+            ])
+            
+            for application, row in zip(applications, result.fetchall()):
+                application.id = row.id
+                application.created_at = row.created_at
+            
+            return applications
+            
+        except Exception as e:
+            raise Exception(f"Error creating loan applications: {str(e)}")
+    
     async def get_by_id(self, application_id: int) -> Optional[LoanApplication]:
         """Get application by ID"""
         try:
@@ -70,12 +108,13 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
         except Exception as e:
             raise Exception(f"Error getting application by ID: {str(e)}")
     
-    async def get_by_cedula(self, cedula: str) -> List[LoanApplication]:
-        """Get applications by cedula"""
+    async def get_by_cedula(self, cedula: str, skip: int = 0,
+                            limit: Optional[int] = None) -> List[LoanApplication]:
+        """Get applications by cedula, newest first (all of them when limit is None)"""
         try:
             stmt = select(ApplicationModel).where(
                 ApplicationModel.cedula == cedula
-            ).order_by(ApplicationModel.created_at.desc())
+            ).order_by(ApplicationModel.created_at.desc(), ApplicationModel.id.desc()).offset(skip).limit(limit)
             
             result = await self.db.execute(stmt)
             models = result.scalars().all()
@@ -88,8 +127,9 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[LoanApplication]:
         """Get all applications with pagination"""
         try:
+            # id breaks created_at ties so pages never overlap or skip rows
             stmt = select(ApplicationModel).order_by(
-                ApplicationModel.created_at.desc()
+                ApplicationModel.created_at.desc(), ApplicationModel.id.desc()
             ).offset(skip).limit(limit)
             
             result = await self.db.execute(stmt)
@@ -105,7 +145,7 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
         try:
             stmt = select(ApplicationModel).where(
                 ApplicationModel.convenio == convenio
-            ).order_by(ApplicationModel.created_at.desc()).offset(skip).limit(limit)
+            ).order_by(ApplicationModel.created_at.desc(), ApplicationModel.id.desc()).offset(skip).limit(limit)
             
             result = await self.db.execute(stmt)
             models = result.scalars().all()
@@ -210,6 +250,30 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
         except Exception as e:
             raise Exception(f"Error counting applications by convenio: {str(e)}")
     
+    async def count_by_cedula(self, cedula: str) -> int:
+        """Count applications by cedula"""
+        try:
+            stmt = select(func.count(ApplicationModel.id)).where(
+                ApplicationModel.cedula == cedula
+            )
+            result = await self.db.execute(stmt)
+            return result.scalar() or 0
+            
+        except Exception as e:
+            raise Exception(f"Error counting applications by cedula: {str(e)}")
+    
+    async def count_by_name(self, name: str) -> int:
+        """Count applications whose applicant name matches (same ILIKE as search_by_name)"""
+        try:
+            stmt = select(func.count(ApplicationModel.id)).where(
+                ApplicationModel.name.ilike(f"%{name}%")
+            )
+            result = await self.db.execute(stmt)
+            return result.scalar() or 0
+            
+        except Exception as e:
+            raise Exception(f"Error counting applications by name: {str(e)}")
+    
     async def count_total(self) -> int:
         """Get total count of applications"""
         try:
@@ -220,16 +284,36 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
         except Exception as e:
             raise Exception(f"Error counting total applications: {str(e)}")
     
+    async def get_summary_by_cedula(self, cedula: str) -> dict:
+        """Get application count and latest created_at for a cedula in one query"""
+        try:
+            stmt = select(
+                func.count(ApplicationModel.id),
+                func.max(ApplicationModel.created_at)
+            ).where(ApplicationModel.cedula == cedula)
+            result = await self.db.execute(stmt)
+            total, latest_created_at = result.one()
+            
+            return {
+                "total": total or 0,
+                "latest_created_at": latest_created_at
+            }
+            
+        except Exception as e:
+            raise Exception(f"Error getting application summary by cedula: {str(e)}")
+    
     async def get_statistics(self) -> dict:
         """Get application statistics (counts by convenio, etc.)"""
         try:
-            # Total count
-            total = await self.count_total()
-            
-            # Count by convenio
+            # Count by convenio; the groups cover every row, so the total comes from them too
             stmt = select(ApplicationModel.convenio, func.count(ApplicationModel.id)).group_by(ApplicationModel.convenio)
             result = await self.db.execute(stmt)
-            convenio_counts = {row[0] or "Sin convenio": row[1] for row in result.fetchall()}
+            total = 0
+            convenio_counts = {}
+            for convenio, count in result.fetchall():
+                key = convenio or "Sin convenio"
+                convenio_counts[key] = convenio_counts.get(key, 0) + count
+                total += count
             
             # Count by month
             stmt = select(
@@ -246,4 +330,13 @@ class SupabaseLoanApplicationRepository(LoanApplicationRepositoryPort):
             }
             
         except Exception as e:
-            raise Exception(f"Error getting application statistics: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error getting application statistics: {str(e)}")
+    
+    async def commit(self) -> None:
+        """Commit the pending changes of the current transaction"""
+        try:
+            await self.db.commit()
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise Exception(f"Error committing loan application changes: {str(e)}")
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, ForeignKey, Boolean, Enum, Numeric
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, ForeignKey, Boolean, Enum, Numeric, Index, text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -33,6 +33,22 @@ class EstadoCreditoEnum(enum.Enum):
 class ApplicationModel(Base):
     """SQLAlchemy model for loan applications (maps to 'LoanApplication' table)"""
     __tablename__ = "LoanApplication"
+    __table_args__ = (
+        # Trigram index so ILIKE '%name%' searches don't scan the whole table (requires pg_trgm)
+        Index(
+            "loan_application_name_trgm_idx",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        # Lookups by cedula come back newest first straight from the index, no sort step
+        Index(
+            "loan_application_cedula_created_idx",
+            "cedula",
+            text("created_at DESC"),
+            text("id DESC")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -46,6 +62,22 @@ class ApplicationModel(Base):
 class ClientModel(Base):
     """SQLAlchemy model for clients (maps to 'Client' table)"""
     __tablename__ = "Client"
+    __table_args__ = (
+        # Trigram index so ILIKE '%name%' searches don't scan the whole table (requires pg_trgm)
+        Index(
+            "client_nombre_completo_trgm_idx",
+            "nombre_completo",
+            postgresql_using="gin",
+            postgresql_ops={"nombre_completo": "gin_trgm_ops"}
+        ),
+        # search() matches name OR cedula; both sides need an index or the OR falls back to a seq scan
+        Index(
+            "client_cedula_trgm_idx",
+            "cedula",
+            postgresql_using="gin",
+            postgresql_ops={"cedula": "gin_trgm_ops"}
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -58,8 +90,10 @@ class ClientModel(Base):
     info_adicional = Column(JSON, nullable=True)
     
     # Relationship with credits and documents
-    credits = relationship("CreditModel", back_populates="client")
-    documents = relationship("ClientDocumentModel", back_populates="client")
+    # lazy="raise": entities are built from columns only, so any implicit
+    # per-row load (N+1) fails loudly instead of issuing hidden queries
+    credits = relationship("CreditModel", back_populates="client", lazy="raise")
+    documents = relationship("ClientDocumentModel", back_populates="client", lazy="raise")
 
 
 class CreditModel(Base):
@@ -76,8 +110,8 @@ class CreditModel(Base):
     client_id = Column(Integer, ForeignKey("Client.id"), nullable=False)
     
     # Relationship with client and documents
-    client = relationship("ClientModel", back_populates="credits")
-    documents = relationship("ClientDocumentModel", back_populates="credit")
+    client = relationship("ClientModel", back_populates="credits", lazy="raise")
+    documents = relationship("ClientDocumentModel", back_populates="credit", lazy="raise")
 
 
 class AdminModel(Base):
@@ -116,8 +150,8 @@ class ClientDocumentModel(Base):
     credit_id = Column(Integer, ForeignKey("Credit.id"), nullable=True)
     
     # Relationships
-    client = relationship("ClientModel", back_populates="documents")
-    credit = relationship("CreditModel", back_populates="documents")
+    client = relationship("ClientModel", back_populates="documents", lazy="raise")
+    credit = relationship("CreditModel", back_populates="documents", lazy="raise")
 
 
 class ProcessingStatusEnum(str, enum.Enum):
@@ -147,12 +181,46 @@ class ContextDocumentModel(Base):
     )
     
     # Relationship with chunks
-    chunks = relationship("ChunkModel", back_populates="document", cascade="all, delete-orphan")
+    # passive_deletes: let the FK's ON DELETE CASCADE remove chunks instead of
+    # loading them and issuing one DELETE per chunk
+    chunks = relationship(
+        "ChunkModel",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
+    )
 
 
 class ChunkModel(Base):
     """SQLAlchemy model for RAG chunks (maps to 'Chunk' table)"""
     __tablename__ = "Chunk"
+    __table_args__ = (
+        # ANN index for the candidate search in search_similar (cosine distance).
+        # Replaced by the halfvec index below; migration 004 drops it once
+        # CHUNK_SEARCH_HALFVEC is on, and init_db skips it from then on
+        Index(
+            "chunk_embedding_hnsw_idx",
+            text("embedding vector_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
+        # Same index over vectors quantized to half precision (halfvec): half
+        # the index size and memory bandwidth; the final similarity is still
+        # computed on the full vector
+        Index(
+            "chunk_embedding_halfvec_hnsw_idx",
+            text("(CAST(embedding AS halfvec(1536))) halfvec_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
+        # Full-text side of hybrid search; queries must use this exact expression
+        Index(
+            "chunk_content_tsv_idx",
+            text("to_tsvector('spanish', content)"),
+            postgresql_using="gin",
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -162,4 +230,4 @@ class ChunkModel(Base):
     # Note: embedding column is vector type, handled separately via raw SQL for pgvector
     
     # Relationship with document
-    document = relationship("ContextDocumentModel", back_populates="chunks")
\ No newline at end of file
+    document = relationship("ContextDocumentModel", back_populates="chunks", lazy="raise")
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterator, List, Optional
 from openai import AsyncOpenAI
 from src.domain.ports.embedding_port import EmbeddingPort
 from src.domain.ports.llm_port import LLMPort
@@ -23,6 +24,12 @@ Información básica de KrediPlus que siempre puedes mencionar:
 - Simplifica procesos de solicitud y aprobación de créditos"""
 
 
+# Inputs per embeddings request (~1000-char chunks keep this far below the per-request token cap)
+EMBEDDING_BATCH_SIZE = 128
+# Embedding requests in flight at once for a single document
+EMBEDDING_MAX_CONCURRENCY = 4
+
+
 class OpenAIAdapter(EmbeddingPort, LLMPort):
     """
     OpenAI adapter implementing EmbeddingPort and LLMPort.
@@ -51,15 +58,34 @@ class OpenAIAdapter(EmbeddingPort, LLMPort):
             raise Exception(f"Error generating embedding: {str(e)}")
     
     async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts in batch."""
+        """
+        Generate embeddings for multiple texts in batch.
+        
+        Sends EMBEDDING_BATCH_SIZE texts per request, at most
+        EMBEDDING_MAX_CONCURRENCY requests at a time, and keeps input order.
+        """
+        if not texts:
+            return []
+        
+        semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+        
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=batch
+                )
+                return [item.embedding for item in response.data]
+        
         try:
-            response = await self.client.embeddings.create(
-                model=self.embedding_model,
-                input=texts
-            )
-            return [item.embedding for item in response.data]
+            results = await asyncio.gather(*(
+                embed(texts[start:start + EMBEDDING_BATCH_SIZE])
+                for start in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+            ))
         except Exception as e:
             raise Exception(f"Error generating batch embeddings: {str(e)}")
+        
+        return [embedding for batch in results for embedding in batch]
     
     # LLMPort implementation
     async def generate_response(self, query: str, context: str) -> str:
@@ -74,22 +100,9 @@ class OpenAIAdapter(EmbeddingPort, LLMPort):
     ) -> str:
         """Generate a response with conversation history."""
         try:
-            messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-            
-            # Add conversation history
-            if history:
-                for msg in history:
-                    messages.append({"role": msg["role"], "content": msg["content"]})
-            
-            # Add current question with context
-            messages.append({
-                "role": "user",
-                "content": f"Contexto: {context}\n\nPregunta: {query}"
-            })
-            
             response = await self.client.chat.completions.create(
                 model=self.chat_model,
-                messages=messages,
+                messages=self._history_messages(query, context, history),
                 temperature=0.7,
                 max_tokens=1000
             )
@@ -98,6 +111,44 @@ class OpenAIAdapter(EmbeddingPort, LLMPort):
         except Exception as e:
             raise Exception(f"Error generating response: {str(e)}")
     
+    async def stream_response_with_history(
+        self,
+        query: str,
+        context: str,
+        history: Optional[List[dict]] = None
+    ) -> AsyncIterator[str]:
+        """Stream a response with conversation history, one text delta at a time."""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.chat_model,
+                messages=self._history_messages(query, context, history),
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise Exception(f"Error generating response: {str(e)}")
+    
+    def _history_messages(self, query: str, context: str, history: Optional[List[dict]]) -> List[dict]:
+        """Build the chat messages: system prompt, history, then the question with context"""
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        
+        # Add conversation history
+        if history:
+            for msg in history:
+                messages.append({"role": msg["role"], "content": msg["content"]})
+        
+        # Add current question with context
+        messages.append({
+            "role": "user",
+            "content": f"Contexto: {context}\n\nPregunta: {query}"
+        })
+        return messages
+    
     async def generate_response_with_system_prompt(
         self, 
         query: str, 
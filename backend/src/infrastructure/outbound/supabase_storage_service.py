@@ -1,6 +1,8 @@
+import asyncio
 import uuid
 import os
-from typing import Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
+import httpx
 from supabase import create_client, Client
 from src.config import SUPABASE_URL, SUPABASE_SERVICE_KEY
 from src.domain.ports.storage_port import StoragePort
@@ -12,6 +14,26 @@ class SupabaseStorageService(StoragePort):
     def __init__(self):
         self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
         self.bucket_name = "krediplus_docs"
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Lazily build the shared async client used for streamed uploads"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                base_url=f"{SUPABASE_URL}/storage/v1",
+                headers={
+                    "apikey": SUPABASE_SERVICE_KEY,
+                    "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}"
+                },
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client (called on app shutdown)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     def generate_unique_filename(self, document_type: str, original_filename: str) -> str:
         """
@@ -51,31 +73,47 @@ class SupabaseStorageService(StoragePort):
         """
         return f"client_files/{client_id}/{filename}"
     
-    async def upload_file(self, file_content: bytes, storage_path: str) -> bool:
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        storage_path: str,
+        content_type: str = "application/octet-stream",
+        content_length: Optional[int] = None
+    ) -> bool:
         """
-        Upload file to Supabase Storage
+        Upload file to Supabase Storage streaming the request body
+        
+        Only one chunk is held in memory at a time instead of the whole file.
         
         Args:
-            file_content: File content as bytes
+            chunks: Async iterator with the file content
             storage_path: Full storage path for the file
+            content_type: MIME type stored with the object
+            content_length: Total size in bytes, if known (avoids chunked encoding)
             
         Returns:
-            True if upload successful, False otherwise
+            True if upload successful
             
         Raises:
             Exception: If upload fails
         """
+        headers = {
+            "Content-Type": content_type,
+            "cache-control": "max-age=3600",
+            "x-upsert": "false"
+        }
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        
         try:
-            # Upload file to Supabase Storage
-            response = self.supabase.storage.from_(self.bucket_name).upload(
-                path=storage_path,
-                file=file_content,
-                file_options={"content-type": "application/octet-stream"}
+            response = await self._get_http_client().post(
+                f"/object/{self.bucket_name}/{storage_path}",
+                content=chunks,
+                headers=headers
             )
             
-            # Check if upload was successful
-            if hasattr(response, 'error') and response.error:
-                raise Exception(f"Supabase Storage error: {response.error}")
+            if response.is_error:
+                raise Exception(f"Supabase Storage error: {response.status_code} {response.text}")
             
             return True
             
@@ -93,7 +131,10 @@ class SupabaseStorageService(StoragePort):
             True if deletion successful, False otherwise
         """
         try:
-            response = self.supabase.storage.from_(self.bucket_name).remove([storage_path])
+            # The Supabase client is synchronous; keep it off the event loop
+            response = await asyncio.to_thread(
+                self.supabase.storage.from_(self.bucket_name).remove, [storage_path]
+            )
             
             if hasattr(response, 'error') and response.error:
                 raise Exception(f"Supabase Storage error: {response.error}")
@@ -144,4 +185,37 @@ class SupabaseStorageService(StoragePort):
             return response.get('signedURL', '')
             
         except Exception as e:
-            raise Exception(f"Error creating signed URL: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error creating signed URL: {str(e)}")
+    
+    async def create_signed_urls(self, storage_paths: List[str], expires_in: int = 3600) -> List[str]:
+        """
+        Create signed URLs for several files with a single Storage request
+        
+        Args:
+            storage_paths: Full storage paths of the files
+            expires_in: URL expiration time in seconds (default: 1 hour)
+            
+        Returns:
+            Signed URLs in the same order as storage_paths
+        """
+        if not storage_paths:
+            return []
+        
+        try:
+            # The Supabase client is synchronous; keep it off the event loop
+            response = await asyncio.to_thread(
+                self.supabase.storage.from_(self.bucket_name).create_signed_urls,
+                storage_paths,
+                expires_in
+            )
+            
+            signed_by_path = {}
+            for item in response:
+                if item.get('error'):
+                    raise Exception(f"Supabase Storage error for {item.get('path')}: {item['error']}")
+                signed_by_path[item.get('path')] = item.get('signedURL', '')
+            
+            return [signed_by_path.get(path, '') for path in storage_paths]
+            
+        except Exception as e:
+            raise Exception(f"Error creating signed URLs: {str(e)}")
@@ -1,6 +1,12 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from src.config import DEBUG, HOST, PORT, CORS_ORIGINS
+from src.application.exceptions import LoanApplicationError
+from src.application.services.storage_cleanup import wait_for_storage_deletions
+from src.application.services.document_processors.pdf_processor import shutdown_pdf_process_pool
 from src.infrastructure.inbound.api.routes.loan_applications import router as loan_applications_router
 from src.infrastructure.inbound.api.routes.clients import router as clients_router
 from src.infrastructure.inbound.api.routes.credits import router as credits_router
@@ -8,13 +14,41 @@ from src.infrastructure.inbound.api.routes.credit_simulator import router as cre
 from src.infrastructure.inbound.api.routes.documents import router as documents_router
 from src.infrastructure.inbound.api.routes.rag_documents import router as rag_documents_router
 from src.infrastructure.inbound.api.routes.chat import router as chat_router
+from src.infrastructure.inbound.api.dependencies import MAX_FILE_SIZE
+from src.infrastructure.inbound.api.middleware.body_size_middleware import BodySizeLimitMiddleware
+from src.infrastructure.outbound.openai_adapter import OpenAIAdapter
+from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build external adapters once and share them across requests"""
+    app.state.openai_adapter = OpenAIAdapter()
+    app.state.storage_service = SupabaseStorageService()
+    yield
+    await wait_for_storage_deletions()
+    await app.state.storage_service.aclose()
+    shutdown_pdf_process_pool()
 
 
 app = FastAPI(
     title="KrediPlus RAG Backend",
     description="Backend RAG con Supabase Auth y OpenAI",
     version="0.1.0",
-    debug=DEBUG
+    debug=DEBUG,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Compress JSON bodies over 1KB (admin lists, chat sources); smaller ones aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Reject oversized uploads from Content-Length, before the body is spooled.
+# Added before CORS so the 413 still carries the CORS headers.
+MULTIPART_OVERHEAD = 1024 * 1024  # Form fields and multipart boundaries
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={"/api/v1/documents/upload": MAX_FILE_SIZE + MULTIPART_OVERHEAD}
 )
 
 # CORS Configuration - Only allow specific frontend origins
@@ -26,6 +60,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(LoanApplicationError)
+async def loan_application_error_handler(request: Request, exc: LoanApplicationError):
+    """Answer expected loan application errors; anything else falls through to the default 500"""
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+
+
 # Include routers
 app.include_router(loan_applications_router, prefix="/api/v1")
 app.include_router(clients_router, prefix="/api/v1")
@@ -90,10 +90,11 @@ def mock_async_repository():
 def mock_storage_service():
     """Fixture that provides a mock storage service"""
     mock = Mock()
-    mock.upload_file = AsyncMock()
+    mock.upload_stream = AsyncMock()
     mock.delete_file = AsyncMock()
     mock.generate_unique_filename = Mock()
     mock.build_storage_path = Mock()
     mock.get_public_url = Mock()
     mock.create_signed_url = Mock()
+    mock.create_signed_urls = AsyncMock()
     return mock
@@ -0,0 +1,143 @@
+"""
+Unit tests for Chat API routes
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.inbound.api.routes.chat import chat, get_chat_service
+from src.infrastructure.outbound.database.connection import get_db_session
+from src.main import app
+from src.application.dtos.chat_dtos import ChatRequest, ChatResponse, ChunkReferenceDto, Message
+from src.application.services import chat_service
+
+
+class TestChat:
+    """Test chat endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_chat_success(self):
+        """Test chat returns the service response and releases the session before the LLM call"""
+        # Arrange
+        request = ChatRequest(
+            question="¿Qué es KrediPlus?",
+            history=[Message(role="user", content="Hola")]
+        )
+        expected = ChatResponse(
+            response="KrediPlus es una fintech",
+            sources=[
+                ChunkReferenceDto(
+                    chunk_id=1,
+                    document_id=10,
+                    content_preview="KrediPlus ofrece...",
+                    similarity=0.9
+                )
+            ],
+            processing_time=0.5,
+            query="¿Qué es KrediPlus?"
+        )
+        # The service returns its own dataclasses, not the DTOs
+        service_result = chat_service.ChatResponse(
+            response="KrediPlus es una fintech",
+            sources=[
+                chat_service.ChunkReference(
+                    chunk_id=1,
+                    document_id=10,
+                    content_preview="KrediPlus ofrece...",
+                    similarity=0.9,
+                    metadata={}
+                )
+            ],
+            processing_time=0.5,
+            query="¿Qué es KrediPlus?"
+        )
+        retrieval = MagicMock()
+        mock_service = AsyncMock()
+        mock_service.retrieve_context.return_value = retrieval
+        mock_service.generate_answer.return_value = service_result
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        # Act
+        result = await chat(request, mock_service, mock_db)
+
+        # Assert
+        assert ChatResponse.model_validate_json(result.body) == expected
+        mock_db.close.assert_awaited_once()
+        mock_service.generate_answer.assert_called_once_with(
+            retrieval, [{"role": "user", "content": "Hola"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_chat_internal_error(self):
+        """Test chat with unexpected service error"""
+        # Arrange
+        request = ChatRequest(question="pregunta")
+        mock_service = AsyncMock()
+        mock_service.retrieve_context.side_effect = Exception("Embedding error")
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await chat(request, mock_service, mock_db)
+
+        assert exc_info.value.status_code == 500
+        assert "Error processing chat request" in exc_info.value.detail
+
+
+class TestChatStream:
+    """Test the streaming chat endpoint"""
+
+    @pytest.fixture
+    def mock_service(self):
+        mock_service = MagicMock()
+        mock_service.retrieve_context = AsyncMock(return_value=MagicMock())
+        mock_db = AsyncMock(spec=AsyncSession)
+        app.dependency_overrides[get_chat_service] = lambda: mock_service
+        app.dependency_overrides[get_db_session] = lambda: mock_db
+        yield mock_service
+        app.dependency_overrides.clear()
+
+    def _events(self, body):
+        events = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.split("\n"))
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_emits_sources_tokens_and_done(self, mock_service):
+        """Test the answer is sent as sources, token and done events"""
+        source = chat_service.ChunkReference(
+            chunk_id=1, document_id=10, content_preview="KrediPlus ofrece...", similarity=0.9, metadata={}
+        )
+        final = chat_service.ChatResponse(
+            response="KrediPlus es", sources=[source], processing_time=0.5, query="¿Qué es KrediPlus?"
+        )
+
+        async def stream_answer(retrieval, history):
+            yield [source]
+            yield "Kredi"
+            yield "Plus es"
+            yield final
+
+        mock_service.stream_answer = stream_answer
+
+        response = TestClient(app).post("/api/v1/chat/stream", json={"question": "¿Qué es KrediPlus?"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._events(response.text)
+        assert [name for name, _ in events] == ["sources", "token", "token", "done"]
+        assert events[0][1][0]["chunk_id"] == 1
+        assert events[1][1] + events[2][1] == "KrediPlus es"
+        assert ChatResponse.model_validate(events[3][1]).response == "KrediPlus es"
+
+    def test_stream_retrieval_error_returns_500(self, mock_service):
+        """Test errors before streaming starts become a 500"""
+        mock_service.retrieve_context.side_effect = Exception("Embedding error")
+
+        response = TestClient(app).post("/api/v1/chat/stream", json={"question": "pregunta"})
+
+        assert response.status_code == 500
@@ -0,0 +1,438 @@
+"""
+Unit tests for ChatService
+"""
+import threading
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.application.services import chat_service as chat_service_module
+from src.application.services.chat_service import (
+    ChatResponse,
+    ChatService,
+    RetrievalResult,
+    clear_query_embedding_cache,
+    clear_semantic_response_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_chat_caches():
+    clear_query_embedding_cache()
+    clear_semantic_response_cache()
+    yield
+    clear_query_embedding_cache()
+    clear_semantic_response_cache()
+
+
+@pytest.fixture
+def chunk_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def embedding_port():
+    mock = AsyncMock()
+    mock.generate_embedding.return_value = [0.1, 0.2, 0.3]
+    return mock
+
+
+@pytest.fixture
+def llm_port():
+    mock = AsyncMock()
+    mock.generate_response_with_history.return_value = "Respuesta generada"
+    return mock
+
+
+@pytest.fixture
+def chat_service(chunk_repository, embedding_port, llm_port):
+    return ChatService(
+        chunk_repository=chunk_repository,
+        embedding_port=embedding_port,
+        llm_port=llm_port
+    )
+
+
+@pytest.fixture
+def sample_chunks():
+    return [
+        {
+            "id": 1,
+            "content": "KrediPlus ofrece créditos para PYMEs",
+            "metadata": {"source_file": "info.pdf"},
+            "document_id": 10,
+            "similarity": 0.91
+        }
+    ]
+
+
+class TestRetrieveContext:
+    """Test the retrieval (database) phase"""
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_returns_chunks(self, chat_service, chunk_repository, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        result = await chat_service.retrieve_context("  ¿Qué es KrediPlus?  ")
+
+        assert isinstance(result, RetrievalResult)
+        assert result.query == "¿Qué es KrediPlus?"
+        assert result.chunks == sample_chunks
+        assert result.response is None
+        assert chunk_repository.search_similar.call_args.kwargs["query_text"] == "¿Qué es KrediPlus?"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_empty_query(self, chat_service, embedding_port):
+        result = await chat_service.retrieve_context("   ")
+
+        assert result.response is not None
+        assert result.response.response == "Por favor, escribe una pregunta."
+        embedding_port.generate_embedding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_no_chunks(self, chat_service, chunk_repository):
+        chunk_repository.search_similar.return_value = []
+
+        result = await chat_service.retrieve_context("pregunta")
+
+        assert result.response is not None
+        assert "No encontré información relevante" in result.response.response
+
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_drops_duplicate_chunks(self, chat_service, chunk_repository, sample_chunks):
+        duplicate = dict(sample_chunks[0], id=2, similarity=0.88)
+        other = dict(sample_chunks[0], id=3, content="Requisitos para solicitar un crédito")
+        chunk_repository.search_similar.return_value = sample_chunks + [duplicate, other]
+
+        result = await chat_service.retrieve_context("¿Qué es KrediPlus?")
+
+        assert [chunk["id"] for chunk in result.chunks] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_keeps_chunks_sharing_a_header(self, chat_service, chunk_repository):
+        header = "KrediPlus S.A.S. - Manual de políticas de crédito - Versión 2024 - "
+        chunk_repository.search_similar.return_value = [
+            {"id": 1, "content": header + "Requisitos del solicitante"},
+            {"id": 2, "content": header + "Plazos disponibles"},
+            {"id": 3, "content": "  " + header + "Requisitos del\nsolicitante"},
+        ]
+
+        result = await chat_service.retrieve_context("pregunta")
+
+        assert [chunk["id"] for chunk in result.chunks] == [1, 2]
+
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_caps_context_size(self, chat_service, chunk_repository, monkeypatch):
+        monkeypatch.setattr(chat_service_module, "CONTEXT_MAX_CHARS", 25)
+        chunk_repository.search_similar.return_value = [
+            {"id": i, "content": f"{i} " + "x" * 10} for i in range(1, 5)
+        ]
+
+        result = await chat_service.retrieve_context("pregunta")
+
+        assert [chunk["id"] for chunk in result.chunks] == [1, 2]
+
+
+class TestEmptyKnowledgeBase:
+    """Test the short-circuit when no chunk is stored"""
+
+    @pytest.mark.asyncio
+    async def test_empty_knowledge_base_skips_embedding(self, chat_service, chunk_repository, embedding_port):
+        chunk_repository.has_chunks.return_value = False
+
+        result = await chat_service.retrieve_context("¿Qué es KrediPlus?")
+
+        assert "Aún no hay documentos disponibles" in result.response.response
+        embedding_port.generate_embedding.assert_not_called()
+        chunk_repository.search_similar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_knowledge_base_check_is_cached(self, chat_service, chunk_repository, sample_chunks):
+        chunk_repository.has_chunks.return_value = True
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        await chat_service.retrieve_context("primera pregunta")
+        await chat_service.retrieve_context("segunda pregunta")
+
+        chunk_repository.has_chunks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_documents_changing_resets_the_check(self, chat_service, chunk_repository, sample_chunks):
+        chunk_repository.has_chunks.return_value = False
+        await chat_service.retrieve_context("pregunta")
+
+        clear_semantic_response_cache()
+        chunk_repository.has_chunks.return_value = True
+        chunk_repository.search_similar.return_value = sample_chunks
+        result = await chat_service.retrieve_context("pregunta")
+
+        assert result.chunks == sample_chunks
+
+    @pytest.mark.asyncio
+    async def test_check_error_falls_back_to_search(self, chat_service, chunk_repository, sample_chunks):
+        chunk_repository.has_chunks.side_effect = Exception("DB error")
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        result = await chat_service.retrieve_context("pregunta")
+
+        assert result.chunks == sample_chunks
+
+
+class TestQueryEmbeddingCache:
+    """Test reuse of query embeddings across requests"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_embedding(self, chat_service, chunk_repository, embedding_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        await chat_service.retrieve_context("¿Qué es KrediPlus?")
+        await chat_service.retrieve_context("  ¿qué es   KrediPlus? ")
+
+        embedding_port.generate_embedding.assert_awaited_once_with("¿Qué es KrediPlus?")
+        assert chunk_repository.search_similar.call_args.kwargs["query_embedding"] == [0.1, 0.2, 0.3]
+
+    @pytest.mark.asyncio
+    async def test_expired_embedding_is_regenerated(self, chat_service, chunk_repository, embedding_port, sample_chunks, monkeypatch):
+        chunk_repository.search_similar.return_value = sample_chunks
+        monkeypatch.setattr(chat_service_module, "QUERY_EMBEDDING_TTL_SECONDS", -1.0)
+
+        await chat_service.retrieve_context("pregunta")
+        await chat_service.retrieve_context("pregunta")
+
+        assert embedding_port.generate_embedding.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, chat_service, chunk_repository, embedding_port, sample_chunks, monkeypatch):
+        chunk_repository.search_similar.return_value = sample_chunks
+        monkeypatch.setattr(chat_service_module, "QUERY_EMBEDDING_CACHE_MAX_ENTRIES", 2)
+
+        await chat_service.retrieve_context("uno")
+        await chat_service.retrieve_context("dos")
+        await chat_service.retrieve_context("uno")  # hit: "dos" becomes the oldest
+        await chat_service.retrieve_context("tres")  # evicts "dos"
+        await chat_service.retrieve_context("uno")
+
+        assert [c.args[0] for c in embedding_port.generate_embedding.await_args_list] == ["uno", "dos", "tres"]
+
+    @pytest.mark.asyncio
+    async def test_embedding_error_is_not_cached(self, chat_service, chunk_repository, embedding_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        embedding_port.generate_embedding.side_effect = [Exception("timeout"), [0.4, 0.5]]
+
+        first = await chat_service.retrieve_context("pregunta")
+        second = await chat_service.retrieve_context("pregunta")
+
+        assert first.response is not None
+        assert second.response is None
+        assert embedding_port.generate_embedding.await_count == 2
+
+
+class TestSemanticResponseCache:
+    """Test reuse of answers for near-identical questions"""
+
+    @pytest.mark.asyncio
+    async def test_similar_question_reuses_answer(self, chat_service, chunk_repository, embedding_port, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        embedding_port.generate_embedding.side_effect = [[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]]
+
+        first = await chat_service.process_query("¿Qué es KrediPlus?")
+        second = await chat_service.process_query("¿Que es Krediplus?")
+
+        assert second.response == first.response
+        assert second.sources == first.sources
+        assert second.query == "¿Que es Krediplus?"
+        llm_port.generate_response_with_history.assert_awaited_once()
+        chunk_repository.search_similar.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_embedding(self, chat_service, chunk_repository, embedding_port, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        first = await chat_service.process_query("¿Qué es KrediPlus?")
+        clear_query_embedding_cache()
+        second = await chat_service.process_query("  ¿qué es KrediPlus?")
+
+        assert second.response == first.response
+        embedding_port.generate_embedding.assert_awaited_once()
+        llm_port.generate_response_with_history.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_question_calls_llm(self, chat_service, chunk_repository, embedding_port, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        embedding_port.generate_embedding.side_effect = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+        await chat_service.process_query("¿Qué es KrediPlus?")
+        await chat_service.process_query("¿Cuál es la tasa?")
+
+        assert llm_port.generate_response_with_history.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_similarity_scan_runs_off_the_event_loop(self, chat_service, chunk_repository, embedding_port, sample_chunks, monkeypatch):
+        chunk_repository.search_similar.return_value = sample_chunks
+        embedding_port.generate_embedding.side_effect = [[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]]
+        scan = chat_service_module._most_similar_key
+        threads = []
+
+        def record_thread(query_vector, candidates):
+            threads.append(threading.current_thread())
+            return scan(query_vector, candidates)
+
+        monkeypatch.setattr(chat_service_module, "_most_similar_key", record_thread)
+
+        await chat_service.process_query("¿Qué es KrediPlus?")
+        await chat_service.process_query("¿Que es Krediplus?")
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_questions_with_history_are_not_cached(self, chat_service, chunk_repository, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        history = [{"role": "user", "content": "Hola"}]
+
+        await chat_service.process_query("pregunta", history)
+        await chat_service.process_query("pregunta", history)
+        await chat_service.process_query("pregunta")
+
+        assert llm_port.generate_response_with_history.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_answer_is_not_cached(self, chat_service, chunk_repository, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        llm_port.generate_response_with_history.side_effect = [Exception("LLM down"), "Respuesta"]
+
+        await chat_service.process_query("pregunta")
+        result = await chat_service.process_query("pregunta")
+
+        assert result.response == "Respuesta"
+        assert llm_port.generate_response_with_history.await_count == 2
+
+
+class TestGenerateAnswer:
+    """Test the generation (LLM) phase"""
+
+    @pytest.mark.asyncio
+    async def test_generate_answer_uses_llm(self, chat_service, llm_port, sample_chunks):
+        retrieval = RetrievalResult(query="pregunta", chunks=sample_chunks, start_time=0.0)
+
+        result = await chat_service.generate_answer(retrieval, [])
+
+        assert result.response == "Respuesta generada"
+        assert len(result.sources) == 1
+        assert result.sources[0].chunk_id == 1
+        llm_port.generate_response_with_history.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_answer_skips_llm_for_early_response(self, chat_service, llm_port):
+        retrieval = await chat_service.retrieve_context("")
+
+        result = await chat_service.generate_answer(retrieval)
+
+        assert result is retrieval.response
+        llm_port.generate_response_with_history.assert_not_called()
+
+
+class TestContextBuilders:
+    """Test the prompt context and source list builders"""
+
+    def test_build_context_numbers_sources(self, chat_service, sample_chunks):
+        chunks = sample_chunks + [{"id": 2, "content": "Sin metadata"}]
+
+        context = chat_service._build_context(chunks)
+
+        assert context == (
+            "[Fuente 1: info.pdf]\nKrediPlus ofrece créditos para PYMEs"
+            "\n\n---\n\n"
+            "[Fuente 2: Documento]\nSin metadata"
+        )
+
+    def test_build_sources_truncates_preview(self, chat_service):
+        sources = chat_service._build_sources([{"id": 5, "content": "a" * 250}])
+
+        assert sources[0].content_preview == "a" * 200 + "..."
+        assert sources[0].document_id == 0
+        assert sources[0].metadata == {}
+
+
+def stream_of(*deltas, error=None):
+    """Build a fake stream_response_with_history yielding the given deltas"""
+    async def stream(query, context, history):
+        for delta in deltas:
+            yield delta
+        if error is not None:
+            raise error
+    return stream
+
+
+class TestStreamAnswer:
+    """Test the streamed generation phase"""
+
+    @pytest.mark.asyncio
+    async def test_stream_answer_yields_sources_deltas_then_response(self, chat_service, llm_port, sample_chunks):
+        llm_port.stream_response_with_history = stream_of("Kredi", "Plus")
+        retrieval = RetrievalResult(query="pregunta", chunks=sample_chunks, start_time=0.0)
+
+        items = [item async for item in chat_service.stream_answer(retrieval, [])]
+
+        assert [source.chunk_id for source in items[0]] == [1]
+        assert items[1:3] == ["Kredi", "Plus"]
+        assert isinstance(items[3], ChatResponse)
+        assert items[3].response == "KrediPlus"
+        assert items[3].sources == items[0]
+
+    @pytest.mark.asyncio
+    async def test_stream_answer_error_ends_with_error_response(self, chat_service, llm_port, sample_chunks):
+        llm_port.stream_response_with_history = stream_of("Kre", error=Exception("OpenAI down"))
+        retrieval = RetrievalResult(query="pregunta", chunks=sample_chunks, start_time=0.0)
+
+        items = [item async for item in chat_service.stream_answer(retrieval, [])]
+
+        assert items[1] == "Kre"
+        assert "error generando la respuesta" in items[-1].response
+        assert items[-1].sources == []
+
+    @pytest.mark.asyncio
+    async def test_stream_answer_replays_early_response(self, chat_service, llm_port):
+        retrieval = await chat_service.retrieve_context("")
+
+        items = [item async for item in chat_service.stream_answer(retrieval)]
+
+        assert items == [[], "Por favor, escribe una pregunta.", retrieval.response]
+
+    @pytest.mark.asyncio
+    async def test_streamed_answer_is_cached(self, chat_service, chunk_repository, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        llm_port.stream_response_with_history = stream_of("Respuesta")
+
+        retrieval = await chat_service.retrieve_context("pregunta")
+        [item async for item in chat_service.stream_answer(retrieval)]
+        cached = await chat_service.retrieve_context("pregunta")
+
+        assert cached.response is not None
+        assert cached.response.response == "Respuesta"
+
+
+class TestProcessQuery:
+    """Test the full query flow"""
+
+    @pytest.mark.asyncio
+    async def test_process_query_success(self, chat_service, chunk_repository, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+
+        result = await chat_service.process_query("¿Qué es KrediPlus?", [])
+
+        assert result.response == "Respuesta generada"
+        assert result.query == "¿Qué es KrediPlus?"
+        assert result.sources[0].document_id == 10
+
+    @pytest.mark.asyncio
+    async def test_process_query_llm_error(self, chat_service, chunk_repository, llm_port, sample_chunks):
+        chunk_repository.search_similar.return_value = sample_chunks
+        llm_port.generate_response_with_history.side_effect = Exception("OpenAI down")
+
+        result = await chat_service.process_query("pregunta")
+
+        assert "error generando la respuesta" in result.response
+        assert result.sources == []
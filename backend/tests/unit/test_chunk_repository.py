@@ -0,0 +1,160 @@
+"""
+Unit tests for Chunk Repository
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.outbound.database import chunk_repository
+from src.infrastructure.outbound.database.chunk_repository import SupabaseChunkRepository
+from src.domain.entities.chunk import Chunk
+
+
+def make_chunks(count):
+    return [
+        Chunk(content=f"chunk {i}", documento_id=1, embedding=[0.1, 0.2], metadata={"chunk_index": i})
+        for i in range(count)
+    ]
+
+
+def make_result(ids):
+    result = MagicMock()
+    result.fetchall.return_value = [
+        MagicMock(id=i, created_at=datetime(2024, 1, 15)) for i in ids
+    ]
+    return result
+
+
+class TestCreateBatch:
+    """Test SupabaseChunkRepository.create_batch"""
+
+    def setup_method(self):
+        self.mock_db = AsyncMock(spec=AsyncSession)
+        self.repository = SupabaseChunkRepository(self.mock_db)
+
+    @pytest.mark.asyncio
+    async def test_create_batch_single_insert_and_commit(self):
+        """Test chunks are inserted with one multi-row INSERT and committed once"""
+        chunks = make_chunks(3)
+        self.mock_db.execute.return_value = make_result([10, 11, 12])
+
+        result = await self.repository.create_batch(chunks)
+
+        assert [chunk.id for chunk in result] == [10, 11, 12]
+        self.mock_db.execute.assert_awaited_once()
+        self.mock_db.commit.assert_awaited_once()
+        params = self.mock_db.execute.call_args.args[1]
+        assert params["content_2"] == "chunk 2"
+        assert params["embedding_0"] == "[0.1,0.2]"
+
+    @pytest.mark.asyncio
+    async def test_create_batch_matches_ids_by_insert_order(self):
+        """Test ids are matched to chunks by id order, not by RETURNING row order"""
+        chunks = make_chunks(3)
+        self.mock_db.execute.return_value = make_result([12, 10, 11])
+
+        result = await self.repository.create_batch(chunks)
+
+        assert [chunk.id for chunk in result] == [10, 11, 12]
+        query = str(self.mock_db.execute.call_args.args[0])
+        assert "CAST(:created_at_2 AS timestamptz), 2)" in query
+        assert "ORDER BY row_order" in query
+
+    @pytest.mark.asyncio
+    async def test_create_batch_splits_large_batches(self):
+        """Test one INSERT per CHUNK_INSERT_BATCH_SIZE rows"""
+        chunks = make_chunks(5)
+        self.mock_db.execute.side_effect = [make_result([1, 2]), make_result([3, 4]), make_result([5])]
+
+        with patch.object(chunk_repository, "CHUNK_INSERT_BATCH_SIZE", 2):
+            result = await self.repository.create_batch(chunks)
+
+        assert [chunk.id for chunk in result] == [1, 2, 3, 4, 5]
+        assert self.mock_db.execute.await_count == 3
+        self.mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_batch_error_rolls_back(self):
+        """Test a failed INSERT rolls back and re-raises"""
+        self.mock_db.execute.side_effect = Exception("DB error")
+
+        with pytest.raises(Exception) as exc_info:
+            await self.repository.create_batch(make_chunks(2))
+
+        assert "Error creating chunks batch" in str(exc_info.value)
+        self.mock_db.rollback.assert_awaited_once()
+        self.mock_db.commit.assert_not_awaited()
+
+
+class TestSearchSimilar:
+    """Test SupabaseChunkRepository.search_similar"""
+
+    def setup_method(self):
+        self.mock_db = AsyncMock(spec=AsyncSession)
+        self.repository = SupabaseChunkRepository(self.mock_db)
+
+    @pytest.mark.asyncio
+    async def test_search_similar_hybrid_query(self):
+        """Test ef_search is set and the query matches the HNSW and GIN index expressions"""
+        set_result = MagicMock()
+        search_result = MagicMock()
+        search_result.fetchall.return_value = [
+            MagicMock(id=1, content="texto", metadata={}, document_id=10, similarity=0.9)
+        ]
+        self.mock_db.execute.side_effect = [set_result, search_result]
+
+        result = await self.repository.search_similar([0.1, 0.2], 0.0, 5, query_text="crédito")
+
+        assert result == [{"id": 1, "content": "texto", "metadata": {}, "document_id": 10, "similarity": 0.9}]
+        set_stmt = str(self.mock_db.execute.call_args_list[0].args[0])
+        assert set_stmt == "SET LOCAL hnsw.ef_search = 40"
+        query, params = self.mock_db.execute.call_args_list[1].args
+        assert "ORDER BY distance" in str(query)
+        assert "SELECT id, embedding <=> CAST(:query_embedding AS vector(1536)) AS distance" in str(query)
+        assert "c.embedding <=> CAST(:query_embedding AS vector(1536))" in str(query)
+        assert "to_tsvector('spanish', content) @@ tsquery" in str(query)
+        assert params["query_text"] == "crédito"
+        assert params["query_embedding"] == "[0.1,0.2]"
+
+    @pytest.mark.asyncio
+    async def test_search_similar_halfvec_candidates(self):
+        """Test CHUNK_SEARCH_HALFVEC orders candidates by the halfvec index expression"""
+        self.mock_db.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+
+        with patch.object(chunk_repository, "CHUNK_SEARCH_HALFVEC", True):
+            await self.repository.search_similar([0.1], 0.0, 5)
+
+        query = str(self.mock_db.execute.call_args_list[1].args[0])
+        assert (
+            "SELECT id, CAST(embedding AS halfvec(1536)) <=> CAST(:query_embedding AS halfvec(1536)) AS distance"
+        ) in query
+        assert "c.embedding <=> CAST(:query_embedding AS vector(1536))" in query
+
+    @pytest.mark.asyncio
+    async def test_search_similar_raises_ef_search_for_large_counts(self):
+        """Test ef_search is never below the candidate count"""
+        self.mock_db.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+
+        await self.repository.search_similar([0.1], 0.0, 100)
+
+        set_stmt = str(self.mock_db.execute.call_args_list[0].args[0])
+        assert set_stmt == "SET LOCAL hnsw.ef_search = 100"
+
+    @pytest.mark.asyncio
+    async def test_search_similar_error(self):
+        """Test errors are re-raised with context"""
+        self.mock_db.execute.side_effect = Exception("DB error")
+
+        with pytest.raises(Exception) as exc_info:
+            await self.repository.search_similar([0.1])
+
+        assert "Error searching similar chunks" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_has_chunks(self):
+        """Test has_chunks reads at most one id"""
+        self.mock_db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+
+        assert await self.repository.has_chunks() is False
+        assert "LIMIT" in str(self.mock_db.execute.call_args[0][0])
@@ -83,6 +83,16 @@ class TestEntityToModel:
         assert result.document_type == DocumentTypeEnum.CEDULA_FRENTE
         assert result.client_id == 1
 
+    @pytest.mark.parametrize("document_type", list(DocumentType))
+    def test_every_document_type_round_trips(self, repository, sample_document, document_type):
+        """Test every domain document type maps to the DB enum and back"""
+        sample_document.document_type = document_type
+
+        model = repository._entity_to_model(sample_document)
+
+        assert model.document_type.value == document_type.value
+        assert repository._model_to_entity(model).document_type is document_type
+
 
 class TestCreate:
     """Tests for create method"""
@@ -281,6 +291,43 @@ class TestDelete:
         assert "Error deleting client document" in str(exc_info.value)
 
 
+class TestDeleteIfOwner:
+    """Tests for delete_if_owner method"""
+
+    async def test_delete_if_owner_returns_storage_path(self, repository, mock_db_session):
+        """Test a single DELETE ... RETURNING filtered by owner"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = "client_files/1/cedula_front.pdf"
+        mock_db_session.execute.return_value = mock_result
+
+        result = await repository.delete_if_owner(1, client_id=1)
+
+        assert result == "client_files/1/cedula_front.pdf"
+        mock_db_session.execute.assert_called_once()
+        sql = str(mock_db_session.execute.call_args[0][0])
+        assert sql.startswith("DELETE FROM client_documents")
+        assert "client_id" in sql
+        assert "credit_id" not in sql
+        assert "RETURNING" in sql
+
+    async def test_delete_if_owner_no_match(self, repository, mock_db_session):
+        """Test nothing deleted returns None"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_db_session.execute.return_value = mock_result
+
+        assert await repository.delete_if_owner(1, credit_id=5) is None
+
+    async def test_delete_if_owner_error(self, repository, mock_db_session):
+        """Test delete_if_owner with database error"""
+        mock_db_session.execute.side_effect = Exception("DB Error")
+
+        with pytest.raises(Exception) as exc_info:
+            await repository.delete_if_owner(1)
+
+        assert "Error deleting client document" in str(exc_info.value)
+
+
 class TestGetAll:
     """Tests for get_all method"""
 
@@ -5,7 +5,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from src.application.services.client_document_service import ClientDocumentService
+from src.application.services.client_document_service import (
+    ClientDocumentService,
+    clear_download_url_cache
+)
+from src.application.services.storage_cleanup import wait_for_storage_deletions
+from src.application.dtos.client_document_dtos import ClientDocumentResponse
 from src.domain.entities.client_document import ClientDocument, DocumentType
 
 
@@ -14,6 +19,7 @@ class TestClientDocumentServiceFull:
     
     def setup_method(self):
         """Setup test fixtures"""
+        clear_download_url_cache()
         self.mock_repository = MagicMock()
         self.mock_storage = MagicMock()
         
@@ -46,7 +52,7 @@ class TestUploadDocumentFull(TestClientDocumentServiceFull):
         self.service._storage_service.build_storage_path = MagicMock(
             return_value="clients/100/cedula_frente_123.jpg"
         )
-        self.service._storage_service.upload_file = AsyncMock()
+        self.service._storage_service.upload_stream = AsyncMock()
         self.service._storage_service.get_public_url = MagicMock(
             return_value="https://storage.example.com/cedula.jpg"
         )
@@ -62,6 +68,46 @@ class TestUploadDocumentFull(TestClientDocumentServiceFull):
         assert result["status"] == "success"
         assert result["document_id"] == 1
     
+    @pytest.mark.asyncio
+    async def test_upload_document_streams_in_chunks(self):
+        """Test upload streams the file chunk by chunk to storage"""
+        mock_file = MagicMock()
+        mock_file.filename = "cedula.jpg"
+        mock_file.content_type = "image/jpeg"
+        mock_file.size = 11
+        mock_file.read = AsyncMock(side_effect=[b"first", b"second", b""])
+        
+        received = []
+        
+        async def consume(chunks, storage_path, content_type, content_length):
+            async for chunk in chunks:
+                received.append(chunk)
+            return True
+        
+        self.service._storage_service.generate_unique_filename = MagicMock(
+            return_value="cedula_frente_123.jpg"
+        )
+        self.service._storage_service.build_storage_path = MagicMock(
+            return_value="clients/100/cedula_frente_123.jpg"
+        )
+        self.service._storage_service.upload_stream = AsyncMock(side_effect=consume)
+        self.service._storage_service.get_public_url = MagicMock(
+            return_value="https://storage.example.com/cedula.jpg"
+        )
+        self.mock_repository.create = AsyncMock(return_value=self.sample_document)
+        
+        await self.service.upload_document(
+            file=mock_file,
+            document_type="CEDULA_FRENTE",
+            client_id=100
+        )
+        
+        assert received == [b"first", b"second"]
+        call = self.service._storage_service.upload_stream.call_args
+        assert call.kwargs["content_type"] == "image/jpeg"
+        assert call.kwargs["content_length"] == 11
+        mock_file.read.assert_called_with(64 * 1024)
+    
     @pytest.mark.asyncio
     async def test_upload_document_invalid_type(self):
         """Test upload with invalid document type"""
@@ -128,9 +174,10 @@ class TestUploadDocumentFull(TestClientDocumentServiceFull):
         self.service._storage_service.build_storage_path = MagicMock(
             return_value="clients/100/cedula_123.jpg"
         )
-        self.service._storage_service.upload_file = AsyncMock(
+        self.service._storage_service.upload_stream = AsyncMock(
             side_effect=Exception("Storage error")
         )
+        self.mock_repository.create = AsyncMock(return_value=self.sample_document)
         
         with pytest.raises(Exception) as exc_info:
             await self.service.upload_document(
@@ -140,6 +187,57 @@ class TestUploadDocumentFull(TestClientDocumentServiceFull):
             )
         
         assert "Error al subir el archivo" in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    async def test_upload_document_database_error_cleans_up_file(self):
+        """Test uploaded file is deleted when the row insert fails"""
+        mock_file = MagicMock()
+        mock_file.filename = "cedula.jpg"
+        mock_file.read = AsyncMock(return_value=b"file content")
+        
+        self.service._storage_service.generate_unique_filename = MagicMock(
+            return_value="cedula_123.jpg"
+        )
+        self.service._storage_service.build_storage_path = MagicMock(
+            return_value="clients/100/cedula_123.jpg"
+        )
+        self.service._storage_service.upload_stream = AsyncMock(return_value=True)
+        self.service._storage_service.delete_file = AsyncMock(return_value=True)
+        self.mock_repository.create = AsyncMock(side_effect=Exception("DB down"))
+        
+        with pytest.raises(Exception) as exc_info:
+            await self.service.upload_document(
+                file=mock_file,
+                document_type="CEDULA_FRENTE",
+                client_id=100
+            )
+        
+        assert "Error saving document to database" in str(exc_info.value)
+        self.service._storage_service.delete_file.assert_called_once_with("clients/100/cedula_123.jpg")
+    
+    @pytest.mark.asyncio
+    async def test_upload_document_invalid_entity_skips_upload(self):
+        """Test invalid document data is rejected before uploading"""
+        mock_file = MagicMock()
+        mock_file.filename = "cedula.jpg"
+        mock_file.read = AsyncMock(return_value=b"file content")
+        
+        self.service._storage_service.generate_unique_filename = MagicMock(
+            return_value="cedula_123.jpg"
+        )
+        self.service._storage_service.build_storage_path = MagicMock(
+            return_value="clients/0/cedula_123.jpg"
+        )
+        self.service._storage_service.upload_stream = AsyncMock()
+        
+        with pytest.raises(ValueError, match="Invalid document data"):
+            await self.service.upload_document(
+                file=mock_file,
+                document_type="CEDULA_FRENTE",
+                client_id=0
+            )
+        
+        self.service._storage_service.upload_stream.assert_not_called()
 
 
 class TestGetDocumentsFull(TestClientDocumentServiceFull):
@@ -158,6 +256,20 @@ class TestGetDocumentsFull(TestClientDocumentServiceFull):
         assert len(result) == 1
         assert result[0].id == 1
         assert result[0].client_id == 100
+        assert result[0].created_at == self.sample_document.created_at
+    
+    @pytest.mark.asyncio
+    async def test_get_client_documents_matches_validated_dto(self):
+        """Test the unvalidated DTOs serialize exactly like validated ones"""
+        self.mock_repository.get_by_client_id = AsyncMock(return_value=[self.sample_document])
+        self.service._storage_service.get_public_url = MagicMock(
+            return_value="https://storage.example.com/doc.jpg"
+        )
+        
+        result = await self.service.get_client_documents(100)
+        
+        validated = ClientDocumentResponse.model_validate(result[0].model_dump())
+        assert result[0].model_dump_json(warnings="error") == validated.model_dump_json()
     
     @pytest.mark.asyncio
     async def test_get_client_documents_with_signed_url_fallback(self):
@@ -166,14 +278,54 @@ class TestGetDocumentsFull(TestClientDocumentServiceFull):
         self.service._storage_service.get_public_url = MagicMock(
             side_effect=Exception("Public URL failed")
         )
-        self.service._storage_service.create_signed_url = MagicMock(
-            return_value="https://storage.example.com/signed/doc.jpg"
+        self.service._storage_service.create_signed_urls = AsyncMock(
+            return_value=["https://storage.example.com/signed/doc.jpg"]
         )
         
         result = await self.service.get_client_documents(100)
         
         assert len(result) == 1
-        self.service._storage_service.create_signed_url.assert_called()
+        assert result[0].file_url == "https://storage.example.com/signed/doc.jpg"
+        self.service._storage_service.create_signed_urls.assert_awaited_once_with(
+            ["clients/100/cedula_frente_123.jpg"], expires_in=86400
+        )
+    
+    @pytest.mark.asyncio
+    async def test_get_client_documents_signs_only_failed_urls_in_one_batch(self):
+        """Test documents without a public URL share one signed-URL request"""
+        documents = [
+            ClientDocument(
+                id=index,
+                file_name=f"doc{index}.pdf",
+                storage_path=f"clients/100/doc{index}.pdf",
+                document_type=DocumentType.OTRO,
+                client_id=100,
+                created_at=datetime.now()
+            )
+            for index in range(1, 4)
+        ]
+        self.mock_repository.get_by_client_id = AsyncMock(return_value=documents)
+        
+        def public_url(path):
+            if path.endswith("doc2.pdf"):
+                return "https://storage.example.com/public/doc2.pdf"
+            raise Exception("Public URL failed")
+        
+        self.service._storage_service.get_public_url = MagicMock(side_effect=public_url)
+        self.service._storage_service.create_signed_urls = AsyncMock(
+            return_value=["https://signed/doc1.pdf", "https://signed/doc3.pdf"]
+        )
+        
+        result = await self.service.get_client_documents(100)
+        
+        assert [doc.file_url for doc in result] == [
+            "https://signed/doc1.pdf",
+            "https://storage.example.com/public/doc2.pdf",
+            "https://signed/doc3.pdf"
+        ]
+        self.service._storage_service.create_signed_urls.assert_awaited_once_with(
+            ["clients/100/doc1.pdf", "clients/100/doc3.pdf"], expires_in=86400
+        )
     
     @pytest.mark.asyncio
     async def test_get_client_documents_repository_error(self):
@@ -228,40 +380,75 @@ class TestDeleteDocumentFull(TestClientDocumentServiceFull):
     
     @pytest.mark.asyncio
     async def test_delete_document_success(self):
-        """Test successful document deletion"""
-        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
-        self.mock_repository.delete = AsyncMock(return_value=True)
+        """Test successful document deletion uses a single conditional delete"""
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=self.sample_document.storage_path)
+        self.mock_repository.get_by_id = AsyncMock()
         self.service._storage_service.delete_file = AsyncMock()
         
         result = await self.service.delete_document(1)
         
         assert result["status"] == "success"
-        self.mock_repository.delete.assert_called_once_with(1)
+        self.mock_repository.delete_if_owner.assert_called_once_with(1, client_id=None, credit_id=None)
+        self.mock_repository.get_by_id.assert_not_called()
+        self.service._storage_service.delete_file.assert_called_once_with(self.sample_document.storage_path)
+    
+    @pytest.mark.asyncio
+    async def test_delete_document_does_not_wait_for_storage(self):
+        """Test the storage deletion runs after the response is built"""
+        deleted = []
+        
+        async def delete_file(storage_path):
+            deleted.append(storage_path)
+        
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=self.sample_document.storage_path)
+        self.service._storage_service.delete_file = delete_file
+        
+        result = await self.service.delete_document(1)
+        
+        assert result["status"] == "success"
+        assert deleted == []
+        await wait_for_storage_deletions()
+        assert deleted == [self.sample_document.storage_path]
+    
+    @pytest.mark.asyncio
+    async def test_delete_document_storage_error_is_swallowed(self):
+        """Test a failing background storage deletion does not raise"""
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=self.sample_document.storage_path)
+        self.service._storage_service.delete_file = AsyncMock(side_effect=Exception("Storage down"))
+        
+        result = await self.service.delete_document(1)
+        await wait_for_storage_deletions()
+        
+        assert result["status"] == "success"
     
     @pytest.mark.asyncio
     async def test_delete_document_not_found(self):
         """Test deletion when document not found"""
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=None)
         self.mock_repository.get_by_id = AsyncMock(return_value=None)
+        self.service._storage_service.delete_file = AsyncMock()
         
         with pytest.raises(ValueError) as exc_info:
             await self.service.delete_document(999)
         
         assert "not found" in str(exc_info.value)
+        self.service._storage_service.delete_file.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_delete_client_document_success(self):
         """Test successful client document deletion"""
-        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
-        self.mock_repository.delete = AsyncMock(return_value=True)
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=self.sample_document.storage_path)
         self.service._storage_service.delete_file = AsyncMock()
         
         result = await self.service.delete_client_document(100, 1)
         
         assert result["status"] == "success"
+        self.mock_repository.delete_if_owner.assert_called_once_with(1, client_id=100, credit_id=None)
     
     @pytest.mark.asyncio
     async def test_delete_client_document_wrong_client(self):
         """Test deletion with wrong client ID"""
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=None)
         self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
         
         with pytest.raises(ValueError) as exc_info:
@@ -272,23 +459,13 @@ class TestDeleteDocumentFull(TestClientDocumentServiceFull):
     @pytest.mark.asyncio
     async def test_delete_credit_document_success(self):
         """Test successful credit document deletion"""
-        doc_with_credit = ClientDocument(
-            id=2,
-            file_name="pagare.pdf",
-            storage_path="clients/100/credits/50/pagare.pdf",
-            document_type=DocumentType.PAGARE_FIRMADO,
-            client_id=100,
-            credit_id=50,
-            created_at=datetime.now()
-        )
-        
-        self.mock_repository.get_by_id = AsyncMock(return_value=doc_with_credit)
-        self.mock_repository.delete = AsyncMock(return_value=True)
+        self.mock_repository.delete_if_owner = AsyncMock(return_value="clients/100/credits/50/pagare.pdf")
         self.service._storage_service.delete_file = AsyncMock()
         
         result = await self.service.delete_credit_document(50, 2)
         
         assert result["status"] == "success"
+        self.mock_repository.delete_if_owner.assert_called_once_with(2, client_id=None, credit_id=50)
     
     @pytest.mark.asyncio
     async def test_delete_credit_document_wrong_credit(self):
@@ -303,6 +480,7 @@ class TestDeleteDocumentFull(TestClientDocumentServiceFull):
             created_at=datetime.now()
         )
         
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=None)
         self.mock_repository.get_by_id = AsyncMock(return_value=doc_with_credit)
         
         with pytest.raises(ValueError) as exc_info:
@@ -348,3 +526,48 @@ class TestGetDocumentDownloadUrl(TestClientDocumentServiceFull):
             await self.service.get_document_download_url(1)
         
         assert "Error creating download URL" in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    async def test_get_download_url_is_cached(self):
+        """Test a signed URL is reused without hitting DB or storage again"""
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
+        self.service._storage_service.create_signed_url = MagicMock(
+            return_value="https://storage.example.com/signed/doc.jpg?token=abc"
+        )
+        
+        first = await self.service.get_document_download_url(1)
+        second = await self.service.get_document_download_url(1)
+        
+        assert first == second
+        self.mock_repository.get_by_id.assert_called_once()
+        self.service._storage_service.create_signed_url.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_download_url_short_expiry_not_cached(self):
+        """Test URLs that expire within the safety margin are not cached"""
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
+        self.service._storage_service.create_signed_url = MagicMock(
+            return_value="https://storage.example.com/signed/doc.jpg?token=abc"
+        )
+        
+        await self.service.get_document_download_url(1, expires_in=60)
+        await self.service.get_document_download_url(1, expires_in=60)
+        
+        assert self.service._storage_service.create_signed_url.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_delete_document_invalidates_cached_url(self):
+        """Test deleting a document drops its cached URL"""
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_document)
+        self.mock_repository.delete_if_owner = AsyncMock(return_value=self.sample_document.storage_path)
+        self.service._storage_service.delete_file = AsyncMock(return_value=True)
+        self.service._storage_service.create_signed_url = MagicMock(
+            return_value="https://storage.example.com/signed/doc.jpg?token=abc"
+        )
+        
+        await self.service.get_document_download_url(1)
+        await self.service.delete_document(1)
+        self.mock_repository.get_by_id = AsyncMock(return_value=None)
+        
+        with pytest.raises(ValueError):
+            await self.service.get_document_download_url(1)
@@ -2,6 +2,7 @@
 Unit tests for Client Repository
 """
 import pytest
+from collections import namedtuple
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +11,9 @@ from src.infrastructure.outbound.database.client_repository import SupabaseClien
 from src.infrastructure.outbound.database.models import ClientModel
 from src.domain.entities.client import Client
 
+# Shape of the rows returned by the combined search query
+SearchRow = namedtuple("SearchRow", ["ClientModel", "total"])
+
 
 class TestSupabaseClientRepository:
     """Test SupabaseClientRepository functionality"""
@@ -443,6 +447,18 @@ class TestGetAllClients(TestSupabaseClientRepository):
         self.mock_db.execute.assert_called_once()
         # Verify that pagination parameters are used in the query
     
+    @pytest.mark.asyncio
+    async def test_get_all_orders_by_id_tiebreaker(self):
+        """Test clients sharing created_at keep a stable order, so pages never overlap or skip rows"""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        self.mock_db.execute.return_value = mock_result
+        
+        await self.repository.get_all(skip=500, limit=500)
+        
+        sql = str(self.mock_db.execute.call_args[0][0])
+        assert 'ORDER BY "Client".created_at DESC, "Client".id DESC' in sql
+    
     @pytest.mark.asyncio
     async def test_get_all_empty_result(self):
         """Test get all clients with empty result"""
@@ -535,6 +551,60 @@ class TestSearchClients(TestSupabaseClientRepository):
         self.mock_db.execute.assert_called_once()
 
 
+class TestCombinedSearch(TestSupabaseClientRepository):
+    """Test the single-query name/cedula search"""
+    
+    @pytest.mark.asyncio
+    async def test_search_returns_page_and_window_total(self):
+        """Test one query returns the page and the total from COUNT(*) OVER ()"""
+        mock_result = MagicMock()
+        mock_result.all.return_value = [SearchRow(self.sample_model, 7)]
+        self.mock_db.execute.return_value = mock_result
+        
+        clients, total = await self.repository.search("1234", skip=0, limit=1)
+        
+        assert total == 7
+        assert clients[0].cedula == "12345678"
+        self.mock_db.execute.assert_called_once()
+        sql = str(self.mock_db.execute.call_args[0][0])
+        assert "count(*) OVER ()" in sql
+        assert 'lower("Client".nombre_completo) LIKE' in sql
+        assert 'lower("Client".cedula) LIKE' in sql
+        assert 'ORDER BY "Client".created_at DESC, "Client".id DESC' in sql
+    
+    @pytest.mark.asyncio
+    async def test_search_first_page_empty(self):
+        """Test no matches gives total 0 without a second query"""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        self.mock_db.execute.return_value = mock_result
+        
+        assert await self.repository.search("zzz") == ([], 0)
+        self.mock_db.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_search_page_past_end_counts(self):
+        """Test an empty later page falls back to a COUNT query"""
+        empty_result = MagicMock()
+        empty_result.all.return_value = []
+        count_result = MagicMock()
+        count_result.scalar.return_value = 3
+        self.mock_db.execute.side_effect = [empty_result, count_result]
+        
+        assert await self.repository.search("Juan", skip=20, limit=10) == ([], 3)
+        assert self.mock_db.execute.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_database_error(self):
+        """Test database errors are wrapped"""
+        self.mock_db.execute.side_effect = Exception("Connection lost")
+        
+        with pytest.raises(Exception) as exc_info:
+            await self.repository.search("Juan")
+        
+        assert "Error searching clients" in str(exc_info.value)
+
+
 class TestUpdateClient(TestSupabaseClientRepository):
     """Test update client functionality"""
     
@@ -5,12 +5,14 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, date
 
-from src.application.services.client_service import ClientService
+from src.application.services import client_service
+from src.application.services.client_service import ClientService, clear_client_by_cedula_cache
 from src.domain.entities.client import Client
 from src.application.dtos.client_dtos import (
     CreateClientRequest,
     UpdateClientRequest,
-    SearchClientsRequest
+    SearchClientsRequest,
+    ClientListResponse
 )
 
 
@@ -19,7 +21,9 @@ class TestClientServiceFull:
     
     def setup_method(self):
         """Setup test fixtures"""
+        clear_client_by_cedula_cache()
         self.mock_repository = MagicMock()
+        self.mock_repository.commit = AsyncMock()
         self.service = ClientService(self.mock_repository)
         
         self.sample_client = Client(
@@ -164,6 +168,55 @@ class TestGetClientFull(TestClientServiceFull):
         result = await self.service.get_client_by_cedula("0000000000")
         
         assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_get_client_by_cedula_is_cached(self):
+        """Test repeated cedula lookups hit the repository once"""
+        self.mock_repository.get_by_cedula = AsyncMock(return_value=self.sample_client)
+        
+        first = await self.service.get_client_by_cedula("1234567890")
+        second = await ClientService(self.mock_repository).get_client_by_cedula("1234567890")
+        
+        assert first == second
+        self.mock_repository.get_by_cedula.assert_called_once_with("1234567890")
+    
+    @pytest.mark.asyncio
+    async def test_get_client_by_cedula_miss_is_not_cached(self):
+        """Test a missing cedula is looked up again (new clients show up immediately)"""
+        self.mock_repository.get_by_cedula = AsyncMock(side_effect=[None, self.sample_client])
+        
+        assert await self.service.get_client_by_cedula("1234567890") is None
+        assert await self.service.get_client_by_cedula("1234567890") is not None
+    
+    @pytest.mark.asyncio
+    async def test_delete_client_evicts_cedula_cache(self):
+        """Test deleting a client drops its cached cedula lookup"""
+        self.mock_repository.get_by_cedula = AsyncMock(return_value=self.sample_client)
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_client)
+        self.mock_repository.delete = AsyncMock(return_value=True)
+        await self.service.get_client_by_cedula("1234567890")
+        
+        await self.service.delete_client(1)
+        self.mock_repository.get_by_cedula = AsyncMock(return_value=None)
+        
+        assert await self.service.get_client_by_cedula("1234567890") is None
+    
+    @pytest.mark.asyncio
+    async def test_update_client_evicts_cedula_cache_after_commit(self):
+        """Test the cached lookup survives until the update is committed"""
+        self.mock_repository.get_by_cedula = AsyncMock(return_value=self.sample_client)
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_client)
+        self.mock_repository.update = AsyncMock(return_value=self.sample_client)
+        await self.service.get_client_by_cedula("1234567890")
+        cached_at_commit = []
+        self.mock_repository.commit = AsyncMock(
+            side_effect=lambda: cached_at_commit.append("1234567890" in client_service._client_by_cedula_cache)
+        )
+        
+        await self.service.update_client(1, UpdateClientRequest(telefono="3009999999"))
+        
+        assert cached_at_commit == [True]
+        assert "1234567890" not in client_service._client_by_cedula_cache
 
 
 class TestUpdateClientFull(TestClientServiceFull):
@@ -281,14 +334,16 @@ class TestSearchClientsFull(TestClientServiceFull):
         """Test search with search term"""
         request = SearchClientsRequest(search_term="Juan", skip=0, limit=10)
         
-        self.mock_repository.search_by_name = AsyncMock(return_value=[self.sample_client])
-        self.mock_repository.search_by_cedula = AsyncMock(return_value=[])
+        self.mock_repository.search = AsyncMock(return_value=([self.sample_client], 1))
         
         result = await self.service.search_clients(request)
         
+        self.mock_repository.search.assert_awaited_once_with("Juan", 0, 10)
         assert result.total == 1
         assert len(result.clients) == 1
         assert result.clients[0].nombre_completo == "Juan Pérez García"
+        # Rows are not re-validated, but the response still serializes cleanly
+        assert ClientListResponse.model_validate_json(result.model_dump_json()) == result
     
     @pytest.mark.asyncio
     async def test_search_clients_without_term(self):
@@ -322,8 +377,7 @@ class TestSearchClientsFull(TestClientServiceFull):
         """Test search with no results"""
         request = SearchClientsRequest(search_term="NoExiste", skip=0, limit=10)
         
-        self.mock_repository.search_by_name = AsyncMock(return_value=[])
-        self.mock_repository.search_by_cedula = AsyncMock(return_value=[])
+        self.mock_repository.search = AsyncMock(return_value=([], 0))
         
         result = await self.service.search_clients(request)
         
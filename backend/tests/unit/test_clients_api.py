@@ -3,7 +3,7 @@ Unit tests for Clients API routes
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +12,7 @@ from src.infrastructure.inbound.api.routes.clients import (
     create_client,
     get_client,
     list_clients,
+    export_clients,
     get_client_by_cedula,
     update_client,
     delete_client,
@@ -23,8 +24,10 @@ from src.infrastructure.inbound.api.routes.clients import (
 from src.application.dtos.client_dtos import (
     CreateClientRequest,
     UpdateClientRequest,
-    ClientResponse
+    ClientResponse,
+    ClientListResponse
 )
+from src.application.dtos.field_types import _latest_birth_date
 from src.application.dtos.credit_dtos import (
     CreateCreditForClientRequest,
     UpdateCreditRequest,
@@ -112,6 +115,114 @@ class TestCreateClient:
         assert "Error creating client" in str(exc_info.value.detail)
 
 
+class TestCreateClientRequestTelefono:
+    """Test the combined Colombian mobile pattern on CreateClientRequest.telefono"""
+    
+    def _request(self, telefono):
+        return CreateClientRequest(
+            nombre_completo="Juan Pérez",
+            cedula="12345678",
+            email="juan@example.com",
+            telefono=telefono,
+            fecha_nacimiento=date(1990, 1, 1),
+            direccion="Calle 123"
+        )
+    
+    @pytest.mark.parametrize("telefono", [
+        "3001234567", "573001234567", "+573001234567", "300 123 4567", "(300) 123-4567", "+57 300-123-4567"
+    ])
+    def test_valid_phones(self, telefono):
+        """Test the three accepted prefixes, with or without separators"""
+        assert self._request(telefono).telefono == telefono
+    
+    @pytest.mark.parametrize("telefono", [
+        "2001234567", "+583001234567", "+3001234567", "30012345678", "5730012345", "300123456a"
+    ])
+    def test_invalid_phones(self, telefono):
+        """Test wrong prefixes, lengths and characters are rejected"""
+        with pytest.raises(ValueError):
+            self._request(telefono)
+
+
+
+class TestCreateClientRequestPatterns:
+    """Test the email and cedula Field patterns on CreateClientRequest"""
+    
+    def _request(self, **overrides):
+        data = dict(
+            nombre_completo="Juan Pérez",
+            cedula="12345678",
+            email="juan@example.com",
+            telefono="3001234567",
+            fecha_nacimiento=date(1990, 1, 1),
+            direccion="Calle 123"
+        )
+        data.update(overrides)
+        return CreateClientRequest(**data)
+    
+    @pytest.mark.parametrize("email", ["juan", "juan@example", "juan@@example.com", "juan @example.com"])
+    def test_invalid_email(self, email):
+        """Test malformed emails are rejected"""
+        with pytest.raises(ValueError):
+            self._request(email=email)
+    
+    @pytest.mark.parametrize("cedula", ["12345678", "1.234.567.890", "12-345-678"])
+    def test_valid_cedula(self, cedula):
+        """Test 7-10 digits are accepted with or without separators"""
+        assert self._request(cedula=cedula).cedula == cedula
+    
+    @pytest.mark.parametrize("cedula", ["12345678901", "1.234.56", "abcdefgh"])
+    def test_invalid_cedula(self, cedula):
+        """Test digit counts outside 7-10 are rejected"""
+        with pytest.raises(ValueError):
+            self._request(cedula=cedula)
+
+
+class TestLatestBirthDate:
+    """Test the birth date cutoff used by the age validators"""
+
+    @pytest.mark.parametrize("today", [
+        date(2024, 2, 29),
+        date(2025, 2, 28),
+        date(2025, 3, 1),
+        date(2025, 12, 31),
+        date(2026, 1, 1),
+    ])
+    @pytest.mark.parametrize("min_age", [18, 22])
+    def test_matches_age_formula(self, today, min_age):
+        """Test v <= cutoff exactly when the computed age is at least min_age"""
+        cutoff = _latest_birth_date(today, min_age)
+        start = date(today.year - min_age - 1, 1, 1)
+        for offset in range(3 * 366):
+            birth = start + timedelta(days=offset)
+            age = today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
+            assert (birth <= cutoff) == (age >= min_age), birth
+
+
+class TestClientResponse:
+    """Test ClientResponse built from database rows"""
+
+    def test_info_adicional_passed_through(self):
+        """Test info_adicional is kept as-is and still serialized to JSON"""
+        info = {"ocupacion": "Ingeniero", "referencias": [{"nombre": "Ana"}]}
+        client = MagicMock(
+            id=1,
+            nombre_completo="Juan Pérez",
+            cedula="12345678",
+            email="juan@example.com",
+            telefono="3001234567",
+            fecha_nacimiento=date(1990, 1, 1),
+            direccion="Calle 123 #45-67",
+            info_adicional=info,
+            created_at=datetime(2024, 1, 1)
+        )
+
+        response = ClientResponse.model_validate(client)
+
+        assert response.info_adicional is info
+        assert ClientResponse.model_validate_json(response.model_dump_json()).info_adicional == info
+
+
 class TestGetClient:
     """Test get_client endpoint"""
     
@@ -195,14 +306,47 @@ class TestGetClientByCedula:
         
         mock_service = AsyncMock()
         mock_service.get_client_by_cedula.return_value = expected_response
+        mock_request = MagicMock()
+        mock_request.headers = {}
         
         # Act
-        result = await get_client_by_cedula(cedula, mock_service)
+        result = await get_client_by_cedula(cedula, mock_request, mock_service)
         
         # Assert
-        assert result == expected_response
+        assert ClientResponse.model_validate_json(result.body) == expected_response
+        assert result.headers["cache-control"] == "private, max-age=10"
+        assert result.headers["etag"].startswith('W/"')
         mock_service.get_client_by_cedula.assert_called_once_with(cedula)
     
+    @pytest.mark.asyncio
+    async def test_get_client_by_cedula_not_modified(self):
+        """Test 304 when the client's ETag still matches"""
+        # Arrange
+        expected_response = ClientResponse(
+            id=1,
+            nombre_completo="Juan Pérez",
+            cedula="12345678",
+            email="juan@example.com",
+            telefono="3001234567",
+            fecha_nacimiento=date(1990, 1, 1),
+            direccion="Calle 123",
+            info_adicional=None,
+            created_at=datetime(2024, 1, 1)
+        )
+        mock_service = AsyncMock()
+        mock_service.get_client_by_cedula.return_value = expected_response
+        mock_request = MagicMock()
+        mock_request.headers = {}
+        first = await get_client_by_cedula("12345678", mock_request, mock_service)
+        mock_request.headers = {"if-none-match": first.headers["etag"]}
+        
+        # Act
+        result = await get_client_by_cedula("12345678", mock_request, mock_service)
+        
+        # Assert
+        assert result.status_code == 304
+        assert result.body == b""
+    
     @pytest.mark.asyncio
     async def test_get_client_by_cedula_not_found(self):
         """Test client retrieval by cedula when not found"""
@@ -213,7 +357,7 @@ class TestGetClientByCedula:
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_client_by_cedula(cedula, mock_service)
+            await get_client_by_cedula(cedula, MagicMock(), mock_service)
         
         assert exc_info.value.status_code == 404
         assert "Client not found" in str(exc_info.value.detail)
@@ -399,52 +543,104 @@ class TestListClients:
     
     @pytest.mark.asyncio
     async def test_list_clients_success(self):
-        """Test successful client listing"""
+        """Test successful paginated client listing"""
         # Arrange
-        mock_db = AsyncMock(spec=AsyncSession)
+        expected_response = ClientListResponse(
+            clients=[
+                ClientResponse(
+                    id=1,
+                    nombre_completo="Juan Pérez",
+                    cedula="12345678",
+                    email="juan@example.com",
+                    telefono="3001234567",
+                    fecha_nacimiento=date(1990, 1, 1),
+                    direccion="Calle 123",
+                    info_adicional=None,
+                    created_at=datetime.now()
+                ),
+                ClientResponse(
+                    id=2,
+                    nombre_completo="María García",
+                    cedula="87654321",
+                    email="maria@example.com",
+                    telefono="3009876543",
+                    fecha_nacimiento=date(1985, 5, 15),
+                    direccion="Calle 456",
+                    info_adicional=None,
+                    created_at=datetime.now()
+                )
+            ],
+            total=2,
+            page=1,
+            page_size=50,
+            total_pages=1
+        )
         
-        # Mock client entities
-        from src.domain.entities.client import Client
-        mock_clients = [
-            Client(
-                id=1,
-                nombre_completo="Juan Pérez",
-                cedula="12345678",
-                email="juan@example.com",
+        mock_service = AsyncMock()
+        mock_service.get_all_clients.return_value = expected_response
+        
+        # Act
+        result = await list_clients(skip=0, limit=50, service=mock_service)
+        
+        # Assert - the DTO is serialized directly, without re-validation
+        assert result.media_type == "application/json"
+        body = ClientListResponse.model_validate_json(result.body)
+        assert body == expected_response
+        assert body.total == 2
+        assert body.clients[0].nombre_completo == "Juan Pérez"
+        mock_service.get_all_clients.assert_called_once_with(skip=0, limit=50)
+    
+    @pytest.mark.asyncio
+    async def test_list_clients_internal_error(self):
+        """Test client listing with internal error"""
+        mock_service = AsyncMock()
+        mock_service.get_all_clients.side_effect = Exception("Database error")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await list_clients(skip=0, limit=50, service=mock_service)
+        
+        assert exc_info.value.status_code == 500
+        assert "Error listing clients" in str(exc_info.value.detail)
+
+
+class TestExportClients:
+    """Test export_clients endpoint"""
+    
+    @pytest.mark.asyncio
+    async def test_export_clients_streams_ndjson(self):
+        """Test that clients are streamed as one JSON object per line"""
+        # Arrange
+        clients = [
+            ClientResponse(
+                id=client_id,
+                nombre_completo=f"Cliente {client_id}",
+                cedula=f"1234567{client_id}",
+                email=f"cliente{client_id}@example.com",
                 telefono="3001234567",
                 fecha_nacimiento=date(1990, 1, 1),
                 direccion="Calle 123",
                 info_adicional=None,
-                created_at=datetime.now()
-            ),
-            Client(
-                id=2,
-                nombre_completo="María García",
-                cedula="87654321",
-                email="maria@example.com",
-                telefono="3009876543",
-                fecha_nacimiento=date(1985, 5, 15),
-                direccion="Calle 456",
-                info_adicional=None,
-                created_at=datetime.now()
+                created_at=datetime(2024, 1, 1, 12, 0, 0)
             )
+            for client_id in (1, 2)
         ]
         
-        # Act & Assert
-        with patch('src.infrastructure.outbound.database.client_repository.SupabaseClientRepository') as mock_repo_class:
-            mock_repo = AsyncMock()
-            mock_repo.get_all.return_value = mock_clients
-            mock_repo_class.return_value = mock_repo
-            
-            result = await list_clients(mock_db)
-            
-            # Verify we get a list of ClientResponse objects
-            assert len(result) == 2
-            assert all(isinstance(client, ClientResponse) for client in result)
-            assert result[0].nombre_completo == "Juan Pérez"
-            assert result[1].nombre_completo == "María García"
-            
-            mock_repo.get_all.assert_called_once_with(skip=0, limit=10000)
+        async def stream_all_clients():
+            for client in clients:
+                yield client
+        
+        mock_service = MagicMock()
+        mock_service.stream_all_clients = stream_all_clients
+        
+        # Act
+        response = await export_clients(mock_service)
+        lines = [chunk async for chunk in response.body_iterator]
+        
+        # Assert
+        assert response.media_type == "application/x-ndjson"
+        assert len(lines) == 2
+        assert all(line.endswith("\n") for line in lines)
+        assert ClientResponse.model_validate_json(lines[0]) == clients[0]
 
 
 class TestSearchClientsByName:
@@ -455,6 +651,22 @@ class TestSearchClientsByName:
         # This test is a placeholder because the search endpoint requires
         # complex database mocking that is better tested via integration tests
         assert True
+    
+    @pytest.mark.asyncio
+    async def test_search_clients_by_name_is_paginated(self):
+        """Test search applies skip/limit to the query"""
+        # Arrange
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_db.scalars.return_value = iter([])
+        
+        # Act
+        result = await search_clients_by_name("Juan", 10, 20, mock_db)
+        
+        # Assert
+        stmt = mock_db.scalars.call_args.args[0]
+        assert stmt._offset_clause.value == 10
+        assert stmt._limit_clause.value == 20
+        assert result.body == b"[]"
 
 
 class TestDeleteClientDocument:
@@ -4,6 +4,7 @@ from datetime import date, datetime
 from unittest.mock import AsyncMock, MagicMock
 from src.application.services.create_loan_application_service import CreateLoanApplicationService
 from src.application.dtos.loan_application_dtos import CreateLoanApplicationRequest
+from src.application.exceptions import LoanApplicationError
 from src.domain.entities.loan_application import LoanApplication
 
 
@@ -46,8 +47,7 @@ class TestCreateLoanApplicationService:
 
     async def test_execute_success(self, service, mock_repository, valid_request, created_application):
         """Test successful loan application creation"""
-        mock_repository.get_by_cedula.return_value = []
-        mock_repository.create.return_value = created_application
+        mock_repository.create_many.return_value = [created_application]
 
         result = await service.execute(valid_request)
 
@@ -56,26 +56,17 @@ class TestCreateLoanApplicationService:
         assert result.cedula == "12345678901"
         assert result.convenio == "Convenio Test"
         assert result.telefono == "3001234567"
-        mock_repository.create.assert_called_once()
-
-    async def test_execute_with_existing_applications(self, service, mock_repository, valid_request, created_application):
-        """Test creation when client has existing applications"""
-        existing = LoanApplication(
-            id=99,
-            name="Juan Perez",
-            cedula="12345678901",
-            convenio="Old Convenio",
-            telefono="3001234567",
-            fecha_nacimiento=date(1990, 5, 15),
-            created_at=datetime(2023, 1, 1)
-        )
-        mock_repository.get_by_cedula.return_value = [existing]
-        mock_repository.create.return_value = created_application
+        mock_repository.create_many.assert_called_once()
+
+    async def test_execute_does_not_look_up_existing_applications(self, service, mock_repository, valid_request, created_application):
+        """Test several applications per cedula are allowed without a lookup first"""
+        mock_repository.create_many.return_value = [created_application]
 
         result = await service.execute(valid_request)
 
         assert result.id == 1
-        mock_repository.create.assert_called_once()
+        mock_repository.get_by_cedula.assert_not_called()
+        mock_repository.create_many.assert_called_once()
 
     async def test_execute_without_convenio(self, service, mock_repository, created_application):
         """Test creation without convenio"""
@@ -95,8 +86,7 @@ class TestCreateLoanApplicationService:
             fecha_nacimiento=date(1985, 3, 20),
             created_at=datetime(2024, 1, 1)
         )
-        mock_repository.get_by_cedula.return_value = []
-        mock_repository.create.return_value = created_app_no_convenio
+        mock_repository.create_many.return_value = [created_app_no_convenio]
 
         result = await service.execute(request)
 
@@ -112,12 +102,11 @@ class TestCreateLoanApplicationService:
             telefono="  3001234567  ",
             fecha_nacimiento=date(1990, 5, 15)
         )
-        mock_repository.get_by_cedula.return_value = []
-        mock_repository.create.return_value = created_application
+        mock_repository.create_many.return_value = [created_application]
 
         await service.execute(request)
 
-        call_args = mock_repository.create.call_args[0][0]
+        call_args = mock_repository.create_many.call_args[0][0][0]
         assert call_args.name == "Juan Perez"
         assert call_args.cedula == "12345678901"
         assert call_args.convenio == "Convenio Test"
@@ -125,8 +114,7 @@ class TestCreateLoanApplicationService:
 
     async def test_execute_repository_error(self, service, mock_repository, valid_request):
         """Test handling of repository errors"""
-        mock_repository.get_by_cedula.return_value = []
-        mock_repository.create.side_effect = Exception("Database error")
+        mock_repository.create_many.side_effect = Exception("Database error")
 
         with pytest.raises(Exception) as exc_info:
             await service.execute(valid_request)
@@ -135,7 +123,6 @@ class TestCreateLoanApplicationService:
 
     async def test_execute_invalid_data(self, service, mock_repository, valid_request):
         """Test handling of invalid application data"""
-        mock_repository.get_by_cedula.return_value = []
         
         # Mock the entity to return invalid validation
         with pytest.raises(ValueError) as exc_info:
@@ -146,3 +133,49 @@ class TestCreateLoanApplicationService:
                 telefono="3001234567",
                 fecha_nacimiento=date(1990, 5, 15)
             )
+
+
+class TestCreateLoanApplicationServiceMany:
+    """Tests for CreateLoanApplicationService.execute_many"""
+
+    async def test_execute_many_single_bulk_insert(self, service, mock_repository, valid_request, created_application):
+        """Test every application is written with one repository call"""
+        second = created_application.__class__(**{**created_application.__dict__, "id": 2})
+        mock_repository.create_many.return_value = [created_application, second]
+
+        result = await service.execute_many([valid_request, valid_request])
+
+        assert [response.id for response in result] == [1, 2]
+        mock_repository.create_many.assert_called_once()
+        assert len(mock_repository.create_many.call_args[0][0]) == 2
+
+    async def test_execute_many_invalid_rejects_batch(self, service, mock_repository, valid_request):
+        """Test one invalid application rejects the batch before writing"""
+        too_young = valid_request.model_copy(update={"fecha_nacimiento": date.today()})
+
+        with pytest.raises(LoanApplicationError) as exc_info:
+            await service.execute_many([valid_request, too_young])
+
+        assert exc_info.value.status_code == 400
+        mock_repository.create_many.assert_not_called()
+
+
+class TestCreateLoanApplicationRequestCedula:
+    """Test cedula validation on CreateLoanApplicationRequest"""
+
+    @pytest.mark.parametrize("cedula", ["12345678", "12345678901", "12.345.678", "1234-5678-9"])
+    def test_valid_cedula(self, cedula):
+        """Test plain digits and formatted cedulas with 8-11 digits are accepted unchanged"""
+        request = CreateLoanApplicationRequest(
+            name="Juan", cedula=cedula, telefono="3001234567", fecha_nacimiento=date(1990, 1, 1)
+        )
+
+        assert request.cedula == cedula
+
+    @pytest.mark.parametrize("cedula", ["1234567a", "123456789012", "12.345.6"])
+    def test_invalid_cedula(self, cedula):
+        """Test cedulas without 8-11 digits are rejected"""
+        with pytest.raises(ValueError):
+            CreateLoanApplicationRequest(
+                name="Juan", cedula=cedula, telefono="3001234567", fecha_nacimiento=date(1990, 1, 1)
+            )
@@ -2,7 +2,11 @@
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock
-from src.application.services.credit_simulator_service import CreditSimulatorService
+from src.application.services import credit_simulator_service
+from src.application.services.credit_simulator_service import (
+    CreditSimulatorService,
+    clear_active_config_cache
+)
 from src.application.dtos.credit_simulator_dtos import (
     SimulateCreditRequest,
     CreateSimulatorConfigRequest,
@@ -11,6 +15,13 @@ from src.application.dtos.credit_simulator_dtos import (
 from src.domain.entities.credit_simulator import CreditSimulator
 
 
+@pytest.fixture(autouse=True)
+def reset_active_config_cache():
+    clear_active_config_cache()
+    yield
+    clear_active_config_cache()
+
+
 @pytest.fixture
 def mock_repository():
     return AsyncMock()
@@ -116,6 +127,52 @@ class TestSimulateCredit:
         assert "no existe una configuración activa" in str(exc_info.value).lower()
 
 
+class TestSimulateCreditRequest:
+    """Tests for SimulateCreditRequest validation"""
+
+    @pytest.mark.parametrize("plazo", [6, 12, 18, 24, 36, 48, 60, 72])
+    def test_allowed_terms(self, plazo):
+        """Test every allowed term is accepted"""
+        assert SimulateCreditRequest(monto=1000000, plazo_meses=plazo).plazo_meses == plazo
+
+    @pytest.mark.parametrize("plazo", [0, 7, 13, 120])
+    def test_other_terms_rejected(self, plazo):
+        """Test terms outside the allowed set are rejected"""
+        with pytest.raises(ValueError):
+            SimulateCreditRequest(monto=1000000, plazo_meses=plazo)
+
+    @pytest.mark.parametrize("monto", [99999, 100000001])
+    def test_monto_out_of_range_rejected(self, monto):
+        """Test amounts outside 100,000 - 100,000,000 are rejected"""
+        with pytest.raises(ValueError):
+            SimulateCreditRequest(monto=monto, plazo_meses=12)
+
+
+class TestSimulatorConfigRequestPlazos:
+    """Tests for plazos_disponibles normalization in the config DTOs"""
+
+    def _create(self, plazos):
+        return CreateSimulatorConfigRequest(
+            tasa_interes_mensual=0.018,
+            monto_minimo=100000,
+            monto_maximo=200000,
+            plazos_disponibles=plazos
+        )
+
+    def test_plazos_deduplicated_and_sorted(self):
+        """Test duplicates are removed and terms come back sorted"""
+        assert self._create([36, 12, 24, 12, 36]).plazos_disponibles == [12, 24, 36]
+        assert UpdateSimulatorConfigRequest(plazos_disponibles=[24, 6, 24]).plazos_disponibles == [6, 24]
+
+    @pytest.mark.parametrize("plazos", [[], [0, 12], [12, 121]])
+    def test_invalid_plazos_rejected(self, plazos):
+        """Test empty lists and out-of-range terms are rejected"""
+        with pytest.raises(ValueError):
+            self._create(plazos)
+        with pytest.raises(ValueError):
+            UpdateSimulatorConfigRequest(plazos_disponibles=plazos)
+
+
 class TestGetAllSimulatorConfigs:
     """Tests for get_all_simulator_configs method"""
 
@@ -386,3 +443,63 @@ class TestDeleteConfig:
             await service.delete_config(2)
 
         assert "error al eliminar" in str(exc_info.value).lower()
+
+
+class TestActiveConfigCache:
+    """Tests for the in-process active configuration cache"""
+
+    async def test_active_config_is_cached(self, service, mock_repository, active_config):
+        """Test repeated simulations hit the database once"""
+        mock_repository.get_active_config.return_value = active_config
+        request = SimulateCreditRequest(monto=1000000, plazo_meses=12)
+
+        await service.simulate_credit(request)
+        await CreditSimulatorService(mock_repository).simulate_credit(request)
+
+        mock_repository.get_active_config.assert_called_once()
+
+    async def test_missing_active_config_is_not_cached(self, service, mock_repository, active_config):
+        """Test a missing config is looked up again on the next call"""
+        mock_repository.get_active_config.return_value = None
+        with pytest.raises(ValueError):
+            await service.simulate_credit(SimulateCreditRequest(monto=1000000, plazo_meses=12))
+
+        mock_repository.get_active_config.return_value = active_config
+        result = await service.simulate_credit(SimulateCreditRequest(monto=1000000, plazo_meses=12))
+
+        assert result.plazo_meses == 12
+        assert mock_repository.get_active_config.call_count == 2
+
+    async def test_activate_config_invalidates_cache(self, service, mock_repository, active_config, inactive_config):
+        """Test activating a config makes the next simulation reload it"""
+        mock_repository.get_active_config.return_value = active_config
+        await service.validate_simulation_parameters(1000000, 12)
+
+        mock_repository.get_by_id.return_value = inactive_config
+        mock_repository.set_active_config.return_value = inactive_config
+        await service.activate_config(2)
+
+        mock_repository.get_active_config.return_value = inactive_config
+        result = await service.validate_simulation_parameters(1000000, 6)
+
+        assert result["plazo_valido"] is True
+        assert mock_repository.get_active_config.call_count == 2
+
+    async def test_activate_config_clears_cache_after_commit(
+        self, service, mock_repository, active_config, inactive_config
+    ):
+        """Test the cache is only invalidated once the activation is committed"""
+        mock_repository.get_active_config.return_value = active_config
+        await service.simulate_credit(SimulateCreditRequest(monto=1000000, plazo_meses=12))
+        mock_repository.get_by_id.return_value = inactive_config
+        mock_repository.set_active_config.return_value = inactive_config
+        cache_at_commit = []
+        mock_repository.commit.side_effect = lambda: cache_at_commit.append(
+            credit_simulator_service._active_config_cache
+        )
+
+        await service.activate_config(2)
+
+        mock_repository.commit.assert_awaited_once()
+        assert cache_at_commit[0] is not None
+        assert credit_simulator_service._active_config_cache is None
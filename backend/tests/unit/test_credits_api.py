@@ -682,4 +682,36 @@ class TestCreditValidationScenarios:
                 tasa_interes=Decimal('0')  # Zero interest - invalid
             )
         
-        assert "tasa_interes" in str(exc_info.value)
\ No newline at end of file
+        assert "tasa_interes" in str(exc_info.value)    
+    @pytest.mark.parametrize("monto, valid", [
+        (Decimal('99999.99'), False),
+        (Decimal('100000'), True),
+        (Decimal('100000000'), True),
+        (Decimal('100000000.01'), False),
+    ])
+    def test_create_credit_monto_bounds(self, monto, valid):
+        """Test monto_aprobado must be between 100,000 and 100,000,000"""
+        from pydantic import ValidationError
+        
+        def build():
+            return CreateCreditRequest(
+                client_id=1,
+                monto_aprobado=monto,
+                plazo_meses=12,
+                tasa_interes=Decimal('15.5')
+            )
+        
+        if valid:
+            assert build().monto_aprobado == monto
+        else:
+            with pytest.raises(ValidationError) as exc_info:
+                build()
+            assert "monto_aprobado" in str(exc_info.value)
+    
+    def test_update_credit_monto_bounds(self):
+        """Test partial updates apply the same monto_aprobado range"""
+        from pydantic import ValidationError
+        
+        assert UpdateCreditRequest().monto_aprobado is None
+        with pytest.raises(ValidationError):
+            UpdateCreditRequest(monto_aprobado=Decimal('50000'))
@@ -0,0 +1,31 @@
+"""
+Unit tests for API dependency wiring
+"""
+import pytest
+from fastapi.routing import APIRoute
+
+from src.main import app
+from src.infrastructure.outbound.database.connection import get_db_session
+
+
+def _walk(dependant):
+    yield dependant
+    for sub_dependant in dependant.dependencies:
+        yield from _walk(sub_dependant)
+
+
+API_ROUTES = [route for route in app.routes if isinstance(route, APIRoute)]
+
+
+class TestDependencyCache:
+    """Each request must resolve get_db_session once and share that session"""
+    
+    @pytest.mark.parametrize(
+        "route", API_ROUTES, ids=lambda r: f"{','.join(sorted(r.methods))} {r.path}"
+    )
+    def test_db_session_is_shared_within_a_request(self, route):
+        """All get_db_session dependants of a route hit the same cache entry"""
+        sessions = [d for d in _walk(route.dependant) if d.call is get_db_session]
+        
+        assert all(d.use_cache for d in sessions)
+        assert len({d.cache_key for d in sessions}) <= 1
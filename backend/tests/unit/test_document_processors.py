@@ -0,0 +1,198 @@
+"""
+Unit tests for the RAG document processors
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from docx import Document
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from src.application.services.document_processors import pdf_processor
+from src.application.services.document_processors.factory import DocumentProcessorFactory
+from src.application.services.document_processors.pdf_processor import PDFProcessor
+from src.application.services.document_processors.word_processor import WordProcessor
+
+
+def make_docx(*paragraphs):
+    document = Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_pdf(*page_texts):
+    """Build a PDF with one line of Helvetica text per page"""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for text in page_texts:
+        page = writer.add_blank_page(width=612, height=792)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class TestWordProcessor:
+    """Test WordProcessor.extract_text"""
+
+    @pytest.mark.asyncio
+    async def test_extract_text_runs_off_the_event_loop(self, monkeypatch):
+        """Test paragraphs are extracted in a worker thread"""
+        processor = WordProcessor()
+        threads = []
+        extract = processor._extract_text_sync
+
+        def record_thread(content, filename):
+            threads.append(threading.current_thread())
+            return extract(content, filename)
+
+        monkeypatch.setattr(processor, "_extract_text_sync", record_thread)
+
+        result = await processor.extract_text(make_docx("Primer párrafo", "Segundo párrafo"), "manual.docx")
+
+        assert result[0].text == "Primer párrafo\n\nSegundo párrafo"
+        assert result[0].metadata["paragraphs_count"] == 2
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_extract_tables_after_paragraphs(self):
+        """Test top-level tables are appended as " | "-joined rows"""
+        document = Document()
+        document.add_paragraph("Requisitos")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Documento"
+        table.cell(0, 1).text = "Cédula"
+        table.cell(1, 0).text = "Ingresos"
+        document.add_paragraph("Fin")
+        buffer = BytesIO()
+        document.save(buffer)
+
+        result = WordProcessor()._extract_text_sync(buffer.getvalue(), "requisitos.docx")
+
+        assert result[0].text == "Requisitos\n\nFin\n\n--- Tablas ---\nDocumento | Cédula\nIngresos"
+        assert result[0].metadata["paragraphs_count"] == 2
+        assert result[0].metadata["tables_count"] == 1
+
+    def test_extract_run_tabs_and_breaks(self):
+        """Test tabs and line breaks inside runs are kept like python-docx"""
+        document = Document()
+        run = document.add_paragraph().add_run("Plazo")
+        run.add_tab()
+        run.add_text("12 meses")
+        run.add_break()
+        run.add_text("Tasa fija")
+        buffer = BytesIO()
+        document.save(buffer)
+
+        result = WordProcessor()._extract_text_sync(buffer.getvalue(), "condiciones.docx")
+
+        assert result[0].text == "Plazo\t12 meses\nTasa fija"
+
+    def test_empty_document_returns_nothing(self):
+        """Test a document without text yields no extracted text"""
+        assert WordProcessor()._extract_text_sync(make_docx(), "vacio.docx") == []
+
+    def test_invalid_docx_raises(self):
+        """Test non-docx content is reported as an extraction error"""
+        with pytest.raises(Exception) as exc_info:
+            WordProcessor()._extract_text_sync(b"not a docx", "roto.docx")
+
+        assert "Error extracting text from Word document" in str(exc_info.value)
+
+
+class TestPDFProcessor:
+    """Test PDFProcessor.extract_text"""
+
+    @pytest.mark.asyncio
+    async def test_extract_text_small_pdf(self):
+        """Test every page with text is returned with its page number"""
+        result = await PDFProcessor().extract_text(make_pdf("Pagina uno", "Pagina dos"), "manual.pdf")
+
+        assert [(item.page_number, item.text) for item in result] == [(1, "Pagina uno"), (2, "Pagina dos")]
+        assert result[0].metadata["total_pages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_extract_text_large_pdf_in_page_ranges(self, monkeypatch):
+        """Test large PDFs are split across the pool and pages stay in order"""
+        monkeypatch.setattr(pdf_processor, "PDF_PARALLEL_MIN_PAGES", 4)
+        monkeypatch.setattr(pdf_processor, "PDF_EXTRACTION_WORKERS", 3)
+        calls = []
+        extract_pages = pdf_processor._extract_pages
+
+        def record_range(content, filename, start, end):
+            calls.append((start, end))
+            return extract_pages(content, filename, start, end)
+
+        monkeypatch.setattr(pdf_processor, "_extract_pages", record_range)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            monkeypatch.setattr(pdf_processor, "_get_process_pool", lambda: pool)
+
+            result = await PDFProcessor().extract_text(
+                make_pdf(*[f"Pagina {i}" for i in range(1, 8)]), "manual.pdf"
+            )
+
+        assert sorted(calls) == [(0, 3), (3, 6), (6, 7)]
+        assert [item.text for item in result] == [f"Pagina {i}" for i in range(1, 8)]
+
+    @pytest.mark.asyncio
+    async def test_extract_text_large_pdf_in_worker_processes(self, monkeypatch):
+        """Test the real spawn pool: the function, its arguments and the worker imports all work"""
+        monkeypatch.setattr(pdf_processor, "PDF_PARALLEL_MIN_PAGES", 2)
+        monkeypatch.setattr(pdf_processor, "PDF_EXTRACTION_WORKERS", 2)
+        monkeypatch.setattr(pdf_processor, "_process_pool", None)
+        try:
+            result = await PDFProcessor().extract_text(
+                make_pdf(*[f"Pagina {i}" for i in range(1, 5)]), "manual.pdf"
+            )
+
+            assert pdf_processor._process_pool is not None
+        finally:
+            pdf_processor.shutdown_pdf_process_pool()
+
+        assert [(item.page_number, item.text) for item in result] == [(i, f"Pagina {i}") for i in range(1, 5)]
+        assert pdf_processor._process_pool is None
+
+    def test_page_ranges_small_pdf_single_range(self):
+        """Test PDFs under the threshold are not split"""
+        assert pdf_processor._page_ranges(3) == [(0, 3)]
+
+    @pytest.mark.asyncio
+    async def test_invalid_pdf_raises(self):
+        """Test extraction errors from the worker thread are wrapped"""
+        with pytest.raises(Exception, match="Error extracting text from PDF"):
+            await PDFProcessor().extract_text(b"no es un pdf", "manual.pdf")
+
+
+class TestDocumentProcessorFactory:
+    """Test DocumentProcessorFactory.get_processor"""
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("manual.pdf", PDFProcessor),
+        ("Manual.PDF", PDFProcessor),
+        ("politicas.v2.docx", WordProcessor),
+        ("antiguo.doc", WordProcessor),
+    ])
+    def test_get_processor_by_extension(self, filename, expected):
+        """Test files are dispatched on their lowercase last extension"""
+        assert isinstance(DocumentProcessorFactory().get_processor(filename), expected)
+
+    @pytest.mark.parametrize("filename", ["notas.txt", "sin_extension", "manual.pdf.exe"])
+    def test_get_processor_unsupported(self, filename):
+        """Test unsupported or missing extensions return None"""
+        factory = DocumentProcessorFactory()
+
+        assert factory.get_processor(filename) is None
+        assert factory.is_supported(filename) is False
@@ -0,0 +1,160 @@
+"""
+Unit tests for Documents API routes
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.infrastructure.inbound.api.dependencies import validated_upload
+from src.infrastructure.inbound.api.middleware.body_size_middleware import BodySizeLimitMiddleware
+from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user
+from src.infrastructure.inbound.api.routes.documents import get_document_service, upload_document
+from src.main import app
+
+
+def make_file(filename="cedula.jpg", size=1024):
+    mock_file = MagicMock()
+    mock_file.filename = filename
+    mock_file.size = size
+    return mock_file
+
+
+class TestUploadDocument:
+    """Test upload_document endpoint validation"""
+
+    @pytest.mark.asyncio
+    async def test_upload_document_success(self):
+        """Test valid upload is passed to the service"""
+        mock_service = AsyncMock()
+        mock_service.upload_document.return_value = {"status": "success"}
+
+        result = await upload_document(make_file(), "CEDULA_FRENTE", 1, None, mock_service)
+
+        assert result == {"status": "success"}
+        mock_service.upload_document.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_document_invalid_type(self):
+        """Test invalid document_type is rejected before calling the service"""
+        mock_service = AsyncMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_document(make_file(), "INVALID", 1, None, mock_service)
+
+        assert exc_info.value.status_code == 400
+        mock_service.upload_document.assert_not_called()
+
+
+class TestUploadDocumentForm:
+    """Test parsing of the upload form fields"""
+
+    @pytest.fixture
+    def mock_service(self):
+        mock_service = AsyncMock()
+        mock_service.upload_document.return_value = {"status": "success"}
+        app.dependency_overrides[get_document_service] = lambda: mock_service
+        app.dependency_overrides[get_current_user] = lambda: None
+        yield mock_service
+        app.dependency_overrides.clear()
+
+    def _post(self, data):
+        return TestClient(app).post(
+            "/api/v1/documents/upload",
+            files={"file": ("cedula.pdf", b"content", "application/pdf")},
+            data=data
+        )
+
+    @pytest.mark.parametrize("credit_id, expected", [("", None), ("7", 7)])
+    def test_credit_id_parsing(self, mock_service, credit_id, expected):
+        """Test empty credit_id becomes None and digits become int"""
+        response = self._post({"document_type": "CEDULA_FRENTE", "client_id": "5", "credit_id": credit_id})
+
+        assert response.status_code == 200
+        assert mock_service.upload_document.call_args.kwargs["credit_id"] == expected
+
+    def test_credit_id_missing(self, mock_service):
+        """Test credit_id is optional"""
+        response = self._post({"document_type": "CEDULA_FRENTE", "client_id": "5"})
+
+        assert response.status_code == 200
+        assert mock_service.upload_document.call_args.kwargs["credit_id"] is None
+
+    def test_credit_id_invalid(self, mock_service):
+        """Test non-numeric credit_id is rejected"""
+        response = self._post({"document_type": "CEDULA_FRENTE", "client_id": "5", "credit_id": "abc"})
+
+        assert response.status_code == 422
+        mock_service.upload_document.assert_not_called()
+
+
+class TestValidatedUpload:
+    """Test validated_upload dependency"""
+
+    @pytest.mark.asyncio
+    async def test_validated_upload_accepts_valid_file(self):
+        """Test valid file is returned unchanged"""
+        file = make_file()
+
+        assert await validated_upload(file) is file
+
+    @pytest.mark.asyncio
+    async def test_validated_upload_too_large(self):
+        """Test oversized file is rejected with 413"""
+        with pytest.raises(HTTPException) as exc_info:
+            await validated_upload(make_file(size=11 * 1024 * 1024))
+
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_validated_upload_extension_not_allowed(self):
+        """Test disallowed extension is rejected"""
+        with pytest.raises(HTTPException) as exc_info:
+            await validated_upload(make_file(filename="script.EXE"))
+
+        assert exc_info.value.status_code == 400
+        assert "File type not allowed" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_validated_upload_uppercase_extension(self):
+        """Test extension check is case-insensitive"""
+        file = make_file(filename="Cedula.PDF")
+
+        assert await validated_upload(file) is file
+
+
+class TestBodySizeLimitMiddleware:
+    """Test BodySizeLimitMiddleware"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(BodySizeLimitMiddleware, limits={"/upload": 1024})
+
+        @app.post("/upload")
+        async def upload():
+            return {"status": "ok"}
+
+        @app.post("/other")
+        async def other():
+            return {"status": "ok"}
+
+        return TestClient(app)
+
+    def test_rejects_body_over_limit(self, client):
+        """Test Content-Length over the path limit returns 413"""
+        response = client.post("/upload", content=b"x" * 2048)
+
+        assert response.status_code == 413
+
+    def test_allows_body_within_limit(self, client):
+        """Test small bodies pass through"""
+        response = client.post("/upload", content=b"x" * 512)
+
+        assert response.status_code == 200
+
+    def test_ignores_paths_without_limit(self, client):
+        """Test paths without a configured limit are not checked"""
+        response = client.post("/other", content=b"x" * 2048)
+
+        assert response.status_code == 200
@@ -65,10 +65,12 @@ class TestListClientLoanApplicationsServiceExecute:
         assert result.page == 1
         assert result.page_size == 20
         assert result.total_pages == 1
+        mock_repository.get_by_cedula.assert_called_once_with("12345678901", 0, 20)
+        mock_repository.count_by_cedula.assert_not_called()
 
-    async def test_execute_sorts_by_date_descending(self, service, mock_repository, sample_applications):
-        """Test that applications are sorted by date (newest first)"""
-        mock_repository.get_by_cedula.return_value = sample_applications
+    async def test_execute_keeps_repository_order(self, service, mock_repository, sample_applications):
+        """Test that the repository's newest-first order is kept"""
+        mock_repository.get_by_cedula.return_value = list(reversed(sample_applications))
         request = ListClientLoanApplicationsRequest(cedula="12345678901", skip=0, limit=20)
 
         result = await service.execute(request)
@@ -78,8 +80,9 @@ class TestListClientLoanApplicationsServiceExecute:
         assert result.applications[2].id == 1  # January (oldest)
 
     async def test_execute_pagination_first_page(self, service, mock_repository, sample_applications):
-        """Test pagination - first page"""
-        mock_repository.get_by_cedula.return_value = sample_applications
+        """Test pagination - a full first page needs the count"""
+        mock_repository.get_by_cedula.return_value = sample_applications[:2]
+        mock_repository.count_by_cedula.return_value = 3
         request = ListClientLoanApplicationsRequest(cedula="12345678901", skip=0, limit=2)
 
         result = await service.execute(request)
@@ -88,10 +91,12 @@ class TestListClientLoanApplicationsServiceExecute:
         assert result.total == 3
         assert result.page == 1
         assert result.total_pages == 2
+        mock_repository.get_by_cedula.assert_called_once_with("12345678901", 0, 2)
+        mock_repository.count_by_cedula.assert_called_once_with("12345678901")
 
     async def test_execute_pagination_second_page(self, service, mock_repository, sample_applications):
-        """Test pagination - second page"""
-        mock_repository.get_by_cedula.return_value = sample_applications
+        """Test pagination - a short last page gives the total without counting"""
+        mock_repository.get_by_cedula.return_value = sample_applications[2:]
         request = ListClientLoanApplicationsRequest(cedula="12345678901", skip=2, limit=2)
 
         result = await service.execute(request)
@@ -100,6 +105,19 @@ class TestListClientLoanApplicationsServiceExecute:
         assert result.total == 3
         assert result.page == 2
         assert result.total_pages == 2
+        mock_repository.get_by_cedula.assert_called_once_with("12345678901", 2, 2)
+        mock_repository.count_by_cedula.assert_not_called()
+
+    async def test_execute_page_past_the_end(self, service, mock_repository):
+        """Test an empty page after skip falls back to the count"""
+        mock_repository.get_by_cedula.return_value = []
+        mock_repository.count_by_cedula.return_value = 3
+        request = ListClientLoanApplicationsRequest(cedula="12345678901", skip=20, limit=20)
+
+        result = await service.execute(request)
+
+        assert len(result.applications) == 0
+        assert result.total == 3
 
     async def test_execute_empty_results(self, service, mock_repository):
         """Test when no applications found"""
@@ -127,9 +145,12 @@ class TestListClientLoanApplicationsServiceExecute:
 class TestGetClientApplicationSummary:
     """Tests for ListClientLoanApplicationsService.get_client_application_summary"""
 
-    async def test_summary_with_applications(self, service, mock_repository, sample_applications):
+    async def test_summary_with_applications(self, service, mock_repository):
         """Test summary when client has applications"""
-        mock_repository.get_by_cedula.return_value = sample_applications
+        mock_repository.get_summary_by_cedula.return_value = {
+            "total": 3,
+            "latest_created_at": datetime(2024, 3, 1, 10, 0, 0)
+        }
 
         result = await service.get_client_application_summary("12345678901")
 
@@ -139,7 +160,7 @@ class TestGetClientApplicationSummary:
 
     async def test_summary_no_applications(self, service, mock_repository):
         """Test summary when client has no applications"""
-        mock_repository.get_by_cedula.return_value = []
+        mock_repository.get_summary_by_cedula.return_value = {"total": 0, "latest_created_at": None}
 
         result = await service.get_client_application_summary("99999999999")
 
@@ -151,29 +172,23 @@ class TestGetClientApplicationSummary:
 
     async def test_summary_repository_error(self, service, mock_repository):
         """Test handling of repository errors in summary"""
-        mock_repository.get_by_cedula.side_effect = Exception("Database error")
+        mock_repository.get_summary_by_cedula.side_effect = Exception("Database error")
 
         with pytest.raises(Exception) as exc_info:
             await service.get_client_application_summary("12345678901")
 
         assert "Error al obtener resumen de solicitudes" in str(exc_info.value)
 
-    async def test_summary_single_application(self, service, mock_repository):
-        """Test summary with single application"""
-        single_app = [
-            LoanApplication(
-                id=1,
-                name="Juan Perez",
-                cedula="12345678901",
-                convenio="Convenio A",
-                telefono="3001234567",
-                fecha_nacimiento=date(1990, 5, 15),
-                created_at=datetime(2024, 1, 1, 10, 0, 0)
-            )
-        ]
-        mock_repository.get_by_cedula.return_value = single_app
+    async def test_summary_does_not_load_applications(self, service, mock_repository):
+        """Test summary is aggregated in the repository instead of loading every application"""
+        mock_repository.get_summary_by_cedula.return_value = {
+            "total": 1,
+            "latest_created_at": datetime(2024, 1, 1, 10, 0, 0)
+        }
 
         result = await service.get_client_application_summary("12345678901")
 
         assert result["total_applications"] == 1
         assert result["latest_application_date"] == datetime(2024, 1, 1, 10, 0, 0)
+        mock_repository.get_summary_by_cedula.assert_called_once_with("12345678901")
+        mock_repository.get_by_cedula.assert_not_called()
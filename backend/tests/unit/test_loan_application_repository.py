@@ -130,6 +130,51 @@ class TestCreateApplication(TestSupabaseLoanApplicationRepository):
         assert "Error creating loan application" in str(exc_info.value)
 
 
+class TestCreateManyApplications(TestSupabaseLoanApplicationRepository):
+    """Test bulk application creation"""
+    
+    @pytest.mark.asyncio
+    async def test_create_many_single_insert_returning(self):
+        """Test all rows go in one ordered INSERT ... RETURNING and get their IDs back"""
+        created_at = datetime(2024, 2, 1)
+        applications = [
+            LoanApplication(
+                id=None, name=f"Cliente {i}", cedula=f"1234567{i}", convenio=None,
+                telefono="3001234567", fecha_nacimiento=date(1990, 1, 1)
+            )
+            for i in range(3)
+        ]
+        result_rows = MagicMock()
+        result_rows.fetchall.return_value = [MagicMock(id=10 + i, created_at=created_at) for i in range(3)]
+        self.mock_db.execute.return_value = result_rows
+        
+        result = await self.repository.create_many(applications)
+        
+        assert [application.id for application in result] == [10, 11, 12]
+        assert all(application.created_at == created_at for application in result)
+        self.mock_db.execute.assert_called_once()
+        stmt, params = self.mock_db.execute.call_args[0]
+        assert str(stmt).startswith('INSERT INTO "LoanApplication"')
+        assert stmt._sort_by_parameter_order is True
+        assert [row["name"] for row in params] == ["Cliente 0", "Cliente 1", "Cliente 2"]
+    
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self):
+        """Test no INSERT is issued without applications"""
+        assert await self.repository.create_many([]) == []
+        self.mock_db.execute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_many_database_error(self):
+        """Test bulk creation with database error"""
+        self.mock_db.execute.side_effect = Exception("Database error")
+        
+        with pytest.raises(Exception) as exc_info:
+            await self.repository.create_many([self.sample_application])
+        
+        assert "Error creating loan applications" in str(exc_info.value)
+
+
 class TestGetApplication(TestSupabaseLoanApplicationRepository):
     """Test get application functionality"""
     
@@ -178,6 +223,30 @@ class TestGetApplication(TestSupabaseLoanApplicationRepository):
         assert result[0].cedula == cedula
         self.mock_db.execute.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_get_by_cedula_paginates_in_sql(self):
+        """Test skip/limit are applied in the query"""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [self.sample_model]
+        self.mock_db.execute.return_value = mock_result
+        
+        await self.repository.get_by_cedula("12345678", skip=20, limit=10)
+        
+        stmt = self.mock_db.execute.call_args.args[0]
+        assert stmt._offset == 20
+        assert stmt._limit == 10
+    
+    @pytest.mark.asyncio
+    async def test_count_by_cedula_success(self):
+        """Test successful count by cedula"""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 3
+        self.mock_db.execute.return_value = mock_result
+        
+        result = await self.repository.count_by_cedula("12345678")
+        
+        assert result == 3
+    
     @pytest.mark.asyncio
     async def test_get_all_success(self):
         """Test successful retrieval of all applications"""
@@ -311,6 +380,42 @@ class TestApplicationCounting(TestSupabaseLoanApplicationRepository):
         
         assert result == expected_count
         self.mock_db.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_summary_by_cedula_success(self):
+        """Test summary by cedula comes from a single aggregate query"""
+        latest = datetime(2024, 3, 1, 10, 0, 0)
+        mock_result = MagicMock()
+        mock_result.one.return_value = (3, latest)
+        self.mock_db.execute.return_value = mock_result
+        
+        result = await self.repository.get_summary_by_cedula("12345678")
+        
+        assert result == {"total": 3, "latest_created_at": latest}
+        self.mock_db.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_summary_by_cedula_no_applications(self):
+        """Test summary by cedula with no matching rows"""
+        mock_result = MagicMock()
+        mock_result.one.return_value = (0, None)
+        self.mock_db.execute.return_value = mock_result
+        
+        result = await self.repository.get_summary_by_cedula("99999999")
+        
+        assert result == {"total": 0, "latest_created_at": None}
+    
+    @pytest.mark.asyncio
+    async def test_count_by_name_success(self):
+        """Test successful count by name"""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 7
+        self.mock_db.execute.return_value = mock_result
+        
+        result = await self.repository.count_by_name("Juan")
+        
+        assert result == 7
+        self.mock_db.execute.assert_called_once()
 
 
 class TestApplicationStatistics(TestSupabaseLoanApplicationRepository):
@@ -319,25 +424,21 @@ class TestApplicationStatistics(TestSupabaseLoanApplicationRepository):
     @pytest.mark.asyncio
     async def test_get_statistics_success(self):
         """Test successful statistics retrieval"""
-        total_count = 50
-        
-        total_result = MagicMock()
-        total_result.scalar.return_value = total_count
-        
         convenio_result = MagicMock()
-        convenio_result.fetchall.return_value = [("EMPRESA_ABC", 20), (None, 15)]
+        convenio_result.fetchall.return_value = [("EMPRESA_ABC", 20), (None, 15), ("", 5)]
         
         month_result = MagicMock()
         month_result.fetchall.return_value = [(datetime(2024, 1, 1), 10)]
         
-        self.mock_db.execute.side_effect = [total_result, convenio_result, month_result]
+        self.mock_db.execute.side_effect = [convenio_result, month_result]
         
-        with patch.object(self.repository, 'count_total', return_value=total_count):
-            result = await self.repository.get_statistics()
+        result = await self.repository.get_statistics()
         
-        assert result["total"] == total_count
-        assert "by_convenio" in result
+        # Total is derived from the convenio groups, no separate COUNT query
+        assert result["total"] == 40
+        assert result["by_convenio"] == {"EMPRESA_ABC": 20, "Sin convenio": 20}
         assert "by_month" in result
+        assert self.mock_db.execute.call_count == 2
 
 
 class TestErrorHandling(TestSupabaseLoanApplicationRepository):
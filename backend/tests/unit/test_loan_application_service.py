@@ -5,7 +5,9 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, date
 
-from src.application.services.loan_application_service import LoanApplicationService
+from src.application.exceptions import LoanApplicationError
+from src.application.services import loan_application_service
+from src.application.services.loan_application_service import LoanApplicationService, clear_loan_application_cache
 from src.domain.entities.loan_application import LoanApplication
 from src.application.dtos.loan_application_dtos import (
     CreateLoanApplicationRequest,
@@ -19,7 +21,9 @@ class TestLoanApplicationService:
     
     def setup_method(self):
         """Setup test fixtures"""
+        clear_loan_application_cache()
         self.mock_repository = MagicMock()
+        self.mock_repository.commit = AsyncMock()
         self.service = LoanApplicationService(self.mock_repository)
         
         self.sample_application = LoanApplication(
@@ -69,10 +73,11 @@ class TestUpdateApplication(TestLoanApplicationService):
         
         self.mock_repository.get_by_id = AsyncMock(return_value=None)
         
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(LoanApplicationError) as exc_info:
             await self.service.update_application(999, request)
         
-        assert "no encontrada" in str(exc_info.value)
+        assert exc_info.value.status_code == 404
+        assert "no encontrada" in exc_info.value.detail
     
     @pytest.mark.asyncio
     async def test_update_application_convenio(self):
@@ -235,6 +240,100 @@ class TestListAllApplications(TestLoanApplicationService):
             await self.service.list_all_applications()
         
         assert "Error al listar solicitudes" in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    async def test_list_all_applications_without_total(self):
+        """Test listing without total skips the COUNT query"""
+        self.mock_repository.get_all = AsyncMock(return_value=[self.sample_application])
+        self.mock_repository.count_total = AsyncMock(return_value=50)
+        
+        result = await self.service.list_all_applications(skip=20, limit=10, include_total=False)
+        
+        assert len(result.applications) == 1
+        assert result.total == 21
+        self.mock_repository.count_total.assert_not_called()
+
+
+class TestLoanApplicationCache(TestLoanApplicationService):
+    """Test the in-process cache for list and statistics results"""
+    
+    @pytest.mark.asyncio
+    async def test_list_all_applications_is_cached(self):
+        """Test a repeated listing is served from the cache"""
+        self.mock_repository.get_all = AsyncMock(return_value=[self.sample_application])
+        self.mock_repository.count_total = AsyncMock(return_value=1)
+        
+        first = await self.service.list_all_applications(skip=0, limit=10)
+        second = await LoanApplicationService(self.mock_repository).list_all_applications(skip=0, limit=10)
+        
+        assert second == first
+        self.mock_repository.get_all.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_list_all_applications_cache_key_includes_page(self):
+        """Test different pages are cached separately"""
+        self.mock_repository.get_all = AsyncMock(return_value=[self.sample_application])
+        self.mock_repository.count_total = AsyncMock(return_value=1)
+        
+        await self.service.list_all_applications(skip=0, limit=10)
+        await self.service.list_all_applications(skip=10, limit=10)
+        
+        assert self.mock_repository.get_all.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_statistics_are_cached(self):
+        """Test repeated statistics come from the cache"""
+        self.mock_repository.get_statistics = AsyncMock(return_value={'total': 5})
+        
+        await self.service.get_application_statistics()
+        result = await self.service.get_application_statistics()
+        
+        assert result.total_applications == 5
+        self.mock_repository.get_statistics.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cache(self):
+        """Test updating an application drops cached lists"""
+        self.mock_repository.get_all = AsyncMock(return_value=[self.sample_application])
+        self.mock_repository.count_total = AsyncMock(return_value=1)
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_application)
+        self.mock_repository.update = AsyncMock(return_value=self.sample_application)
+        
+        await self.service.list_all_applications()
+        await self.service.update_application(1, UpdateLoanApplicationRequest(name="Juan Pérez"))
+        await self.service.list_all_applications()
+        
+        assert self.mock_repository.get_all.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_update_clears_cache_after_commit(self):
+        """Test cached lists survive until the update is committed"""
+        self.mock_repository.get_all = AsyncMock(return_value=[self.sample_application])
+        self.mock_repository.count_total = AsyncMock(return_value=1)
+        self.mock_repository.get_by_id = AsyncMock(return_value=self.sample_application)
+        self.mock_repository.update = AsyncMock(return_value=self.sample_application)
+        await self.service.list_all_applications()
+        cache_sizes_at_commit = []
+        self.mock_repository.commit.side_effect = lambda: cache_sizes_at_commit.append(
+            len(loan_application_service._loan_application_cache)
+        )
+        
+        await self.service.update_application(1, UpdateLoanApplicationRequest(name="Juan Pérez"))
+        
+        assert cache_sizes_at_commit == [1]
+        assert loan_application_service._loan_application_cache == {}
+    
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test a failed listing is retried on the next call"""
+        self.mock_repository.get_all = AsyncMock(side_effect=[Exception("Database error"), []])
+        self.mock_repository.count_total = AsyncMock(return_value=0)
+        
+        with pytest.raises(Exception):
+            await self.service.list_all_applications()
+        result = await self.service.list_all_applications()
+        
+        assert result.total == 0
 
 
 class TestGetApplicationStatistics(TestLoanApplicationService):
@@ -288,6 +387,7 @@ class TestSearchApplicationsByName(TestLoanApplicationService):
         matching_apps = [self.sample_application]
         
         self.mock_repository.search_by_name = AsyncMock(return_value=matching_apps)
+        self.mock_repository.count_by_name = AsyncMock(return_value=1)
         
         result = await self.service.search_applications_by_name("Juan")
         
@@ -299,6 +399,7 @@ class TestSearchApplicationsByName(TestLoanApplicationService):
     async def test_search_applications_by_name_no_results(self):
         """Test search with no matching results"""
         self.mock_repository.search_by_name = AsyncMock(return_value=[])
+        self.mock_repository.count_by_name = AsyncMock(return_value=0)
         
         result = await self.service.search_applications_by_name("NoExiste")
         
@@ -309,14 +410,16 @@ class TestSearchApplicationsByName(TestLoanApplicationService):
     async def test_search_applications_by_name_with_pagination(self):
         """Test search with pagination"""
         apps = [self.sample_application]
-        all_matching = [self.sample_application] * 25  # 25 total matches
         
-        self.mock_repository.search_by_name = AsyncMock(side_effect=[apps, all_matching])
+        self.mock_repository.search_by_name = AsyncMock(return_value=apps)
+        self.mock_repository.count_by_name = AsyncMock(return_value=25)  # 25 total matches
         
         result = await self.service.search_applications_by_name("Juan", skip=0, limit=10)
         
         assert result.total == 25
         assert result.total_pages == 3
+        self.mock_repository.search_by_name.assert_called_once_with("Juan", 0, 10)
+        self.mock_repository.count_by_name.assert_called_once_with("Juan")
     
     @pytest.mark.asyncio
     async def test_search_applications_by_name_repository_error(self):
@@ -5,9 +5,14 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date, datetime
 from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.exceptions import LoanApplicationError
+from src.infrastructure.inbound.api.middleware.auth_middleware import get_current_user
 from src.infrastructure.inbound.api.routes.loan_applications import (
+    get_loan_application_service,
     create_loan_application,
     get_loan_application,
     list_loan_applications,
@@ -23,6 +28,16 @@ from src.application.dtos.loan_application_dtos import (
     LoanApplicationListResponse
 )
 from src.domain.entities.user import User
+from src.main import app
+
+
+application_list = TypeAdapter(list[LoanApplicationResponse])
+
+
+def make_request(headers=None):
+    mock_request = MagicMock()
+    mock_request.headers = headers or {}
+    return mock_request
 
 
 class TestCreateLoanApplication:
@@ -143,11 +158,11 @@ class TestCreateLoanApplication:
         mock_service.create_application.side_effect = Exception("Database error")
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(Exception, match="Database error") as exc_info:
             await create_loan_application(request, mock_service)
         
-        assert exc_info.value.status_code == 500
-        assert "Error creating application" in str(exc_info.value.detail)
+        # Unexpected errors are left to the default 500 handler
+        assert not isinstance(exc_info.value, HTTPException)
 
 
 class TestGetLoanApplication:
@@ -174,12 +189,40 @@ class TestGetLoanApplication:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act
-        result = await get_loan_application(application_id, mock_service, mock_user)
+        response = await get_loan_application(application_id, make_request(), mock_service, mock_user)
+        result = LoanApplicationResponse.model_validate_json(response.body)
         
         # Assert
         assert result == expected_response
         mock_service.get_application_by_id.assert_called_once_with(application_id)
     
+    @pytest.mark.asyncio
+    async def test_get_loan_application_not_modified(self):
+        """Test 304 when the application's ETag still matches"""
+        # Arrange
+        mock_service = AsyncMock()
+        mock_service.get_application_by_id.return_value = LoanApplicationResponse(
+            id=1,
+            name="Juan Pérez García",
+            cedula="12345678",
+            convenio="EMPRESA_ABC",
+            telefono="3001234567",
+            fecha_nacimiento=date(1985, 6, 15),
+            created_at=datetime(2024, 1, 1)
+        )
+        mock_user = User(id="user123", email="user@example.com", role="admin")
+        first = await get_loan_application(1, make_request(), mock_service, mock_user)
+        
+        # Act
+        result = await get_loan_application(
+            1, make_request({"if-none-match": first.headers["etag"]}), mock_service, mock_user
+        )
+        
+        # Assert
+        assert first.headers["cache-control"] == "private, max-age=5"
+        assert result.status_code == 304
+        assert result.body == b""
+    
     @pytest.mark.asyncio
     async def test_get_loan_application_not_found(self):
         """Test loan application retrieval when not found"""
@@ -192,7 +235,7 @@ class TestGetLoanApplication:
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_loan_application(application_id, mock_service, mock_user)
+            await get_loan_application(application_id, make_request(), mock_service, mock_user)
         
         assert exc_info.value.status_code == 404
         assert "Application not found" in str(exc_info.value.detail)
@@ -208,11 +251,10 @@ class TestGetLoanApplication:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
-            await get_loan_application(application_id, mock_service, mock_user)
+        with pytest.raises(Exception, match="Database error") as exc_info:
+            await get_loan_application(application_id, make_request(), mock_service, mock_user)
         
-        assert exc_info.value.status_code == 500
-        assert "Error getting application" in str(exc_info.value.detail)
+        assert not isinstance(exc_info.value, HTTPException)
 
 
 class TestListLoanApplications:
@@ -257,12 +299,15 @@ class TestListLoanApplications:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act
-        result = await list_loan_applications(mock_service, mock_user)
+        response = await list_loan_applications(make_request(), 0, 1000, mock_service, mock_user)
+        result = application_list.validate_json(response.body)
         
         # Assert
         assert result == expected_applications
         assert len(result) == 2
-        mock_service.list_all_applications.assert_called_once_with(convenio_filter=None, skip=0, limit=1000)
+        mock_service.list_all_applications.assert_called_once_with(
+            convenio_filter=None, skip=0, limit=1000, include_total=False
+        )
     
     @pytest.mark.asyncio
     async def test_list_loan_applications_empty_result(self):
@@ -282,11 +327,47 @@ class TestListLoanApplications:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act
-        result = await list_loan_applications(mock_service, mock_user)
+        response = await list_loan_applications(make_request(), 0, 1000, mock_service, mock_user)
+        result = application_list.validate_json(response.body)
         
         # Assert
         assert result == []
-        mock_service.list_all_applications.assert_called_once_with(convenio_filter=None, skip=0, limit=1000)
+        mock_service.list_all_applications.assert_called_once_with(
+            convenio_filter=None, skip=0, limit=1000, include_total=False
+        )
+    
+    @pytest.mark.asyncio
+    async def test_list_loan_applications_etag_changes_with_content(self):
+        """Test the list ETag matches for the same rows and changes when they change"""
+        # Arrange
+        application = LoanApplicationResponse(
+            id=1,
+            name="Juan Pérez García",
+            cedula="12345678",
+            convenio=None,
+            telefono="3001234567",
+            fecha_nacimiento=date(1985, 6, 15),
+            created_at=datetime(2024, 1, 1)
+        )
+        mock_service = AsyncMock()
+        mock_service.list_all_applications.return_value = LoanApplicationListResponse(
+            applications=[application], total=1, page=1, page_size=1000, total_pages=1
+        )
+        mock_user = User(id="user123", email="user@example.com", role="admin")
+        first = await list_loan_applications(make_request(), 0, 1000, mock_service, mock_user)
+        etag_headers = {"if-none-match": first.headers["etag"]}
+        
+        # Act
+        unchanged = await list_loan_applications(make_request(etag_headers), 0, 1000, mock_service, mock_user)
+        mock_service.list_all_applications.return_value = LoanApplicationListResponse(
+            applications=[], total=0, page=1, page_size=1000, total_pages=1
+        )
+        changed = await list_loan_applications(make_request(etag_headers), 0, 1000, mock_service, mock_user)
+        
+        # Assert
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert application_list.validate_json(changed.body) == []
     
     @pytest.mark.asyncio
     async def test_list_loan_applications_internal_error(self):
@@ -298,11 +379,10 @@ class TestListLoanApplications:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
-            await list_loan_applications(mock_service, mock_user)
+        with pytest.raises(Exception, match="Database error") as exc_info:
+            await list_loan_applications(make_request(), 0, 1000, mock_service, mock_user)
         
-        assert exc_info.value.status_code == 500
-        assert "Error listing applications" in str(exc_info.value.detail)
+        assert not isinstance(exc_info.value, HTTPException)
 
 
 class TestGetApplicationsByCedula:
@@ -348,7 +428,8 @@ class TestGetApplicationsByCedula:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act
-        result = await get_applications_by_cedula(cedula, mock_service, mock_user)
+        response = await get_applications_by_cedula(cedula, make_request(), mock_service, mock_user)
+        result = application_list.validate_json(response.body)
         
         # Assert
         assert result == expected_applications
@@ -382,7 +463,8 @@ class TestGetApplicationsByCedula:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act
-        result = await get_applications_by_cedula(cedula, mock_service, mock_user)
+        response = await get_applications_by_cedula(cedula, make_request(), mock_service, mock_user)
+        result = application_list.validate_json(response.body)
         
         # Assert
         assert result == []
@@ -400,12 +482,24 @@ class TestGetApplicationsByCedula:
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_applications_by_cedula(cedula, mock_service, mock_user)
+            await get_applications_by_cedula(cedula, make_request(), mock_service, mock_user)
         
         assert exc_info.value.status_code == 400
         # Check for validation error message (Pydantic format)
         assert "cedula" in str(exc_info.value.detail).lower() or "string" in str(exc_info.value.detail).lower()
     
+    @pytest.mark.asyncio
+    async def test_get_applications_by_cedula_non_numeric(self):
+        """Test cedulas without enough digits are rejected before the service"""
+        mock_service = AsyncMock()
+        mock_user = User(id="user123", email="user@example.com", role="admin")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await get_applications_by_cedula("abcdefghij", make_request(), mock_service, mock_user)
+        
+        assert exc_info.value.status_code == 400
+        mock_service.list_client_applications.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_applications_by_cedula_internal_error(self):
         """Test applications by cedula with internal error"""
@@ -417,11 +511,10 @@ class TestGetApplicationsByCedula:
         mock_user = User(id="user123", email="user@example.com", role="admin")
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
-            await get_applications_by_cedula(cedula, mock_service, mock_user)
+        with pytest.raises(Exception, match="Database error") as exc_info:
+            await get_applications_by_cedula(cedula, make_request(), mock_service, mock_user)
         
-        assert exc_info.value.status_code == 500
-        assert "Error getting applications by cedula" in str(exc_info.value.detail)
+        assert not isinstance(exc_info.value, HTTPException)
 
 
 class TestUpdateApplication:
@@ -534,6 +627,48 @@ class TestDeleteApplication:
         assert True
 
 
+class TestLoanApplicationErrorHandler:
+    """Test LoanApplicationError is answered by the app-level handler"""
+    
+    @pytest.fixture
+    def mock_service(self):
+        mock_service = AsyncMock()
+        app.dependency_overrides[get_loan_application_service] = lambda: mock_service
+        app.dependency_overrides[get_current_user] = lambda: None
+        yield mock_service
+        app.dependency_overrides.clear()
+    
+    def test_update_not_found_returns_404(self, mock_service):
+        """Test a not-found error from the service becomes a 404 JSON response"""
+        mock_service.update_application.side_effect = LoanApplicationError(404, "Solicitud con ID 9 no encontrada")
+        
+        response = TestClient(app).put("/api/v1/loan_applications/9", json={"name": "Nuevo"})
+        
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Solicitud con ID 9 no encontrada"}
+    
+    def test_create_invalid_data_returns_400(self, mock_service):
+        """Test a validation error from the service becomes a 400 JSON response"""
+        mock_service.create_application.side_effect = LoanApplicationError(400, "Los datos de la solicitud no son válidos")
+        
+        response = TestClient(app).post("/api/v1/loan_applications/", json={
+            "name": "Juan", "cedula": "12345678", "telefono": "3001234567", "fecha_nacimiento": "1990-01-01"
+        })
+        
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Los datos de la solicitud no son válidos"}
+    
+    def test_unexpected_error_returns_500(self, mock_service):
+        """Test unexpected errors fall through to the default 500 handler"""
+        mock_service.update_application.side_effect = Exception("connection refused to db-host")
+        
+        response = TestClient(app, raise_server_exceptions=False).put(
+            "/api/v1/loan_applications/9", json={"name": "Nuevo"}
+        )
+        
+        assert response.status_code == 500
+
+
 class TestLoanApplicationWorkflows:
     """Test complete loan application workflows"""
     
@@ -592,7 +727,8 @@ class TestLoanApplicationWorkflows:
         assert create_result.name == "Juan Pérez García"
         
         # Step 2: Get
-        get_result = await get_loan_application(1, mock_service, mock_user)
+        get_response = await get_loan_application(1, make_request(), mock_service, mock_user)
+        get_result = LoanApplicationResponse.model_validate_json(get_response.body)
         assert get_result.id == 1
         
         # Step 3: Update
@@ -664,7 +800,8 @@ class TestLoanApplicationWorkflows:
         mock_service.list_client_applications.return_value = mock_list_response
         
         # Act
-        result = await get_applications_by_cedula(cedula, mock_service, mock_user)
+        response = await get_applications_by_cedula(cedula, make_request(), mock_service, mock_user)
+        result = application_list.validate_json(response.body)
         
         # Assert
         assert len(result) == 3
@@ -787,4 +924,51 @@ class TestLoanApplicationValidationScenarios:
         
         # Assert
         assert result.fecha_nacimiento == date(today.year - 18, today.month, today.day)
-        mock_service.update_application.assert_called_once_with(application_id, request)
\ No newline at end of file
+        mock_service.update_application.assert_called_once_with(application_id, request)
+
+class TestResponseCompression:
+    """Test large JSON responses are gzip-compressed"""
+    
+    @pytest.fixture
+    def mock_service(self):
+        mock_service = AsyncMock()
+        app.dependency_overrides[get_loan_application_service] = lambda: mock_service
+        app.dependency_overrides[get_current_user] = lambda: None
+        yield mock_service
+        app.dependency_overrides.clear()
+    
+    def _list_result(self, count):
+        applications = [
+            LoanApplicationResponse(
+                id=i,
+                name="Juan Pérez",
+                cedula="12345678",
+                convenio="EMPRESA_ABC",
+                telefono="3001234567",
+                fecha_nacimiento=date(1990, 1, 1),
+                created_at=datetime(2024, 1, 15, 10, 30)
+            )
+            for i in range(count)
+        ]
+        return LoanApplicationListResponse(
+            applications=applications, total=count, page=1, page_size=1000, total_pages=1
+        )
+    
+    def test_large_list_is_gzipped(self, mock_service):
+        """Test a list over the size threshold comes back gzip-encoded"""
+        mock_service.list_all_applications.return_value = self._list_result(50)
+        
+        response = TestClient(app).get("/api/v1/loan_applications/", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(application_list.validate_json(response.content)) == 50
+    
+    def test_small_response_is_not_compressed(self, mock_service):
+        """Test responses under the threshold are sent as-is"""
+        mock_service.list_all_applications.return_value = self._list_result(1)
+        
+        response = TestClient(app).get("/api/v1/loan_applications/", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,103 @@
+"""
+Unit tests for SQLAlchemy model configuration
+"""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.infrastructure.outbound.database.connection import Base
+from src.infrastructure.outbound.database import models  # noqa: F401 - registers models
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+class TestRelationshipLoading:
+    """Guard against hidden N+1 lazy loads"""
+    
+    @pytest.mark.parametrize("mapper", list(Base.registry.mappers), ids=lambda m: m.class_.__name__)
+    def test_relationships_raise_on_lazy_load(self, mapper):
+        """Every relationship must be loaded explicitly (selectinload/joinedload)"""
+        for relationship in mapper.relationships:
+            assert relationship.lazy == "raise", (
+                f"{mapper.class_.__name__}.{relationship.key} uses lazy='{relationship.lazy}'"
+            )
+    
+    def test_chunks_are_deleted_by_database_cascade(self):
+        """Deleting a document must not load and delete chunks one by one"""
+        chunks = inspect(models.ContextDocumentModel).relationships["chunks"]
+        assert chunks.passive_deletes is True
+
+
+class TestIndexes:
+    """Indexes that back hot queries"""
+    
+    def test_client_name_has_trigram_index(self):
+        """ILIKE '%name%' search on clients needs a pg_trgm GIN index"""
+        indexes = {index.name: index for index in models.ClientModel.__table__.indexes}
+        index = indexes["client_nombre_completo_trgm_idx"]
+        
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert index.dialect_options["postgresql"]["ops"] == {"nombre_completo": "gin_trgm_ops"}
+    
+    def test_client_cedula_has_trigram_index(self):
+        """ILIKE '%cedula%' in the combined client search needs a pg_trgm GIN index too"""
+        indexes = {index.name: index for index in models.ClientModel.__table__.indexes}
+        index = indexes["client_cedula_trgm_idx"]
+        
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert index.dialect_options["postgresql"]["ops"] == {"cedula": "gin_trgm_ops"}
+    
+    def test_loan_application_name_has_trigram_index(self):
+        """ILIKE '%name%' search on loan applications needs a pg_trgm GIN index"""
+        indexes = {index.name: index for index in models.ApplicationModel.__table__.indexes}
+        index = indexes["loan_application_name_trgm_idx"]
+        
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert index.dialect_options["postgresql"]["ops"] == {"name": "gin_trgm_ops"}
+    
+    def test_loan_application_cedula_has_composite_index(self):
+        """Lookups by cedula ordered by created_at need a (cedula, created_at DESC, id DESC) index"""
+        indexes = {index.name: index for index in models.ApplicationModel.__table__.indexes}
+        index = indexes["loan_application_cedula_created_idx"]
+        
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert "(cedula, created_at DESC, id DESC)" in ddl
+    
+    def test_chunk_has_hnsw_and_fulltext_indexes(self):
+        """Vector search needs HNSW on embedding; full-text needs GIN on the exact tsvector expression"""
+        indexes = {index.name: index for index in models.ChunkModel.__table__.indexes}
+        
+        hnsw = str(CreateIndex(indexes["chunk_embedding_hnsw_idx"]).compile(dialect=postgresql.dialect()))
+        assert "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)" in hnsw
+        
+        hnsw = str(CreateIndex(indexes["chunk_embedding_halfvec_hnsw_idx"]).compile(dialect=postgresql.dialect()))
+        assert (
+            "USING hnsw ((CAST(embedding AS halfvec(1536))) halfvec_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        ) in hnsw
+        
+        tsv = str(CreateIndex(indexes["chunk_content_tsv_idx"]).compile(dialect=postgresql.dialect()))
+        assert "USING gin (to_tsvector('spanish', content))" in tsv
+
+
+class TestMigrations:
+    """init_db is not run on deploy, so every declared index must be shipped as SQL"""
+    
+    @pytest.fixture(scope="class")
+    def migrations_sql(self):
+        return "\n".join(path.read_text() for path in sorted(MIGRATIONS_DIR.glob("*.sql")))
+    
+    @pytest.mark.parametrize(
+        "model",
+        [models.ClientModel, models.ApplicationModel, models.ChunkModel],
+        ids=lambda m: m.__name__
+    )
+    def test_declared_indexes_have_migrations(self, model, migrations_sql):
+        """Each named index in __table_args__ is created by a migration file"""
+        for index in model.__table__.indexes:
+            if index.name.startswith("ix_"):
+                continue  # Column(index=True) indexes come with the original schema
+            assert f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index.name}\n" in migrations_sql
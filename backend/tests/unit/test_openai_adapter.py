@@ -0,0 +1,130 @@
+"""
+Unit tests for OpenAIAdapter
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.outbound import openai_adapter
+from src.infrastructure.outbound.openai_adapter import OpenAIAdapter
+
+
+def make_adapter(create):
+    with patch.object(openai_adapter, "OPENAI_API_KEY", "test-key"):
+        adapter = OpenAIAdapter()
+    adapter.client = MagicMock()
+    adapter.client.embeddings.create = create
+    return adapter
+
+
+class TestGenerateEmbeddingsBatch:
+    """Test batched embedding generation"""
+
+    @pytest.mark.asyncio
+    async def test_splits_into_batches_and_keeps_order(self):
+        """Test texts are sent in EMBEDDING_BATCH_SIZE requests and results keep input order"""
+        calls = []
+
+        async def create(model, input):
+            calls.append(list(input))
+            return MagicMock(data=[MagicMock(embedding=[float(text)]) for text in input])
+
+        adapter = make_adapter(create)
+        texts = [str(i) for i in range(5)]
+
+        with patch.object(openai_adapter, "EMBEDDING_BATCH_SIZE", 2):
+            result = await adapter.generate_embeddings_batch(texts)
+
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert calls == [["0", "1"], ["2", "3"], ["4"]]
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests(self):
+        """Test no more than EMBEDDING_MAX_CONCURRENCY requests run at once"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(model, input):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MagicMock(data=[MagicMock(embedding=[0.0]) for _ in input])
+
+        adapter = make_adapter(create)
+
+        with patch.object(openai_adapter, "EMBEDDING_BATCH_SIZE", 1), \
+                patch.object(openai_adapter, "EMBEDDING_MAX_CONCURRENCY", 2):
+            result = await adapter.generate_embeddings_batch(["a"] * 6)
+
+        assert len(result) == 6
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_api(self):
+        """Test empty input returns [] without calling OpenAI"""
+        async def create(model, input):
+            raise AssertionError("should not be called")
+
+        adapter = make_adapter(create)
+
+        assert await adapter.generate_embeddings_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_error_is_wrapped(self):
+        """Test API errors are re-raised with context"""
+        async def create(model, input):
+            raise RuntimeError("rate limited")
+
+        adapter = make_adapter(create)
+
+        with pytest.raises(Exception) as exc_info:
+            await adapter.generate_embeddings_batch(["a"])
+
+        assert "Error generating batch embeddings" in str(exc_info.value)
+
+
+class TestStreamResponseWithHistory:
+    """Test streamed chat completions"""
+
+    @pytest.mark.asyncio
+    async def test_yields_content_deltas(self):
+        """Test only non-empty deltas are yielded and stream=True is requested"""
+        def chunk(content):
+            return MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+        async def stream():
+            for item in [chunk("Hola"), chunk(None), MagicMock(choices=[]), chunk(" mundo")]:
+                yield item
+
+        captured = {}
+
+        async def create(**kwargs):
+            captured.update(kwargs)
+            return stream()
+
+        adapter = make_adapter(None)
+        adapter.client.chat.completions.create = create
+
+        deltas = [delta async for delta in adapter.stream_response_with_history(
+            "pregunta", "contexto", [{"role": "user", "content": "Hola"}]
+        )]
+
+        assert deltas == ["Hola", " mundo"]
+        assert captured["stream"] is True
+        assert [message["role"] for message in captured["messages"]] == ["system", "user", "user"]
+
+    @pytest.mark.asyncio
+    async def test_error_is_wrapped(self):
+        """Test API errors are wrapped with context"""
+        async def create(**kwargs):
+            raise RuntimeError("rate limited")
+
+        adapter = make_adapter(None)
+        adapter.client.chat.completions.create = create
+
+        with pytest.raises(Exception) as exc_info:
+            [delta async for delta in adapter.stream_response_with_history("pregunta", "contexto")]
+
+        assert "Error generating response" in str(exc_info.value)
@@ -0,0 +1,166 @@
+"""
+Unit tests for RAGDocumentService
+"""
+import pytest
+from datetime import datetime
+from io import BytesIO
+from unittest.mock import AsyncMock, patch
+from fastapi import UploadFile
+
+from src.application.services.rag_document_service import RAGDocumentService
+from src.application.services.storage_cleanup import wait_for_storage_deletions
+from src.domain.entities.context_document import ContextDocument, ProcessingStatus
+
+
+@pytest.fixture
+def document_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def storage_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def rag_service(document_repository, storage_service):
+    return RAGDocumentService(
+        document_repository=document_repository,
+        chunk_repository=AsyncMock(),
+        embedding_port=AsyncMock(),
+        storage_service=storage_service
+    )
+
+
+def make_upload(content=b"%PDF-1.4 contenido", filename="manual.pdf"):
+    return UploadFile(file=BytesIO(content), filename=filename, size=len(content))
+
+
+async def collect_stream(chunks, *args, **kwargs):
+    """upload_stream stand-in that drains the chunk iterator"""
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestListDocuments:
+    """Test list_documents"""
+
+    @pytest.mark.asyncio
+    async def test_list_documents_counts_chunks_in_one_query(self, rag_service, document_repository):
+        document_repository.get_all.return_value = [
+            ContextDocument(
+                id=1,
+                filename="manual.pdf",
+                storage_url="rag/manual.pdf",
+                processing_status=ProcessingStatus.COMPLETED,
+                created_at=datetime(2024, 1, 1)
+            ),
+            ContextDocument(
+                id=2,
+                filename="faq.docx",
+                storage_url="rag/faq.docx",
+                processing_status=ProcessingStatus.PENDING,
+                created_at=datetime(2024, 2, 1)
+            )
+        ]
+        document_repository.count_chunks_by_document.return_value = {1: 12}
+
+        result = await rag_service.list_documents()
+
+        assert [doc["chunks_count"] for doc in result] == [12, 0]
+        assert result[0]["processing_status"] == "completed"
+        assert result[0]["created_at"] == datetime(2024, 1, 1)
+        document_repository.count_chunks_by_document.assert_called_once()
+        document_repository.count_chunks.assert_not_called()
+
+
+class TestUploadAndProcess:
+    """Test upload_and_process"""
+
+    @pytest.mark.asyncio
+    async def test_upload_streams_to_storage_and_processes_full_content(
+        self, rag_service, document_repository, storage_service
+    ):
+        content = b"%PDF-1.4 " + b"x" * (200 * 1024)
+        storage_service.upload_stream.side_effect = collect_stream
+        document_repository.create.return_value = ContextDocument(
+            id=7, filename="manual.pdf", storage_url="rag_documents/manual.pdf"
+        )
+
+        with patch.object(rag_service, "_process_document", AsyncMock()) as process:
+            result = await rag_service.upload_and_process(make_upload(content))
+
+        assert result["document_id"] == 7
+        storage_service.upload_file.assert_not_called()
+        assert storage_service.upload_stream.call_args.kwargs["content_length"] == len(content)
+        process.assert_called_once_with(7, content, "manual.pdf")
+
+    @pytest.mark.asyncio
+    async def test_upload_empty_file(self, rag_service, storage_service):
+        with pytest.raises(ValueError, match="File is empty"):
+            await rag_service.upload_and_process(make_upload(b""))
+
+        storage_service.upload_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upload_storage_error_removes_created_row(
+        self, rag_service, document_repository, storage_service
+    ):
+        storage_service.upload_stream.side_effect = Exception("Storage down")
+        document_repository.create.return_value = ContextDocument(
+            id=7, filename="manual.pdf", storage_url="rag_documents/manual.pdf"
+        )
+
+        with pytest.raises(Exception, match="Error uploading file to storage"):
+            await rag_service.upload_and_process(make_upload())
+
+        document_repository.delete.assert_called_once_with(7)
+
+    @pytest.mark.asyncio
+    async def test_upload_create_error_removes_uploaded_file(
+        self, rag_service, document_repository, storage_service
+    ):
+        storage_service.upload_stream.side_effect = collect_stream
+        document_repository.create.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Error creating document record"):
+            await rag_service.upload_and_process(make_upload())
+
+        storage_service.delete_file.assert_called_once()
+
+
+class TestProcessDocument:
+    """Test process_document"""
+
+    @pytest.mark.asyncio
+    async def test_process_document_failure_marks_failed(self, rag_service, document_repository):
+        with patch.object(rag_service, "_process_document", AsyncMock(side_effect=ValueError("No text"))):
+            with pytest.raises(Exception, match="Error processing document"):
+                await rag_service.process_document(7, b"%PDF", "manual.pdf")
+
+        document_repository.update_status.assert_called_once_with(7, ProcessingStatus.FAILED)
+
+
+
+class TestDeleteDocument:
+    """Test delete_document"""
+
+    @pytest.mark.asyncio
+    async def test_delete_document_single_statement(self, rag_service, document_repository, storage_service):
+        document_repository.delete_returning.return_value = "rag_documents/manual.pdf"
+
+        result = await rag_service.delete_document(7)
+        await wait_for_storage_deletions()
+
+        assert result["status"] == "success"
+        document_repository.delete_returning.assert_called_once_with(7)
+        document_repository.get_by_id.assert_not_called()
+        storage_service.delete_file.assert_called_once_with("rag_documents/manual.pdf")
+
+    @pytest.mark.asyncio
+    async def test_delete_document_not_found(self, rag_service, document_repository, storage_service):
+        document_repository.delete_returning.return_value = None
+
+        with pytest.raises(ValueError, match="not found"):
+            await rag_service.delete_document(99)
+
+        storage_service.delete_file.assert_not_called()
@@ -0,0 +1,141 @@
+"""
+Unit tests for RAG Documents API routes
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import BackgroundTasks, HTTPException
+from pydantic import TypeAdapter
+
+from src.application.dtos.rag_document_dtos import ContextDocumentResponse, ProcessingStatusDto
+from src.domain.entities.context_document import ContextDocument
+from src.infrastructure.inbound.api.routes.rag_documents import (
+    list_documents,
+    process_document_in_background,
+    upload_document
+)
+
+
+class TestUploadDocument:
+    """Test upload_document endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_upload_document_accepts_and_schedules_processing(self):
+        """Test the upload answers right away and leaves processing to a background task"""
+        mock_service = AsyncMock()
+        mock_service.upload_document.return_value = (
+            ContextDocument(id=7, filename="manual.pdf", storage_url="rag_documents/manual.pdf"),
+            b"%PDF"
+        )
+        embedding_port = MagicMock()
+        storage_service = MagicMock()
+        background_tasks = BackgroundTasks()
+
+        result = await upload_document(
+            background_tasks, MagicMock(), mock_service, embedding_port, storage_service
+        )
+
+        assert result.status == "accepted"
+        assert result.document_id == 7
+        assert result.processing_status == ProcessingStatusDto.PENDING
+        mock_service.upload_and_process.assert_not_called()
+        task = background_tasks.tasks[0]
+        assert task.func is process_document_in_background
+        assert task.args == (7, b"%PDF", "manual.pdf", embedding_port, storage_service)
+
+    @pytest.mark.asyncio
+    async def test_upload_document_validation_error(self):
+        """Test unsupported files are rejected with 400"""
+        mock_service = AsyncMock()
+        mock_service.upload_document.side_effect = ValueError("Unsupported file format")
+        background_tasks = BackgroundTasks()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_document(background_tasks, MagicMock(), mock_service, MagicMock(), MagicMock())
+
+        assert exc_info.value.status_code == 400
+        assert background_tasks.tasks == []
+
+
+class TestProcessDocumentInBackground:
+    """Test the background processing task"""
+
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        with patch(
+            "src.infrastructure.inbound.api.routes.rag_documents.AsyncSessionLocal", session_factory
+        ):
+            yield session
+
+    @pytest.mark.asyncio
+    async def test_processes_with_its_own_session(self, mock_session):
+        """Test processing runs on a fresh session and commits it"""
+        with patch(
+            "src.infrastructure.inbound.api.routes.rag_documents.RAGDocumentService"
+        ) as service_class:
+            service_class.return_value.process_document = AsyncMock()
+
+            await process_document_in_background(7, b"%PDF", "manual.pdf", MagicMock(), MagicMock())
+
+        service_class.return_value.process_document.assert_called_once_with(7, b"%PDF", "manual.pdf")
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_processing_error_is_not_raised(self, mock_session):
+        """Test a failed processing is rolled back and swallowed (status is already FAILED)"""
+        with patch(
+            "src.infrastructure.inbound.api.routes.rag_documents.RAGDocumentService"
+        ) as service_class:
+            service_class.return_value.process_document = AsyncMock(side_effect=Exception("OpenAI down"))
+
+            await process_document_in_background(7, b"%PDF", "manual.pdf", MagicMock(), MagicMock())
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
+
+
+class TestListDocuments:
+    """Test list_documents endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_list_documents_success(self):
+        """Test documents are serialized straight from the service rows"""
+        mock_service = AsyncMock()
+        mock_service.list_documents.return_value = [
+            {
+                "id": 1,
+                "filename": "manual.pdf",
+                "storage_url": "rag/manual.pdf",
+                "processing_status": "completed",
+                "created_at": datetime(2024, 1, 1),
+                "chunks_count": 12
+            }
+        ]
+
+        result = await list_documents(mock_service)
+
+        documents = TypeAdapter(list[ContextDocumentResponse]).validate_json(result.body)
+        assert documents == [
+            ContextDocumentResponse(
+                id=1,
+                filename="manual.pdf",
+                storage_url="rag/manual.pdf",
+                processing_status=ProcessingStatusDto.COMPLETED,
+                created_at=datetime(2024, 1, 1),
+                chunks_count=12
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_documents_internal_error(self):
+        """Test service errors become 500"""
+        mock_service = AsyncMock()
+        mock_service.list_documents.side_effect = Exception("Database error")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await list_documents(mock_service)
+
+        assert exc_info.value.status_code == 500
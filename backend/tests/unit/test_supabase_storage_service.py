@@ -2,6 +2,8 @@
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
+import httpx
+
 
 class TestSupabaseStorageService:
     """Tests for SupabaseStorageService"""
@@ -79,63 +81,62 @@ class TestBuildStoragePath:
         assert result == "client_files/456/file.jpg"
 
 
-class TestUploadFile:
-    """Tests for upload_file method"""
+class TestUploadStream:
+    """Tests for upload_stream method"""
 
     @pytest.fixture
     def service(self):
-        with patch('src.infrastructure.outbound.supabase_storage_service.create_client') as mock_create:
-            mock_client = MagicMock()
-            mock_create.return_value = mock_client
+        with patch('src.infrastructure.outbound.supabase_storage_service.create_client'):
             from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
-            svc = SupabaseStorageService()
-            return svc, mock_client
+            return SupabaseStorageService()
 
-    async def test_upload_file_success(self, service):
-        """Test successful file upload"""
-        svc, mock_client = service
-        mock_storage = MagicMock()
-        mock_bucket = MagicMock()
-        mock_response = MagicMock()
-        mock_response.error = None
-        mock_bucket.upload.return_value = mock_response
-        mock_storage.from_.return_value = mock_bucket
-        mock_client.storage = mock_storage
+    @staticmethod
+    async def _chunks():
+        yield b"file "
+        yield b"content"
 
-        result = await svc.upload_file(b"file content", "path/file.pdf")
+    def _use_transport(self, svc, handler):
+        svc._http_client = httpx.AsyncClient(
+            base_url="https://x.supabase.co/storage/v1",
+            transport=httpx.MockTransport(handler)
+        )
 
-        assert result is True
-        mock_bucket.upload.assert_called_once()
+    async def test_upload_stream_success(self, service):
+        """Test streamed upload sends every chunk to the bucket path"""
+        captured = {}
 
-    async def test_upload_file_with_error_response(self, service):
-        """Test upload with error in response"""
-        svc, mock_client = service
-        mock_storage = MagicMock()
-        mock_bucket = MagicMock()
-        mock_response = MagicMock()
-        mock_response.error = "Upload failed"
-        mock_bucket.upload.return_value = mock_response
-        mock_storage.from_.return_value = mock_bucket
-        mock_client.storage = mock_storage
+        async def handler(request):
+            captured["url"] = str(request.url)
+            captured["headers"] = request.headers
+            captured["body"] = await request.aread()
+            return httpx.Response(200, json={"Key": "krediplus_docs/path/file.pdf"})
 
-        with pytest.raises(Exception) as exc_info:
-            await svc.upload_file(b"file content", "path/file.pdf")
+        self._use_transport(service, handler)
 
-        assert "Supabase Storage error" in str(exc_info.value)
+        result = await service.upload_stream(
+            self._chunks(), "path/file.pdf", content_type="application/pdf", content_length=12
+        )
 
-    async def test_upload_file_exception(self, service):
-        """Test upload with exception"""
-        svc, mock_client = service
-        mock_storage = MagicMock()
-        mock_bucket = MagicMock()
-        mock_bucket.upload.side_effect = Exception("Network error")
-        mock_storage.from_.return_value = mock_bucket
-        mock_client.storage = mock_storage
+        assert result is True
+        assert captured["url"].endswith("/object/krediplus_docs/path/file.pdf")
+        assert captured["headers"]["content-type"] == "application/pdf"
+        assert captured["headers"]["content-length"] == "12"
+        assert captured["body"] == b"file content"
+        await service.aclose()
+
+    async def test_upload_stream_error_response(self, service):
+        """Test streamed upload with an error status"""
+        async def handler(request):
+            await request.aread()
+            return httpx.Response(400, json={"error": "Duplicate"})
+
+        self._use_transport(service, handler)
 
         with pytest.raises(Exception) as exc_info:
-            await svc.upload_file(b"file content", "path/file.pdf")
+            await service.upload_stream(self._chunks(), "path/file.pdf")
 
-        assert "Error uploading file" in str(exc_info.value)
+        assert "Supabase Storage error" in str(exc_info.value)
+        await service.aclose()
 
 
 class TestDeleteFile:
@@ -291,3 +292,53 @@ class TestCreateSignedUrl:
             svc.create_signed_url("path/file.pdf")
 
         assert "Error creating signed URL" in str(exc_info.value)
+
+
+class TestCreateSignedUrls:
+    """Tests for create_signed_urls method"""
+
+    @pytest.fixture
+    def service(self):
+        with patch('src.infrastructure.outbound.supabase_storage_service.create_client') as mock_create:
+            mock_client = MagicMock()
+            mock_create.return_value = mock_client
+            from src.infrastructure.outbound.supabase_storage_service import SupabaseStorageService
+            svc = SupabaseStorageService()
+            mock_bucket = MagicMock()
+            mock_client.storage.from_.return_value = mock_bucket
+            return svc, mock_bucket
+
+    @pytest.mark.asyncio
+    async def test_create_signed_urls_single_request_in_path_order(self, service):
+        """Test all paths are signed in one call and returned in input order"""
+        svc, mock_bucket = service
+        mock_bucket.create_signed_urls.return_value = [
+            {"path": "b.pdf", "signedURL": "https://signed/b", "error": None},
+            {"path": "a.pdf", "signedURL": "https://signed/a", "error": None},
+        ]
+
+        result = await svc.create_signed_urls(["a.pdf", "b.pdf"], expires_in=600)
+
+        assert result == ["https://signed/a", "https://signed/b"]
+        mock_bucket.create_signed_urls.assert_called_once_with(["a.pdf", "b.pdf"], 600)
+
+    @pytest.mark.asyncio
+    async def test_create_signed_urls_empty(self, service):
+        """Test no request is made without paths"""
+        svc, mock_bucket = service
+
+        assert await svc.create_signed_urls([]) == []
+        mock_bucket.create_signed_urls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_signed_urls_item_error(self, service):
+        """Test a per-file error is raised"""
+        svc, mock_bucket = service
+        mock_bucket.create_signed_urls.return_value = [
+            {"path": "a.pdf", "signedURL": None, "error": "Either the object does not exist"}
+        ]
+
+        with pytest.raises(Exception) as exc_info:
+            await svc.create_signed_urls(["a.pdf"])
+
+        assert "Error creating signed URLs" in str(exc_info.value)
@@ -1,12 +1,24 @@
 import { useQuery } from '@tanstack/react-query'
-import { fetchRagDocuments, type RagDocument } from '../api/rag-documents'
+import { fetchRagDocuments, type RagDocument, type RagProcessingStatus } from '../api/rag-documents'
 
 export const ragDocumentsQueryKey = ['ragDocuments'] as const
 
+// Uploads are processed in the background; poll until none is still in progress
+const PROCESSING_POLL_INTERVAL_MS = 3_000
+const IN_PROGRESS_STATUSES: RagProcessingStatus[] = ['pending', 'processing', 'queued']
+
+function hasDocumentsInProgress(documents: RagDocument[] | undefined) {
+  return (documents ?? []).some((document) =>
+    IN_PROGRESS_STATUSES.includes(document.processingStatus),
+  )
+}
+
 export function useRagDocuments() {
   return useQuery<RagDocument[]>({
     queryKey: ragDocumentsQueryKey,
     queryFn: fetchRagDocuments,
     staleTime: 15_000,
+    refetchInterval: (query) =>
+      hasDocumentsInProgress(query.state.data) ? PROCESSING_POLL_INTERVAL_MS : false,
   })
 }
@@ -27,6 +27,10 @@ function resolveCollectionUrl() {
   return getBaseResourceUrl()
 }
 
+function resolveExportUrl() {
+  return `${getBaseResourceUrl()}export`
+}
+
 function resolveDetailUrl(clientId: number | string) {
   return `${getBaseResourceUrl()}${clientId}/`
 }
@@ -56,20 +60,42 @@ async function parseError(response: Response): Promise<never> {
   throw new Error(fallback || 'No fue posible cargar los clientes')
 }
 
+// The admin table needs every client: read the NDJSON export, which the
+// backend serves from a single cursor (one consistent snapshot, no paging)
 export async function fetchClients(): Promise<ClientRecord[]> {
-  const response = await fetchWithAuth(resolveCollectionUrl(), {
+  const response = await fetchWithAuth(resolveExportUrl(), {
     method: 'GET',
     headers: {
-      Accept: 'application/json',
+      Accept: 'application/x-ndjson',
     },
   })
 
   if (!response.ok) {
     return parseError(response)
   }
+  if (!response.body) {
+    throw new Error('No fue posible cargar los clientes')
+  }
 
-  const data: ClientApiResponse[] = await response.json()
-  return data.map(mapClientResponse)
+  const clients: ClientRecord[] = []
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffered = ''
+  for (;;) {
+    const { done, value } = await reader.read()
+    if (value) {
+      buffered += value
+    }
+    const lines = buffered.split('\n')
+    buffered = done ? '' : (lines.pop() ?? '')
+    for (const line of lines) {
+      if (line.trim()) {
+        clients.push(mapClientResponse(JSON.parse(line) as ClientApiResponse))
+      }
+    }
+    if (done) {
+      return clients
+    }
+  }
 }
 
 export type CreateClientPayload = {